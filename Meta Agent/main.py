@@ -15,9 +15,17 @@ VERBOSE_MODE = "--verbose" in sys.argv
 # Now import modules
 from dotenv import load_dotenv
 from src.agents.orchestrator import OrchestratorAgent
-from src.core.utils import set_quiet_mode
+from src.core.utils import set_quiet_mode, json_dumps, json_dumps_pretty
 from src.handlers.operations import process_action, set_operations_quiet_mode
 
+# Optional uvloop acceleration - a faster event loop drop-in for the
+# fan-out-heavy workflows. Falls back to the stdlib loop when absent.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Set quiet mode immediately after imports
 if not VERBOSE_MODE:
     set_quiet_mode(True)
@@ -130,14 +138,15 @@ async def main():
         
         result = await process_action(orchestrator, ad_account_id, action_payload)
         
-        # Output result
+        # Output result (orjson-backed when available - the result can be
+        # a full insight report)
         if QUIET_MODE:
-            print(json.dumps(result))
+            print(json_dumps(result))
         else:
             print(f"\n{'='*70}")
             print("RESULT")
             print(f"{'='*70}")
-            print(json.dumps(result, indent=2))
+            print(json_dumps_pretty(result).decode())
         
     finally:
         await orchestrator.close()
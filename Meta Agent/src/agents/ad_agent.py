@@ -3,7 +3,7 @@ Ad Creation Agent
 Responsible for creating and managing ad creatives and ads.
 """
 
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any
 
 from ..core.models import Creative, Ad
 from ..core.exceptions import CreativeError, AdCreationError
@@ -58,10 +58,14 @@ class AdCreationAgent:
             raise AdCreationError(str(e)) from e
 
     async def update_ad(self, ad_id: str, update_fields: Dict[str, Any]) -> Dict[str, Any]:
-        """Update an existing ad by ID"""
+        """Update an existing ad by ID, returning the post-update state"""
         endpoint = f"/{ad_id}"
+        # Requesting fields on the write folds the confirm-read into the
+        # same round trip; copy so the caller's dict is never mutated
+        data = dict(update_fields)
+        data.setdefault("fields", "id,name,status,effective_status")
         try:
-            response = await self.api.post(endpoint, json_data=update_fields)
+            response = await self.api.post(endpoint, json_data=data)
             return response
         except Exception as e:
             raise AdCreationError(str(e)) from e
@@ -87,6 +91,20 @@ class AdCreationAgent:
         Returns:
             List of ad dictionaries
         """
+        return [ad async for ad in self.list_ads_stream(ad_account_id, adset_id, limit)]
+
+    async def list_ads_stream(self, ad_account_id: str, adset_id: str = None,
+                              limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """Yield ads one at a time instead of materializing the listing
+
+        Rows stream through the client's cursor pagination, which
+        prefetches the next page while the caller processes the current
+        one - the first ad arrives after one round trip regardless of
+        how many pages follow, and peak memory is one page rather than
+        the whole listing. Streaming consumers (SSE/WebSocket bridges)
+        can forward rows as they land; list_ads collects the same
+        iterator into a list for the dict-based action protocol.
+        """
         if adset_id:
             endpoint = f"/{adset_id}/ads"
         else:
@@ -97,7 +115,7 @@ class AdCreationAgent:
             "limit": limit
         }
         try:
-            response = await self.api.get(endpoint, params=params)
-            return response.get("data", [])
+            async for ad in self.api.get_paginated(endpoint, params=params, max_items=limit):
+                yield ad
         except Exception as e:
             raise AdCreationError(str(e)) from e
@@ -3,13 +3,89 @@ Asset Agent - Manages advertising assets (images, videos)
 Handles uploading, retrieving, validating, and caching assets
 """
 
+import asyncio
+import base64
+import hashlib
 import os
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from ..core.utils import log_debug
+from ..core.utils import log_debug, json_dumps
+
+# Read size for streaming file hashes - large enough to keep syscall count
+# low, small enough that a 2GB video never needs to be fully buffered.
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Images below this size are posted as a base64 form field instead of
+# multipart, skipping httpx's multipart encoder on the common path
+_SMALL_IMAGE_BYTES = 4 * 1024 * 1024
+
+# Videos at or above this size go through Graph's resumable upload
+# protocol (start/transfer/finish) with chunks sent concurrently,
+# instead of one blocking multipart POST of the whole file
+_CHUNKED_UPLOAD_THRESHOLD = 50 * 1024 * 1024
+
+# How many transfer chunks are on the wire at once by default
+_DEFAULT_CHUNK_CONCURRENCY = 4
+
+# Explicit multipart content types per supported format, so httpx does not
+# have to sniff via mimetypes on every upload and Meta never sees an
+# ambiguous type
+_IMAGE_CONTENT_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "bmp": "image/bmp",
+}
+
+_VIDEO_CONTENT_TYPES = {
+    "mp4": "video/mp4",
+    "mov": "video/quicktime",
+    "avi": "video/x-msvideo",
+    "flv": "video/x-flv",
+    "wmv": "video/x-ms-wmv",
+    "webm": "video/webm",
+}
+
+
+def _read_bytes(filepath: str) -> bytes:
+    """Read a file fully; run via asyncio.to_thread to keep the loop free"""
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
+def _read_range(filepath: str, start: int, length: int) -> bytes:
+    """Read one chunk of a file; run via asyncio.to_thread per chunk
+
+    Each chunk opens its own handle so concurrent reads never fight over
+    a shared file position, and memory holds at most the in-flight
+    chunks rather than the whole video.
+    """
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        return f.read(length)
+
+
+def _probe_and_hash(filepath: str) -> Tuple[str, int]:
+    """Stat and content-hash a file in a single streaming pass
+
+    Returns (sha256_hex, size_bytes). The file is read once in 1 MiB
+    chunks so the hash and the size validation share one pass over the
+    bytes instead of each reading the file separately.
+    """
+    if not os.path.exists(filepath):
+        raise AssetValidationError(f"File not found: {filepath}")
+
+    sha = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            sha.update(chunk)
+    return sha.hexdigest(), size
 
 
 class AssetType(str, Enum):
@@ -81,8 +157,13 @@ class AssetSpecs:
     }
 
     @classmethod
-    def validate_image(cls, filepath: str, width: Optional[int] = None, height: Optional[int] = None) -> Dict[str, Any]:
-        """Validate image file against specifications"""
+    def validate_image(cls, filepath: str, width: Optional[int] = None, height: Optional[int] = None,
+                       size_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """Validate image file against specifications
+
+        Pass size_bytes when the caller has already probed the file (see
+        _probe_and_hash) to avoid a redundant stat.
+        """
         specs = cls.IMAGE_SPECS
 
         if not os.path.exists(filepath):
@@ -92,7 +173,7 @@ class AssetSpecs:
         if ext not in specs["supported_formats"]:
             raise AssetValidationError(f"Unsupported image format: {ext}. Supported: {', '.join(specs['supported_formats'])}")
 
-        file_size = os.path.getsize(filepath)
+        file_size = size_bytes if size_bytes is not None else os.path.getsize(filepath)
         if file_size > specs["max_size_bytes"]:
             raise AssetValidationError(f"Image size ({file_size / 1024 / 1024:.2f}MB) exceeds maximum ({specs['max_size_mb']}MB)")
 
@@ -114,8 +195,13 @@ class AssetSpecs:
         }
 
     @classmethod
-    def validate_video(cls, filepath: str, duration: Optional[float] = None, width: Optional[int] = None, height: Optional[int] = None) -> Dict[str, Any]:
-        """Validate video file against specifications"""
+    def validate_video(cls, filepath: str, duration: Optional[float] = None, width: Optional[int] = None,
+                       height: Optional[int] = None, size_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """Validate video file against specifications
+
+        Pass size_bytes when the caller has already probed the file (see
+        _probe_and_hash) to avoid a redundant stat.
+        """
         specs = cls.VIDEO_SPECS
 
         if not os.path.exists(filepath):
@@ -125,7 +211,7 @@ class AssetSpecs:
         if ext not in specs["supported_formats"]:
             raise AssetValidationError(f"Unsupported video format: {ext}. Supported: {', '.join(specs['supported_formats'])}")
 
-        file_size = os.path.getsize(filepath)
+        file_size = size_bytes if size_bytes is not None else os.path.getsize(filepath)
         if file_size > specs["max_size_bytes"]:
             raise AssetValidationError(f"Video size ({file_size / 1024 / 1024:.2f}MB) exceeds maximum ({specs['max_size_mb']}MB)")
 
@@ -168,7 +254,7 @@ class AssetCache:
                 with open(self.cache_file, 'r') as f:
                     return json.load(f)
             except Exception as e:
-                log_debug(f"[AssetCache] Failed to load cache: {e}")
+                log_debug("[AssetCache] Failed to load cache: %s", e)
                 return {"images": {}, "videos": {}}
         return {"images": {}, "videos": {}}
 
@@ -178,7 +264,7 @@ class AssetCache:
             with open(self.cache_file, 'w') as f:
                 json.dump(self.cache, f, indent=2)
         except Exception as e:
-            log_debug(f"[AssetCache] Failed to save cache: {e}")
+            log_debug("[AssetCache] Failed to save cache: %s", e)
 
     def get_image(self, filepath: str) -> Optional[str]:
         """Get cached image hash"""
@@ -223,8 +309,26 @@ class AssetAgent:
         """
         self.api = api_client
         self.cache = AssetCache()
+        # In-flight uploads by filepath so concurrent uploads of the same
+        # file share one read+POST instead of duplicating both
+        self._inflight: Dict[str, "asyncio.Future"] = {}
         log_debug("[AssetAgent] Initialized with Asset Cache")
 
+    async def _single_flight(self, key: str, coro) -> Any:
+        """Run coro, letting concurrent callers with the same key await it"""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            log_debug("[AssetAgent] Joining in-flight upload: %s", key)
+            coro.close()
+            return await inflight
+
+        task = asyncio.ensure_future(coro)
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
     async def upload_image(self, ad_account_id: str, filepath: str, width: Optional[int] = None, height: Optional[int] = None) -> ImageAsset:
         """
         Upload image to ad account
@@ -238,48 +342,68 @@ class AssetAgent:
         Returns:
             ImageAsset with image_hash
         """
-        log_debug(f"\n[AssetAgent] Uploading image: {filepath}")
+        return await self._single_flight(
+            f"image:{filepath}",
+            self._upload_image(ad_account_id, filepath, width, height)
+        )
+
+    async def _upload_image(self, ad_account_id: str, filepath: str, width: Optional[int] = None, height: Optional[int] = None) -> ImageAsset:
+        """Do the actual image validation, read and POST"""
+        log_debug("\n[AssetAgent] Uploading image: %s", filepath)
+
+        filename = os.path.basename(filepath)
 
         try:
-            validation_result = AssetSpecs.validate_image(filepath, width, height)
+            # Hashing reads the whole file - run it off the event loop so
+            # concurrent uploads and insight fetches keep making progress
+            content_sha, file_size = await asyncio.to_thread(_probe_and_hash, filepath)
+            validation_result = AssetSpecs.validate_image(filepath, width, height, size_bytes=file_size)
             log_debug(f"[AssetAgent] Image validation passed: {validation_result['format'].upper()}, {validation_result['size_bytes'] / 1024:.2f}KB")
 
-            cached_hash = self.cache.get_image(filepath)
+            cached_hash = self.cache.get_image(filepath) or self.cache.get_image(content_sha)
             if cached_hash:
-                log_debug(f"[AssetAgent] Using cached image hash: {cached_hash}")
+                log_debug("[AssetAgent] Using cached image hash: %s", cached_hash)
                 return ImageAsset(
                     image_hash=cached_hash,
-                    filename=os.path.basename(filepath),
+                    filename=filename,
                     size_bytes=validation_result['size_bytes'],
                     width=width,
                     height=height
                 )
 
-            with open(filepath, 'rb') as f:
-                image_data = f.read()
+            image_data = await asyncio.to_thread(_read_bytes, filepath)
 
             endpoint = f"/act_{ad_account_id}/adimages"
-
-            files = {"file": (os.path.basename(filepath), image_data)}
             params = {"access_token": self.api.access_token}
 
-            log_debug(f"[AssetAgent] POST {endpoint}")
-
-            response = await self.api.session.post(endpoint, files=files, params=params)
+            log_debug("[AssetAgent] POST %s", endpoint)
+
+            if file_size < _SMALL_IMAGE_BYTES:
+                # The adimages endpoint accepts base64 bytes directly; no
+                # multipart framing or encoder buffering for small images
+                data = {"bytes": base64.b64encode(image_data).decode("ascii")}
+                response = await self.api.session.post(endpoint, data=data, params=params)
+            else:
+                content_type = _IMAGE_CONTENT_TYPES.get(validation_result['format'], "application/octet-stream")
+                files = {"file": (filename, image_data, content_type)}
+                response = await self.api.session.post(endpoint, files=files, params=params)
             result = self.api._handle_response(response)
 
             image_hash = None
-            filename = os.path.basename(filepath)
-
-            if "images" in result and filename in result["images"]:
-                image_hash = result["images"][filename].get("hash")
+            images = result.get("images")
+            if images:
+                # Multipart uploads key the entry by filename, base64
+                # uploads by "bytes" - fall back to the first entry
+                entry = images.get(filename) or next(iter(images.values()))
+                image_hash = entry.get("hash")
 
             if not image_hash:
                 raise AssetUploadError(f"No image_hash returned from API. Response: {result}")
 
             self.cache.set_image(filepath, image_hash)
+            self.cache.set_image(content_sha, image_hash)
 
-            log_debug(f"[AssetAgent] Image uploaded successfully: {image_hash}")
+            log_debug("[AssetAgent] Image uploaded successfully: %s", image_hash)
 
             return ImageAsset(
                 image_hash=image_hash,
@@ -290,15 +414,16 @@ class AssetAgent:
             )
 
         except AssetValidationError as e:
-            log_debug(f"[AssetAgent] Image validation failed: {e}")
+            log_debug("[AssetAgent] Image validation failed: %s", e)
             raise
         except Exception as e:
-            log_debug(f"[AssetAgent] Image upload failed: {e}")
+            log_debug("[AssetAgent] Image upload failed: %s", e)
             raise AssetUploadError(f"Failed to upload image '{filepath}': {str(e)}") from e
 
     async def upload_video(self, ad_account_id: str, filepath: str, duration: Optional[float] = None,
                           width: Optional[int] = None, height: Optional[int] = None,
-                          upload_phase: str = "start") -> VideoAsset:
+                          upload_phase: str = "start",
+                          chunk_concurrency: int = _DEFAULT_CHUNK_CONCURRENCY) -> VideoAsset:
         """
         Upload video to ad account
 
@@ -309,100 +434,194 @@ class AssetAgent:
             width: Video width in pixels (optional)
             height: Video height in pixels (optional)
             upload_phase: Upload phase (default: 'start')
+            chunk_concurrency: In-flight chunks for large resumable uploads
 
         Returns:
             VideoAsset with video_id
         """
-        log_debug(f"\n[AssetAgent] Uploading video: {filepath}")
+        return await self._single_flight(
+            f"video:{filepath}",
+            self._upload_video(ad_account_id, filepath, duration, width, height, upload_phase,
+                               chunk_concurrency)
+        )
+
+    async def _upload_video_chunked(self, ad_account_id: str, filepath: str, filename: str,
+                                    file_size: int, concurrency: int) -> str:
+        """Drive Graph's resumable upload protocol with concurrent chunks
+
+        start returns an upload session plus the chunk window the server
+        wants; the file is sliced into windows of that size and the
+        transfer POSTs run in parallel under a bounded semaphore so a
+        multi-GB upload saturates the link instead of serializing
+        chunk round-trips. finish seals the session.
+        """
+        endpoint = f"/act_{ad_account_id}/advideos"
+        params = {"access_token": self.api.access_token}
+
+        response = await self.api.session.post(
+            endpoint,
+            data={"upload_phase": "start", "file_size": str(file_size)},
+            params=params
+        )
+        start_result = self.api._handle_response(response)
+        session_id = start_result.get("upload_session_id")
+        video_id = start_result.get("video_id")
+        if not session_id or not video_id:
+            raise AssetUploadError(f"Resumable upload start failed. Response: {start_result}")
+
+        # The start response describes the first chunk window; its size
+        # is reused for every slice of the file
+        start_offset = int(start_result.get("start_offset", 0))
+        end_offset = int(start_result.get("end_offset", file_size))
+        chunk_size = max(end_offset - start_offset, 1)
+
+        ranges = [(offset, min(offset + chunk_size, file_size))
+                  for offset in range(start_offset, file_size, chunk_size)]
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _send_chunk(chunk_start: int, chunk_end: int):
+            async with semaphore:
+                chunk = await asyncio.to_thread(_read_range, filepath, chunk_start, chunk_end - chunk_start)
+                data = {
+                    "upload_phase": "transfer",
+                    "upload_session_id": session_id,
+                    "start_offset": str(chunk_start)
+                }
+                files = {"video_file_chunk": (filename, chunk, "application/octet-stream")}
+                chunk_response = await self.api.session.post(endpoint, data=data, files=files, params=params)
+                self.api._handle_response(chunk_response)
+
+        log_debug(f"[AssetAgent] Resumable upload: {len(ranges)} chunk(s) of "
+                  f"~{chunk_size / 1024 / 1024:.0f}MB, concurrency {min(concurrency, len(ranges))}")
+        await asyncio.gather(*(_send_chunk(s, e) for s, e in ranges))
+
+        response = await self.api.session.post(
+            endpoint,
+            data={"upload_phase": "finish", "upload_session_id": session_id},
+            params=params
+        )
+        self.api._handle_response(response)
+        return video_id
+
+    async def _upload_video(self, ad_account_id: str, filepath: str, duration: Optional[float] = None,
+                            width: Optional[int] = None, height: Optional[int] = None,
+                            upload_phase: str = "start",
+                            chunk_concurrency: int = _DEFAULT_CHUNK_CONCURRENCY) -> VideoAsset:
+        """Do the actual video validation, read and POST"""
+        log_debug("\n[AssetAgent] Uploading video: %s", filepath)
+
+        filename = os.path.basename(filepath)
 
         try:
-            validation_result = AssetSpecs.validate_video(filepath, duration, width, height)
+            # A 2GB video would otherwise block the loop for the whole hash
+            content_sha, file_size = await asyncio.to_thread(_probe_and_hash, filepath)
+            validation_result = AssetSpecs.validate_video(filepath, duration, width, height, size_bytes=file_size)
             log_debug(f"[AssetAgent] Video validation passed: {validation_result['format'].upper()}, {validation_result['size_bytes'] / 1024 / 1024:.2f}MB")
 
-            cached_video_id = self.cache.get_video(filepath)
+            cached_video_id = self.cache.get_video(filepath) or self.cache.get_video(content_sha)
             if cached_video_id:
-                log_debug(f"[AssetAgent] Using cached video ID: {cached_video_id}")
+                log_debug("[AssetAgent] Using cached video ID: %s", cached_video_id)
                 return VideoAsset(
                     video_id=cached_video_id,
-                    filename=os.path.basename(filepath),
+                    filename=filename,
                     size_bytes=validation_result['size_bytes'],
                     duration=duration,
                     status="READY"
                 )
 
-            with open(filepath, 'rb') as f:
-                video_data = f.read()
+            if file_size >= _CHUNKED_UPLOAD_THRESHOLD:
+                video_id = await self._upload_video_chunked(
+                    ad_account_id, filepath, filename, file_size, chunk_concurrency
+                )
+            else:
+                # Small videos: one multipart POST is cheaper than three
+                # protocol round-trips
+                video_data = await asyncio.to_thread(_read_bytes, filepath)
 
-            endpoint = f"/act_{ad_account_id}/advideos"
+                endpoint = f"/act_{ad_account_id}/advideos"
 
-            files = {"file": (os.path.basename(filepath), video_data)}
-            params = {
-                "access_token": self.api.access_token,
-                "upload_phase": upload_phase
-            }
+                content_type = _VIDEO_CONTENT_TYPES.get(validation_result['format'], "application/octet-stream")
+                files = {"file": (filename, video_data, content_type)}
+                params = {
+                    "access_token": self.api.access_token,
+                    "upload_phase": upload_phase
+                }
 
-            log_debug(f"[AssetAgent] POST {endpoint}")
+                log_debug("[AssetAgent] POST %s", endpoint)
 
-            response = await self.api.session.post(endpoint, files=files, params=params)
-            result = self.api._handle_response(response)
+                response = await self.api.session.post(endpoint, files=files, params=params)
+                result = self.api._handle_response(response)
 
-            video_id = result.get("video_id")
-            if not video_id:
-                raise AssetUploadError("No video_id returned from API")
+                video_id = result.get("video_id")
+                if not video_id:
+                    raise AssetUploadError("No video_id returned from API")
 
             self.cache.set_video(filepath, video_id)
+            self.cache.set_video(content_sha, video_id)
 
-            log_debug(f"[AssetAgent] Video uploaded successfully: {video_id}")
+            log_debug("[AssetAgent] Video uploaded successfully: %s", video_id)
 
             return VideoAsset(
                 video_id=video_id,
-                filename=os.path.basename(filepath),
+                filename=filename,
                 size_bytes=validation_result['size_bytes'],
                 duration=duration,
                 status="PROCESSING"
             )
 
         except AssetValidationError as e:
-            log_debug(f"[AssetAgent] Video validation failed: {e}")
+            log_debug("[AssetAgent] Video validation failed: %s", e)
             raise
         except Exception as e:
-            log_debug(f"[AssetAgent] Video upload failed: {e}")
+            log_debug("[AssetAgent] Video upload failed: %s", e)
             raise AssetUploadError(f"Failed to upload video '{filepath}': {str(e)}") from e
 
-    async def get_image(self, ad_account_id: str, image_hash: str) -> Dict[str, Any]:
-        """Get image details from ad account's image library"""
-        log_debug(f"\n[AssetAgent] Retrieving image: {image_hash}")
+    async def get_images(self, ad_account_id: str, image_hashes: List[str]) -> Dict[str, Any]:
+        """Get details for multiple images in a single request
+
+        The /adimages endpoint accepts a list of hashes, so N lookups
+        collapse into one round-trip.
+        """
+        log_debug("\n[AssetAgent] Retrieving %s image(s)", len(image_hashes))
 
         try:
             endpoint = f"/act_{ad_account_id}/adimages"
             params = {
                 "fields": "id,hash,url,created_time,width,height,name",
-                "hashes": json.dumps([image_hash])
+                "hashes": json_dumps(list(image_hashes))
             }
             result = await self.api.get(endpoint, params=params)
-            log_debug(f"[AssetAgent] Image retrieved: {image_hash}")
+            log_debug("[AssetAgent] Images retrieved: %s", len(image_hashes))
             return result
         except Exception as e:
-            log_debug(f"[AssetAgent] Failed to retrieve image: {e}")
+            log_debug("[AssetAgent] Failed to retrieve images: %s", e)
             raise
 
-    async def get_video(self, ad_account_id: str, video_id: str) -> Dict[str, Any]:
-        """Get video details from ad account's video library"""
-        log_debug(f"\n[AssetAgent] Retrieving video: {video_id}")
+    async def get_image(self, ad_account_id: str, image_hash: str) -> Dict[str, Any]:
+        """Get image details from ad account's image library"""
+        return await self.get_images(ad_account_id, [image_hash])
+
+    async def get_videos(self, ad_account_id: str, video_ids: List[str]) -> Dict[str, Any]:
+        """Get details for multiple videos in a single request"""
+        log_debug("\n[AssetAgent] Retrieving %s video(s)", len(video_ids))
 
         try:
             endpoint = f"/act_{ad_account_id}/advideos"
             params = {
                 "fields": "id,video_id,url,created_time,status,thumbnail_url,length",
-                "video_ids": json.dumps([video_id])
+                "video_ids": json_dumps(list(video_ids))
             }
             result = await self.api.get(endpoint, params=params)
-            log_debug(f"[AssetAgent] Video retrieved: {video_id}")
+            log_debug("[AssetAgent] Videos retrieved: %s", len(video_ids))
             return result
         except Exception as e:
-            log_debug(f"[AssetAgent] Failed to retrieve video: {e}")
+            log_debug("[AssetAgent] Failed to retrieve videos: %s", e)
             raise
 
+    async def get_video(self, ad_account_id: str, video_id: str) -> Dict[str, Any]:
+        """Get video details from ad account's video library"""
+        return await self.get_videos(ad_account_id, [video_id])
+
     def clear_cache(self):
         """Clear asset cache"""
         self.cache.clear()
@@ -3,12 +3,17 @@ Business Agent - Manages business-level operations
 Handles lead forms, pixels, and other business-level Meta resources
 """
 
-from typing import Dict, Any, List
+import time
+
+from typing import Dict, Any, List, Optional
 
 from ..core.models import LeadFormParams, LeadForm, Lead, Pixel
 from ..core.exceptions import LeadFormError, PixelError
 from ..core.utils import log_debug
 
+# Lead form metadata barely changes within a report run; cache reads briefly
+_READ_CACHE_TTL = 60  # seconds
+
 
 class BusinessAgent:
     """Agent for business-level operations (lead forms, pixels, etc.)"""
@@ -21,8 +26,22 @@ class BusinessAgent:
             api_client: MetaAPIClient instance
         """
         self.api = api_client
+        # Short-TTL read cache - report and dashboard flows re-request the
+        # same form/page metadata many times within seconds
+        self._read_cache: Dict[tuple, tuple] = {}
         log_debug("[BusinessAgent] Initialized")
 
+    def _cache_get(self, key: tuple) -> Optional[Any]:
+        """Return a cached value if present and not expired"""
+        entry = self._read_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_set(self, key: tuple, value: Any):
+        """Cache a value with the standard read TTL"""
+        self._read_cache[key] = (time.monotonic() + _READ_CACHE_TTL, value)
+
     async def create_lead_form(self, page_id: str, params: LeadFormParams) -> LeadForm:
         """
         Create a new lead form on a page
@@ -34,7 +53,7 @@ class BusinessAgent:
         Returns:
             LeadForm dataclass with form details
         """
-        log_debug(f"\n[BusinessAgent] Creating lead form: {params.name}")
+        log_debug("\n[BusinessAgent] Creating lead form: %s", params.name)
 
         # NOTE: Lead forms are created on PAGE_ID, not ad_account_id
         endpoint = f"/{page_id}/leadgen_forms"
@@ -56,11 +75,11 @@ class BusinessAgent:
                 questions=params.questions
             )
 
-            log_debug(f"[BusinessAgent] Lead form created: {lead_form.id}")
+            log_debug("[BusinessAgent] Lead form created: %s", lead_form.id)
             return lead_form
 
         except Exception as e:
-            log_debug(f"[BusinessAgent] Lead form creation failed: {e}")
+            log_debug("[BusinessAgent] Lead form creation failed: %s", e)
             raise LeadFormError(f"Failed to create lead form '{params.name}': {str(e)}") from e
 
     async def get_lead_form(self, form_id: str) -> Dict[str, Any]:
@@ -73,7 +92,13 @@ class BusinessAgent:
         Returns:
             Dict with form details
         """
-        log_debug(f"\n[BusinessAgent] Getting lead form: {form_id}")
+        log_debug("\n[BusinessAgent] Getting lead form: %s", form_id)
+
+        cache_key = ("lead_form", form_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            log_debug("[BusinessAgent] Lead form served from cache: %s", form_id)
+            return cached
 
         endpoint = f"/{form_id}"
         params = {
@@ -82,12 +107,22 @@ class BusinessAgent:
 
         try:
             response = await self.api.get(endpoint, params=params)
-            log_debug(f"[BusinessAgent] Lead form retrieved: {form_id}")
+            self._cache_set(cache_key, response)
+            log_debug("[BusinessAgent] Lead form retrieved: %s", form_id)
             return response
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to get lead form: {e}")
+            log_debug("[BusinessAgent] Failed to get lead form: %s", e)
             raise LeadFormError(f"Failed to get lead form '{form_id}': {str(e)}") from e
 
+    def get_lead_form_cached(self, form_id: str) -> Optional[Dict[str, Any]]:
+        """Cached lead form if still fresh, else None
+
+        Plain synchronous call so repeat reads skip the coroutine and
+        event-loop bookkeeping entirely; callers fall back to the async
+        get_lead_form only on a miss.
+        """
+        return self._cache_get(("lead_form", form_id))
+
     async def list_lead_forms(self, page_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
         List all lead forms for a page
@@ -99,8 +134,26 @@ class BusinessAgent:
         Returns:
             List of form dictionaries
         """
-        log_debug(f"\n[BusinessAgent] Listing lead forms for page: {page_id}")
+        log_debug("\n[BusinessAgent] Listing lead forms for page: %s", page_id)
+
+        cache_key = ("lead_forms", page_id, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            log_debug("[BusinessAgent] Lead forms served from cache: %s", page_id)
+            return cached
+
+        forms = [form async for form in self.list_lead_forms_stream(page_id, limit)]
+        self._cache_set(cache_key, forms)
+        log_debug("[BusinessAgent] Found %s lead forms", len(forms))
+        return forms
 
+    async def list_lead_forms_stream(self, page_id: str, limit: int = 50):
+        """Yield lead forms as pages arrive instead of materializing them
+
+        Rows ride the client's prefetching cursor pagination, so
+        consumers can process page one while page two downloads; the
+        cached list_lead_forms collects the same iterator.
+        """
         # NOTE: Uses PAGE_ID endpoint
         endpoint = f"/{page_id}/leadgen_forms"
         params = {
@@ -109,12 +162,10 @@ class BusinessAgent:
         }
 
         try:
-            response = await self.api.get(endpoint, params=params)
-            forms = response.get("data", [])
-            log_debug(f"[BusinessAgent] Found {len(forms)} lead forms")
-            return forms
+            async for form in self.api.get_paginated(endpoint, params=params, max_items=limit):
+                yield form
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to list lead forms: {e}")
+            log_debug("[BusinessAgent] Failed to list lead forms: %s", e)
             raise LeadFormError(f"Failed to list lead forms for page '{page_id}': {str(e)}") from e
 
     async def get_leads(self, form_id: str, limit: int = 100) -> List[Dict[str, Any]]:
@@ -128,8 +179,19 @@ class BusinessAgent:
         Returns:
             List of lead dictionaries
         """
-        log_debug(f"\n[BusinessAgent] Getting leads from form: {form_id}")
+        log_debug("\n[BusinessAgent] Getting leads from form: %s", form_id)
+
+        leads = [lead async for lead in self.get_leads_stream(form_id, limit)]
+        log_debug("[BusinessAgent] Found %s leads", len(leads))
+        return leads
+
+    async def get_leads_stream(self, form_id: str, limit: int = 100):
+        """Yield leads page by page; get_leads collects the iterator
 
+        Lead exports are the largest listings in the system, so the
+        streaming shape keeps peak memory at one page for consumers
+        that can process rows incrementally.
+        """
         endpoint = f"/{form_id}/leads"
         params = {
             "fields": "id,created_time,field_data,ad_id,ad_name,adset_id,campaign_id",
@@ -137,12 +199,10 @@ class BusinessAgent:
         }
 
         try:
-            response = await self.api.get(endpoint, params=params)
-            leads = response.get("data", [])
-            log_debug(f"[BusinessAgent] Found {len(leads)} leads")
-            return leads
+            async for lead in self.api.get_paginated(endpoint, params=params, max_items=limit):
+                yield lead
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to get leads: {e}")
+            log_debug("[BusinessAgent] Failed to get leads: %s", e)
             raise LeadFormError(f"Failed to get leads from form '{form_id}': {str(e)}") from e
 
     async def get_lead(self, lead_id: str) -> Dict[str, Any]:
@@ -155,7 +215,7 @@ class BusinessAgent:
         Returns:
             Dict with lead details
         """
-        log_debug(f"\n[BusinessAgent] Getting lead: {lead_id}")
+        log_debug("\n[BusinessAgent] Getting lead: %s", lead_id)
 
         endpoint = f"/{lead_id}"
         params = {
@@ -164,10 +224,10 @@ class BusinessAgent:
 
         try:
             response = await self.api.get(endpoint, params=params)
-            log_debug(f"[BusinessAgent] Lead retrieved: {lead_id}")
+            log_debug("[BusinessAgent] Lead retrieved: %s", lead_id)
             return response
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to get lead: {e}")
+            log_debug("[BusinessAgent] Failed to get lead: %s", e)
             raise LeadFormError(f"Failed to get lead '{lead_id}': {str(e)}") from e
 
     async def update_lead_form_status(self, form_id: str, status: str) -> Dict[str, Any]:
@@ -181,17 +241,21 @@ class BusinessAgent:
         Returns:
             API response
         """
-        log_debug(f"\n[BusinessAgent] Updating form {form_id} status to: {status}")
+        log_debug("\n[BusinessAgent] Updating form %s status to: %s", form_id, status)
 
         endpoint = f"/{form_id}"
         data = {"status": status}
 
         try:
             response = await self.api.post(endpoint, json_data=data)
-            log_debug(f"[BusinessAgent] Form status updated")
+            # The form and any page listing containing it are now stale
+            self._read_cache.pop(("lead_form", form_id), None)
+            for key in [k for k in self._read_cache if k[0] == "lead_forms"]:
+                del self._read_cache[key]
+            log_debug("[BusinessAgent] Form status updated")
             return response
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to update form status: {e}")
+            log_debug("[BusinessAgent] Failed to update form status: %s", e)
             raise LeadFormError(f"Failed to update form '{form_id}': {str(e)}") from e
 
     # =========================================================================
@@ -209,7 +273,7 @@ class BusinessAgent:
         Returns:
             Pixel dataclass with pixel details
         """
-        log_debug(f"\n[BusinessAgent] Creating pixel: {name}")
+        log_debug("\n[BusinessAgent] Creating pixel: %s", name)
 
         # POST /act_{AD_ACCOUNT_ID}/adspixels
         endpoint = f"/act_{ad_account_id}/adspixels"
@@ -227,11 +291,11 @@ class BusinessAgent:
                 name=name
             )
 
-            log_debug(f"[BusinessAgent] Pixel created: {pixel.id}")
+            log_debug("[BusinessAgent] Pixel created: %s", pixel.id)
             return pixel
 
         except Exception as e:
-            log_debug(f"[BusinessAgent] Pixel creation failed: {e}")
+            log_debug("[BusinessAgent] Pixel creation failed: %s", e)
             raise PixelError(f"Failed to create pixel '{name}': {str(e)}") from e
 
     async def get_pixel(self, pixel_id: str) -> Dict[str, Any]:
@@ -244,7 +308,7 @@ class BusinessAgent:
         Returns:
             Dict with pixel details
         """
-        log_debug(f"\n[BusinessAgent] Getting pixel: {pixel_id}")
+        log_debug("\n[BusinessAgent] Getting pixel: %s", pixel_id)
 
         endpoint = f"/{pixel_id}"
         params = {
@@ -253,10 +317,10 @@ class BusinessAgent:
 
         try:
             response = await self.api.get(endpoint, params=params)
-            log_debug(f"[BusinessAgent] Pixel retrieved: {pixel_id}")
+            log_debug("[BusinessAgent] Pixel retrieved: %s", pixel_id)
             return response
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to get pixel: {e}")
+            log_debug("[BusinessAgent] Failed to get pixel: %s", e)
             raise PixelError(f"Failed to get pixel '{pixel_id}': {str(e)}") from e
 
     async def list_pixels(self, ad_account_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -270,8 +334,14 @@ class BusinessAgent:
         Returns:
             List of pixel dictionaries
         """
-        log_debug(f"\n[BusinessAgent] Listing pixels for ad account: {ad_account_id}")
+        log_debug("\n[BusinessAgent] Listing pixels for ad account: %s", ad_account_id)
 
+        pixels = [pixel async for pixel in self.list_pixels_stream(ad_account_id, limit)]
+        log_debug("[BusinessAgent] Found %s pixels", len(pixels))
+        return pixels
+
+    async def list_pixels_stream(self, ad_account_id: str, limit: int = 50):
+        """Yield pixels page by page; list_pixels collects the iterator"""
         endpoint = f"/act_{ad_account_id}/adspixels"
         params = {
             "fields": "id,name,creation_time,last_fired_time",
@@ -279,37 +349,37 @@ class BusinessAgent:
         }
 
         try:
-            response = await self.api.get(endpoint, params=params)
-            pixels = response.get("data", [])
-            log_debug(f"[BusinessAgent] Found {len(pixels)} pixels")
-            return pixels
+            async for pixel in self.api.get_paginated(endpoint, params=params, max_items=limit):
+                yield pixel
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to list pixels: {e}")
+            log_debug("[BusinessAgent] Failed to list pixels: %s", e)
             raise PixelError(f"Failed to list pixels for ad account '{ad_account_id}': {str(e)}") from e
 
-    async def update_pixel(self, pixel_id: str, name: str) -> Dict[str, Any]:
+    async def update_pixel(self, pixel_id: str, name: str, fetch: bool = False) -> Dict[str, Any]:
         """
         Update/rename a Meta Pixel
 
         Args:
             pixel_id: Pixel ID to update
             name: New name for the pixel
+            fetch: When True, re-fetch the pixel after updating. By default
+                the result is built from what we just sent, saving a round-trip.
 
         Returns:
             Dict with updated pixel details
         """
-        log_debug(f"\n[BusinessAgent] Updating pixel {pixel_id} with name: {name}")
+        log_debug("\n[BusinessAgent] Updating pixel %s with name: %s", pixel_id, name)
 
         endpoint = f"/{pixel_id}"
         data = {"name": name}
 
         try:
             response = await self.api.post(endpoint, json_data=data)
-            log_debug(f"[BusinessAgent] Pixel updated: {response}")
+            log_debug("[BusinessAgent] Pixel updated: %s", response)
 
-            # Fetch updated pixel details
-            updated_pixel = await self.get_pixel(pixel_id)
-            return updated_pixel
+            if fetch:
+                return await self.get_pixel(pixel_id)
+            return {"id": pixel_id, "name": name, **response}
         except Exception as e:
-            log_debug(f"[BusinessAgent] Failed to update pixel: {e}")
+            log_debug("[BusinessAgent] Failed to update pixel: %s", e)
             raise PixelError(f"Failed to update pixel '{pixel_id}': {str(e)}") from e
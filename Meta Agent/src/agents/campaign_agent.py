@@ -34,7 +34,7 @@ class CampaignAgent:
         Returns:
             Created campaign with ID
         """
-        log_debug(f"\n[CampaignAgent] Creating campaign: {params.name}")
+        log_debug("\n[CampaignAgent] Creating campaign: %s", params.name)
 
         endpoint = f"/act_{ad_account_id}/campaigns"
         data = params.to_api_dict()
@@ -49,11 +49,11 @@ class CampaignAgent:
                 status=params.status
             )
 
-            log_debug(f"[CampaignAgent] Campaign created: {campaign.id}")
+            log_debug("[CampaignAgent] Campaign created: %s", campaign.id)
             return campaign
 
         except APIError as e:
-            log_debug(f"[CampaignAgent] Campaign creation failed: {e.message}")
+            log_debug("[CampaignAgent] Campaign creation failed: %s", e.message)
             raise CampaignCreationError(
                 f"Failed to create campaign '{params.name}': {e.message}"
             ) from e
@@ -73,7 +73,7 @@ class CampaignAgent:
         Returns:
             Created ad set with ID
         """
-        log_debug(f"\n[CampaignAgent] Creating ad set: {params.name}")
+        log_debug("\n[CampaignAgent] Creating ad set: %s", params.name)
 
         endpoint = f"/act_{ad_account_id}/adsets"
         data = params.to_api_dict()
@@ -89,11 +89,11 @@ class CampaignAgent:
                 status=params.status
             )
 
-            log_debug(f"[CampaignAgent] Ad set created: {adset.id}")
+            log_debug("[CampaignAgent] Ad set created: %s", adset.id)
             return adset
 
         except APIError as e:
-            log_debug(f"[CampaignAgent] Ad set creation failed: {e.message}")
+            log_debug("[CampaignAgent] Ad set creation failed: %s", e.message)
             raise AdSetCreationError(
                 f"Failed to create ad set '{params.name}': {e.message}"
             ) from e
@@ -105,28 +105,40 @@ class CampaignAgent:
         return await self.api.get(endpoint, params=params)
 
     async def update_campaign_status(self, campaign_id: str, status: str):
-        """Update campaign status"""
+        """Update campaign status, returning the post-update state
+
+        Asking Graph for fields on the write folds the confirm-read into
+        the same round trip, so callers never need a follow-up get.
+        """
         endpoint = f"/{campaign_id}"
-        data = {"status": status}
+        data = {"status": status, "fields": "id,name,status,objective"}
         return await self.api.post(endpoint, json_data=data)
 
     async def pause_campaign(self, campaign_id: str):
         """Pause a campaign"""
-        log_debug(f"\n[CampaignAgent] Pausing campaign: {campaign_id}")
+        log_debug("\n[CampaignAgent] Pausing campaign: %s", campaign_id)
         return await self.update_campaign_status(campaign_id, "PAUSED")
 
     async def activate_campaign(self, campaign_id: str):
         """Activate a campaign"""
-        log_debug(f"\n[CampaignAgent] Activating campaign: {campaign_id}")
+        log_debug("\n[CampaignAgent] Activating campaign: %s", campaign_id)
         return await self.update_campaign_status(campaign_id, "ACTIVE")
 
     async def list_campaigns(self, ad_account_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """List campaigns under an ad account"""
-        log_debug(f"\n[CampaignAgent] Listing campaigns for ad account: {ad_account_id}")
+        return [c async for c in self.list_campaigns_stream(ad_account_id, limit)]
+
+    def list_campaigns_stream(self, ad_account_id: str, limit: int = 50):
+        """Yield campaigns as pages arrive instead of materializing them
+
+        Rows come through the client's prefetching cursor pagination,
+        so consumers can start work on page 1 while page 2 downloads;
+        list_campaigns collects the same iterator into a list.
+        """
+        log_debug("\n[CampaignAgent] Listing campaigns for ad account: %s", ad_account_id)
         endpoint = f"/act_{ad_account_id}/campaigns"
         params = {"fields": "id,name,objective,status,created_time", "limit": limit}
-        response = await self.api.get(endpoint, params=params)
-        return response.get("data", [])
+        return self.api.get_paginated(endpoint, params=params, max_items=limit)
 
     async def list_adsets(self, ad_account_id: str, campaign_id: str = None, limit: int = 50) -> List[Dict[str, Any]]:
         """List ad sets under an ad account or specific campaign
@@ -139,7 +151,11 @@ class CampaignAgent:
         Returns:
             List of ad set dictionaries
         """
-        log_debug(f"\n[CampaignAgent] Listing ad sets for ad account: {ad_account_id}")
+        return [a async for a in self.list_adsets_stream(ad_account_id, campaign_id, limit)]
+
+    def list_adsets_stream(self, ad_account_id: str, campaign_id: str = None, limit: int = 50):
+        """Yield ad sets as pages arrive; list_adsets collects them"""
+        log_debug("\n[CampaignAgent] Listing ad sets for ad account: %s", ad_account_id)
 
         if campaign_id:
             endpoint = f"/{campaign_id}/adsets"
@@ -150,8 +166,7 @@ class CampaignAgent:
             "fields": "id,name,campaign_id,status,optimization_goal,billing_event,daily_budget,lifetime_budget,created_time",
             "limit": limit
         }
-        response = await self.api.get(endpoint, params=params)
-        return response.get("data", [])
+        return self.api.get_paginated(endpoint, params=params, max_items=limit)
 
     async def get_adset(self, adset_id: str) -> Dict:
         """Get ad set details"""
@@ -160,12 +175,12 @@ class CampaignAgent:
         return await self.api.get(endpoint, params=params)
 
     async def update_adset_status(self, adset_id: str, status: str):
-        """Update ad set status"""
+        """Update ad set status, returning the post-update state"""
         endpoint = f"/{adset_id}"
-        data = {"status": status}
+        data = {"status": status, "fields": "id,name,status,optimization_goal"}
         return await self.api.post(endpoint, json_data=data)
 
     async def delete_campaign(self, campaign_id: str):
         """Delete a campaign by setting status to DELETED"""
-        log_debug(f"\n[CampaignAgent] Deleting campaign: {campaign_id}")
+        log_debug("\n[CampaignAgent] Deleting campaign: %s", campaign_id)
         return await self.update_campaign_status(campaign_id, "DELETED")
@@ -4,18 +4,179 @@ Handles fetching and analyzing performance data from Meta Ads API.
 """
 
 import asyncio
+import functools
 import httpx
 import json
 import csv
-from typing import Optional, Dict, Any, List
+import random
+import time
+from typing import AsyncIterator, Optional, Dict, Any, Iterable, List
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, replace
+from collections import OrderedDict
+from operator import itemgetter
+from urllib.parse import urlencode
 
+from ..core.api_client import MetaAPIClient
 from ..core.config import Config
-from ..core.utils import log_debug
+from ..core.exceptions import APIError
+from ..core.utils import log_debug, json_loads, json_dumps_pretty
+
+# Presets whose date window is still open (include today), so cached
+# responses go stale quickly; closed windows are effectively immutable
+LIVE_PRESETS = frozenset({"today", "this_week", "this_quarter", "lifetime"})
+
+_LIVE_PRESET_TTL = 60        # seconds
+_CLOSED_PRESET_TTL = 3600    # seconds
+# Rolling daily windows and learning-phase probes always include today,
+# so they get their own short expiry
+_DAILY_INSIGHTS_TTL = 300    # seconds
+_INSIGHTS_CACHE_MAX_ENTRIES = 2048
+
+# Default field sets, pre-joined once at import - they are invariant, so
+# rebuilding the list and re-joining it on every call is wasted work
+_BASE_FIELDS = ("impressions,clicks,spend,reach,frequency,"
+                "ctr,cpc,cpm,actions,action_values,"
+                "inline_link_clicks,inline_link_click_ctr")
+_ACCOUNT_FIELDS = _BASE_FIELDS + ",date_start,date_stop"
+_CAMPAIGN_FIELDS = _BASE_FIELDS + ",campaign_id,campaign_name,date_start,date_stop"
+_ADSET_FIELDS = _BASE_FIELDS + ",adset_id,adset_name,date_start,date_stop"
+_AD_FIELDS = _BASE_FIELDS + ",ad_id,adcreative,date_start,date_stop"
+_KIND_FIELDS = {"campaign": _CAMPAIGN_FIELDS, "adset": _ADSET_FIELDS, "ad": _AD_FIELDS}
+
+# CSV exports write through a 1MB file buffer to keep syscalls rare
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Inverted action_type -> primary result name mapping, built once so
+# classifying an action is a single dict hit instead of scanning every
+# mapping's list per action
+_ACTION_TYPE_TO_RESULT = {
+    "lead": "Lead",
+    "onsite_conversion.lead_grouped": "Lead",
+    "contact_call_click": "Call",
+    "onsite_web_call": "Call",
+    "phone_call": "Call",
+    "onsite_conversion.messaging_conversation_started_7d": "WhatsApp",
+    "onsite_conversion.messaging_first_reply": "WhatsApp",
+    "onsite_conversion.messaging_welcome_message_view": "WhatsApp",
+}
+
+# Default action types counted as results by the rolling calculators,
+# as a frozenset so per-action membership checks are O(1)
+_DEFAULT_RESULT_TYPES = frozenset({
+    "lead", "onsite_conversion.lead_grouped",
+    "contact_call_click", "onsite_web_call",
+    "onsite_conversion.messaging_conversation_started_7d",
+    "onsite_conversion.messaging_first_reply",
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ymd(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date string, cached
+
+    Report rows repeat the same date_start/date_stop strings many times
+    and strptime re-runs its format machinery on each call; the cache
+    turns repeats into a dict hit.
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def _freeze(value):
+    """Make list arguments hashable for use in cache keys"""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _freeze_deep(value):
+    """Recursively convert dicts and lists into hashable tuples
+
+    Insight rows nest lists of action dicts, so the flat _freeze is not
+    enough to key a memo on a whole row.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_deep(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze_deep(v) for v in value)
+    return value
+
+
+# Bound on memoized parse results per agent
+_PARSE_MEMO_MAX_ENTRIES = 4096
+
+
+# Agencies work against a bounded set of entities, so the URL strings
+# repeat constantly; caching them avoids rebuilding the same
+# concatenation on every polling call
+@functools.lru_cache(maxsize=1024)
+def _insights_url(entity_id: str) -> str:
+    """Full /insights endpoint URL for a campaign/adset/ad id"""
+    return f"{Config.META_API_BASE_URL}/{entity_id}/insights"
+
+
+@functools.lru_cache(maxsize=256)
+def _account_insights_url(account_id: str) -> str:
+    """Full /insights endpoint URL for an ad account id"""
+    return f"{Config.META_API_BASE_URL}/act_{account_id}/insights"
+
+
+def memoize_insights(func=None, *, ttl=None):
+    """
+    Memoize a get_*_insights coroutine on the agent's LRU cache
+
+    Cache key covers the method name and all arguments (entity ID,
+    date_preset, fields, breakdowns). Entries for open date windows
+    expire after a short TTL; closed windows are kept much longer.
+    Methods without a date_preset argument pass an explicit ttl
+    instead: @memoize_insights(ttl=seconds).
+
+    Concurrent misses on the same key are collapsed: the first caller
+    owns the fetch and later callers await the same in-flight task, so
+    a report fan-out and a drill-down racing for one entity cost one
+    Graph API call between them.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            key = (fn.__name__,
+                   tuple(_freeze(a) for a in args),
+                   tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())))
+
+            cache = self._insights_cache
+            entry = cache.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[0] > now:
+                cache.move_to_end(key)
+                return entry[1]
+
+            inflight = self._insights_inflight
+            task = inflight.get(key)
+            if task is not None:
+                return await task
+
+            task = asyncio.ensure_future(fn(self, *args, **kwargs))
+            inflight[key] = task
+            task.add_done_callback(lambda _t, _k=key: inflight.pop(_k, None))
+            result = await task
+
+            if ttl is not None:
+                entry_ttl = ttl
+            else:
+                date_preset = kwargs.get("date_preset", args[1] if len(args) > 1 else "last_7d")
+                entry_ttl = _LIVE_PRESET_TTL if date_preset in LIVE_PRESETS else _CLOSED_PRESET_TTL
+            cache[key] = (now + entry_ttl, result)
+            cache.move_to_end(key)
+            while len(cache) > _INSIGHTS_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+            return result
+
+        return wrapper
+
+    if func is not None:
+        return decorate(func)
+    return decorate
 
 
-@dataclass
+@dataclass(slots=True)
 class InsightMetrics:
     """Insight metrics data"""
     impressions: int = 0
@@ -56,44 +217,110 @@ class InsightMetrics:
             self.action_values = []
 
 
+# Field names resolved once - used to flatten InsightMetrics without
+# asdict(), which deep-copies every list/dict field per row
+_INSIGHT_FIELDS = tuple(f.name for f in fields(InsightMetrics))
+
+
 class InsightsAgent:
     """Agent for fetching and analyzing ad performance insights"""
 
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, api_client: Optional[MetaAPIClient] = None):
         """
         Initialize InsightsAgent
 
         Args:
             access_token: Meta API access token
+            api_client: Shared MetaAPIClient. When provided, insight requests
+                reuse its connection pool instead of opening a second one.
         """
         self.access_token = access_token
         self.api_url = Config.META_API_BASE_URL
+        # Share the orchestrator's client when given so the whole system runs
+        # on one connection pool; otherwise own a private client
+        self.api = api_client if api_client is not None else MetaAPIClient(access_token)
+        self._owns_api = api_client is None
+        # Built once - identical on every request
+        self._headers = {
+            "Authorization": f"Bearer {access_token}",
+            "User-Agent": "MetaAdsAgent/1.0"
+        }
+        self._insights_cache: "OrderedDict" = OrderedDict()
+        # Memoized fetches currently on the wire, keyed like the cache;
+        # concurrent misses await these instead of duplicating the call
+        self._insights_inflight: Dict[tuple, asyncio.Task] = {}
+        self._parse_memo: "OrderedDict" = OrderedDict()
+
+    async def aclose(self):
+        """Close the HTTP client if this agent owns it"""
+        if self._owns_api:
+            await self.api.close()
 
     async def _make_request(self, method: str, url: str, params: Optional[Dict] = None,
                            json_data: Optional[Dict] = None, retry_count: int = 0) -> Dict[str, Any]:
         """Make API request with retry logic"""
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "User-Agent": "MetaAdsAgent/1.0"
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=Config.API_TIMEOUT) as client:
-                if params is None:
-                    params = {}
-                params["access_token"] = self.access_token
+            if params is None:
+                params = {}
+            params["access_token"] = self.access_token
 
-                response = await client.request(method, url, params=params, json=json_data, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            response = await self.api.session.request(method, url, params=params, json=json_data, headers=self._headers)
+            response.raise_for_status()
+            return json_loads(response.content)
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429 and retry_count < Config.MAX_RETRIES:
-                log_debug(f"Rate limited, retrying in {2 ** retry_count} seconds...")
-                await asyncio.sleep(2 ** retry_count)
+            status = e.response.status_code
+            if (status == 429 or status >= 500) and retry_count < Config.MAX_RETRIES:
+                delay = self._retry_delay(e.response, retry_count)
+                log_debug(f"Request failed ({status}), retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
                 return await self._make_request(method, url, params, json_data, retry_count + 1)
             raise
 
+    @staticmethod
+    def _retry_delay(response: httpx.Response, retry_count: int) -> float:
+        """
+        Work out how long to back off before retrying a failed request
+
+        Prefers the server-provided Retry-After header (and Meta's
+        x-business-use-case-usage throttling estimate) over blind
+        exponential backoff, and adds jitter so concurrent clients do
+        not all retry in lockstep.
+        """
+        try:
+            delay = float(response.headers.get("Retry-After", 2 ** retry_count))
+        except (TypeError, ValueError):
+            delay = float(2 ** retry_count)
+
+        usage_header = response.headers.get("x-business-use-case-usage")
+        if usage_header:
+            try:
+                usage = json.loads(usage_header)
+                for entries in usage.values():
+                    for entry in entries:
+                        estimate = entry.get("estimated_time_to_regain_access", 0)
+                        if estimate:
+                            # Meta reports this estimate in minutes
+                            delay = max(delay, float(estimate) * 60)
+            except (ValueError, TypeError, AttributeError):
+                pass
+
+        return delay + random.uniform(0, delay * 0.1)
+
+    def invalidate_entity(self, entity_id: str) -> None:
+        """Drop memoized insight entries for one entity after a write
+
+        Status changes make cached rolling metrics and learning-phase
+        probes stale before their TTL; write-path callers invoke this so
+        the next read refetches.
+        """
+        cache = self._insights_cache
+        stale = [key for key in cache
+                 if entity_id in key[1] or any(v == entity_id for _, v in key[2])]
+        for key in stale:
+            del cache[key]
+
+    @memoize_insights
     async def get_account_insights(self, account_id: str,
                                    date_preset: str = "last_7d",
                                    fields: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -108,30 +335,23 @@ class InsightsAgent:
         Returns:
             Account insights data
         """
-        log_debug(f"\n[DEBUG] Fetching account insights for: {account_id}")
-
-        if not fields:
-            fields = [
-                "impressions", "clicks", "spend", "reach", "frequency",
-                "ctr", "cpc", "cpm", "actions", "action_values",
-                "inline_link_clicks", "inline_link_click_ctr",
-                "date_start", "date_stop"
-            ]
+        log_debug("\n[DEBUG] Fetching account insights for: %s", account_id)
 
-        url = f"{self.api_url}/act_{account_id}/insights"
+        url = _account_insights_url(account_id)
         params = {
             "date_preset": date_preset,
-            "fields": ",".join(fields)
+            "fields": ",".join(fields) if fields else _ACCOUNT_FIELDS
         }
 
         try:
             response = await self._make_request("GET", url, params=params)
-            log_debug(f"Account insights retrieved successfully")
+            log_debug("Account insights retrieved successfully")
             return response
         except Exception as e:
-            log_debug(f"Error fetching account insights: {e}")
+            log_debug("Error fetching account insights: %s", e)
             raise
 
+    @memoize_insights
     async def get_campaign_insights(self, campaign_id: str,
                                    date_preset: str = "last_7d",
                                    fields: Optional[List[str]] = None,
@@ -148,20 +368,12 @@ class InsightsAgent:
         Returns:
             Campaign insights data
         """
-        log_debug(f"\n[DEBUG] Fetching campaign insights for: {campaign_id}")
-
-        if not fields:
-            fields = [
-                "impressions", "clicks", "spend", "reach", "frequency",
-                "ctr", "cpc", "cpm", "actions", "action_values",
-                "inline_link_clicks", "inline_link_click_ctr",
-                "campaign_id", "campaign_name", "date_start", "date_stop"
-            ]
+        log_debug("\n[DEBUG] Fetching campaign insights for: %s", campaign_id)
 
-        url = f"{self.api_url}/{campaign_id}/insights"
+        url = _insights_url(campaign_id)
         params = {
             "date_preset": date_preset,
-            "fields": ",".join(fields)
+            "fields": ",".join(fields) if fields else _CAMPAIGN_FIELDS
         }
 
         if breakdowns:
@@ -169,12 +381,13 @@ class InsightsAgent:
 
         try:
             response = await self._make_request("GET", url, params=params)
-            log_debug(f"Campaign insights retrieved successfully")
+            log_debug("Campaign insights retrieved successfully")
             return response
         except Exception as e:
-            log_debug(f"Error fetching campaign insights: {e}")
+            log_debug("Error fetching campaign insights: %s", e)
             raise
 
+    @memoize_insights
     async def get_adset_insights(self, adset_id: str,
                                 date_preset: str = "last_7d",
                                 fields: Optional[List[str]] = None,
@@ -191,20 +404,12 @@ class InsightsAgent:
         Returns:
             Ad set insights data
         """
-        log_debug(f"\n[DEBUG] Fetching ad set insights for: {adset_id}")
+        log_debug("\n[DEBUG] Fetching ad set insights for: %s", adset_id)
 
-        if not fields:
-            fields = [
-                "impressions", "clicks", "spend", "reach", "frequency",
-                "ctr", "cpc", "cpm", "actions", "action_values",
-                "inline_link_clicks", "inline_link_click_ctr",
-                "adset_id", "adset_name", "date_start", "date_stop"
-            ]
-
-        url = f"{self.api_url}/{adset_id}/insights"
+        url = _insights_url(adset_id)
         params = {
             "date_preset": date_preset,
-            "fields": ",".join(fields)
+            "fields": ",".join(fields) if fields else _ADSET_FIELDS
         }
 
         if breakdowns:
@@ -212,12 +417,13 @@ class InsightsAgent:
 
         try:
             response = await self._make_request("GET", url, params=params)
-            log_debug(f"Ad set insights retrieved successfully")
+            log_debug("Ad set insights retrieved successfully")
             return response
         except Exception as e:
-            log_debug(f"Error fetching ad set insights: {e}")
+            log_debug("Error fetching ad set insights: %s", e)
             raise
 
+    @memoize_insights
     async def get_ad_insights(self, ad_id: str,
                              date_preset: str = "last_7d",
                              fields: Optional[List[str]] = None,
@@ -234,20 +440,12 @@ class InsightsAgent:
         Returns:
             Ad insights data
         """
-        log_debug(f"\n[DEBUG] Fetching ad insights for: {ad_id}")
-
-        if not fields:
-            fields = [
-                "impressions", "clicks", "spend", "reach", "frequency",
-                "ctr", "cpc", "cpm", "actions", "action_values",
-                "inline_link_clicks", "inline_link_click_ctr",
-                "ad_id", "adcreative", "date_start", "date_stop"
-            ]
+        log_debug("\n[DEBUG] Fetching ad insights for: %s", ad_id)
 
-        url = f"{self.api_url}/{ad_id}/insights"
+        url = _insights_url(ad_id)
         params = {
             "date_preset": date_preset,
-            "fields": ",".join(fields)
+            "fields": ",".join(fields) if fields else _AD_FIELDS
         }
 
         if breakdowns:
@@ -255,12 +453,116 @@ class InsightsAgent:
 
         try:
             response = await self._make_request("GET", url, params=params)
-            log_debug(f"Ad insights retrieved successfully")
+            log_debug("Ad insights retrieved successfully")
             return response
         except Exception as e:
-            log_debug(f"Error fetching ad insights: {e}")
+            log_debug("Error fetching ad insights: %s", e)
             raise
 
+    def _insights_query(self, date_preset: str, default_fields: str,
+                        fields: Optional[List[str]] = None,
+                        breakdowns: Optional[List[str]] = None) -> str:
+        """Build the query string shared by every entity in a batch"""
+        query = {
+            "date_preset": date_preset,
+            "fields": ",".join(fields) if fields else default_fields
+        }
+        if breakdowns:
+            query["breakdowns"] = ",".join(breakdowns)
+        return urlencode(query)
+
+    async def _batch_get(self, relative_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Execute many GETs through the Graph /batch endpoint
+
+        Delegates to the shared client's batch facility, which packs up
+        to 50 sub-requests per HTTP round trip. Results come back in
+        request order; failed sub-requests yield their error payload.
+        """
+        responses = await self.api.batch(
+            [{"method": "GET", "relative_url": rel} for rel in relative_urls]
+        )
+        # The client hands failed sub-requests back as APIError; fold
+        # them into error-payload dicts so the per-entity log-and-skip
+        # consumers keep their tolerant semantics
+        return [
+            {"error": {"message": response.message, "code": response.code}}
+            if isinstance(response, APIError)
+            else (response if response is not None else {})
+            for response in responses
+        ]
+
+    async def get_many_campaign_insights(self, campaign_ids: List[str],
+                                         date_preset: str = "last_7d",
+                                         fields: Optional[List[str]] = None,
+                                         breakdowns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch insights for multiple campaigns via batched requests
+
+        Args:
+            campaign_ids: Campaign IDs to fetch
+            date_preset: Date range preset
+            fields: Specific fields to retrieve
+            breakdowns: Data breakdowns
+
+        Returns:
+            List of insights responses, in the same order as campaign_ids
+        """
+        qs = self._insights_query(date_preset, _CAMPAIGN_FIELDS, fields, breakdowns)
+        return await self._batch_get([f"{cid}/insights?{qs}" for cid in campaign_ids])
+
+    async def get_many_adset_insights(self, adset_ids: List[str],
+                                      date_preset: str = "last_7d",
+                                      fields: Optional[List[str]] = None,
+                                      breakdowns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch insights for multiple ad sets via batched requests"""
+        qs = self._insights_query(date_preset, _ADSET_FIELDS, fields, breakdowns)
+        return await self._batch_get([f"{aid}/insights?{qs}" for aid in adset_ids])
+
+    async def get_many_ad_insights(self, ad_ids: List[str],
+                                   date_preset: str = "last_7d",
+                                   fields: Optional[List[str]] = None,
+                                   breakdowns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch insights for multiple ads via batched requests"""
+        qs = self._insights_query(date_preset, _AD_FIELDS, fields, breakdowns)
+        return await self._batch_get([f"{aid}/insights?{qs}" for aid in ad_ids])
+
+    async def iter_insight_rows(self, kind: str, entity_ids: List[str],
+                                date_preset: str = "last_7d",
+                                fields: Optional[List[str]] = None,
+                                breakdowns: Optional[List[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield insight rows batch by batch instead of materializing them
+
+        Sub-requests still travel 50 per /batch round trip, but each
+        chunk's rows are yielded before the next chunk is requested, so
+        a consumer that writes rows out as they arrive holds one batch
+        in memory at a time rather than the whole account. Failed
+        sub-requests are logged and skipped, matching the merged-list
+        path.
+
+        Args:
+            kind: Entity kind - "campaign", "adset" or "ad"
+            entity_ids: IDs to fetch, in yield order
+            date_preset: Date range preset
+            fields: Specific fields to retrieve
+            breakdowns: Data breakdowns
+        """
+        qs = self._insights_query(date_preset, _KIND_FIELDS[kind], fields, breakdowns)
+        limit = self.api.BATCH_LIMIT
+        for start in range(0, len(entity_ids), limit):
+            chunk = entity_ids[start:start + limit]
+            responses = await self._batch_get([f"{eid}/insights?{qs}" for eid in chunk])
+            for entity_id, response in zip(chunk, responses):
+                data = response.get("data")
+                if data:
+                    for row in data:
+                        yield row
+                elif "error" in response:
+                    log_debug(f"[WARN] Failed to get insights for {kind} {entity_id}: "
+                              f"{response['error'].get('message', response['error'])}")
+
+    @memoize_insights(ttl=_DAILY_INSIGHTS_TTL)
     async def get_adset_learning_phase(self, adset_id: str) -> Dict[str, Any]:
         """
         Fetch ad set learning phase status
@@ -273,7 +575,7 @@ class InsightsAgent:
             - learning_phase_info: Current learning phase status
             - effective_status: Overall effective status
         """
-        log_debug(f"\n[DEBUG] Fetching learning phase for ad set: {adset_id}")
+        log_debug("\n[DEBUG] Fetching learning phase for ad set: %s", adset_id)
 
         url = f"{self.api_url}/{adset_id}"
         params = {
@@ -294,12 +596,13 @@ class InsightsAgent:
                 "actions_remaining": learning_info.get("actions_remaining_to_exit", 0)
             }
 
-            log_debug(f"Learning phase status: {result['learning_phase_status']}")
+            log_debug("Learning phase status: %s", result['learning_phase_status'])
             return result
         except Exception as e:
-            log_debug(f"Error fetching learning phase: {e}")
+            log_debug("Error fetching learning phase: %s", e)
             raise
 
+    @memoize_insights(ttl=_DAILY_INSIGHTS_TTL)
     async def get_daily_insights(self, entity_id: str, entity_type: str = "campaign",
                                   days: int = 7,
                                   fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -315,119 +618,86 @@ class InsightsAgent:
         Returns:
             List of daily insights data
         """
-        log_debug(f"\n[DEBUG] Fetching daily insights for {entity_type}: {entity_id}")
-
-        if not fields:
-            fields = [
-                "impressions", "clicks", "spend", "reach", "frequency",
-                "ctr", "cpc", "cpm", "actions", "action_values",
-                "inline_link_clicks", "inline_link_click_ctr",
-                "date_start", "date_stop"
-            ]
-
-        url = f"{self.api_url}/{entity_id}/insights"
-        params = {
-            "date_preset": f"last_{days}d",
-            "time_increment": "1",  # Daily breakdown
-            "fields": ",".join(fields)
-        }
+        log_debug("\n[DEBUG] Fetching daily insights for %s: %s", entity_type, entity_id)
 
         try:
-            response = await self._make_request("GET", url, params=params)
-            daily_data = response.get("data", [])
-            log_debug(f"Retrieved {len(daily_data)} days of insights")
+            daily_data = [row async for row in self.iter_daily_insights(entity_id, entity_type, days, fields)]
+            log_debug("Retrieved %s days of insights", len(daily_data))
             return daily_data
         except Exception as e:
-            log_debug(f"Error fetching daily insights: {e}")
+            log_debug("Error fetching daily insights: %s", e)
             raise
 
-    def calculate_rolling_cost_per_result(self, daily_insights: List[Dict[str, Any]],
-                                          result_action_types: List[str] = None) -> float:
+    async def iter_daily_insights(self, entity_id: str, entity_type: str = "campaign",
+                                  days: int = 7,
+                                  fields: Optional[List[str]] = None) -> AsyncIterator[Dict[str, Any]]:
         """
-        Calculate 7-day rolling cost per result
+        Yield daily insight rows one page at a time
 
-        Args:
-            daily_insights: List of daily insight data
-            result_action_types: Action types to count as results (leads, calls, etc.)
-
-        Returns:
-            Rolling cost per result value
+        Follows Meta's paging cursors, so long windows (90-day rollups and
+        beyond) come back complete while only one response page is held in
+        memory at a time. get_daily_insights wraps this for callers that
+        want the full list.
         """
-        if not result_action_types:
-            result_action_types = [
-                "lead", "onsite_conversion.lead_grouped",
-                "contact_call_click", "onsite_web_call",
-                "onsite_conversion.messaging_conversation_started_7d",
-                "onsite_conversion.messaging_first_reply"
-            ]
-
-        total_spend = 0.0
-        total_results = 0
-
-        for day_data in daily_insights:
-            total_spend += float(day_data.get("spend", 0))
+        url = _insights_url(entity_id)
+        params = {
+            "date_preset": f"last_{days}d",
+            "time_increment": "1",  # Daily breakdown
+            "fields": ",".join(fields) if fields else _ACCOUNT_FIELDS
+        }
 
-            actions = day_data.get("actions", [])
-            for action in actions:
-                if action.get("action_type") in result_action_types:
-                    total_results += int(action.get("value", 0))
+        while True:
+            response = await self._make_request("GET", url, params=dict(params))
+            for row in response.get("data", []):
+                yield row
 
-        if total_results > 0:
-            return total_spend / total_results
-        return 0.0
+            paging = response.get("paging", {})
+            after = paging.get("cursors", {}).get("after")
+            if not after or "next" not in paging:
+                return
+            params["after"] = after
 
-    def calculate_results_per_day(self, daily_insights: List[Dict[str, Any]],
-                                  result_action_types: List[str] = None) -> float:
+    def _aggregate_daily(self, daily_insights: List[Dict[str, Any]],
+                         result_action_types: List[str] = None) -> Dict[str, float]:
         """
-        Calculate average results per day
+        Fused single-pass aggregation over daily insights
 
-        Args:
-            daily_insights: List of daily insight data
-            result_action_types: Action types to count as results
+        Rolling cost per result, results per day and the CPM trend all
+        walk the same daily rows; computing them in one date-ordered pass
+        (and one scan of each day's nested actions) avoids traversing and
+        float-converting the list three times over.
 
         Returns:
-            Average results per day
+            Dict with rolling_cost_per_result, results_per_day and cpm_trend
         """
-        if not result_action_types:
-            result_action_types = [
-                "lead", "onsite_conversion.lead_grouped",
-                "contact_call_click", "onsite_web_call",
-                "onsite_conversion.messaging_conversation_started_7d",
-                "onsite_conversion.messaging_first_reply"
-            ]
+        result_types = frozenset(result_action_types) if result_action_types else _DEFAULT_RESULT_TYPES
 
+        total_spend = 0.0
         total_results = 0
-        days_with_data = len(daily_insights)
+        cpm_values = []
+
+        for day_data in sorted(daily_insights, key=lambda x: x.get("date_start", "")):
+            total_spend += float(day_data.get("spend", 0))
+
+            cpm = float(day_data.get("cpm", 0))
+            if cpm > 0:
+                cpm_values.append(cpm)
 
-        for day_data in daily_insights:
             actions = day_data.get("actions", [])
             for action in actions:
-                if action.get("action_type") in result_action_types:
+                if action.get("action_type") in result_types:
                     total_results += int(action.get("value", 0))
 
-        if days_with_data > 0:
-            return total_results / days_with_data
-        return 0.0
-
-    def calculate_cpm_trend(self, daily_insights: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Calculate CPM trend over the period
-
-        Args:
-            daily_insights: List of daily insight data
-
-        Returns:
-            Dictionary with trend direction and percentage change
-        """
-        if len(daily_insights) < 2:
-            return {"trend": "insufficient_data", "change_percent": 0.0}
-
-        # Sort by date
-        sorted_data = sorted(daily_insights, key=lambda x: x.get("date_start", ""))
-
-        # Get CPM values
-        cpm_values = [float(d.get("cpm", 0)) for d in sorted_data if float(d.get("cpm", 0)) > 0]
+        days_with_data = len(daily_insights)
+        return {
+            "rolling_cost_per_result": total_spend / total_results if total_results > 0 else 0.0,
+            "results_per_day": total_results / days_with_data if days_with_data > 0 else 0.0,
+            "cpm_trend": self._cpm_trend_from_values(cpm_values)
+        }
 
+    @staticmethod
+    def _cpm_trend_from_values(cpm_values: List[float]) -> Dict[str, Any]:
+        """Derive trend direction from date-ordered positive CPM values"""
         if len(cpm_values) < 2:
             return {"trend": "insufficient_data", "change_percent": 0.0}
 
@@ -456,6 +726,46 @@ class InsightsAgent:
             "second_period_avg": round(second_half_avg, 2)
         }
 
+    def calculate_rolling_cost_per_result(self, daily_insights: List[Dict[str, Any]],
+                                          result_action_types: List[str] = None) -> float:
+        """
+        Calculate 7-day rolling cost per result
+
+        Args:
+            daily_insights: List of daily insight data
+            result_action_types: Action types to count as results (leads, calls, etc.)
+
+        Returns:
+            Rolling cost per result value
+        """
+        return self._aggregate_daily(daily_insights, result_action_types)["rolling_cost_per_result"]
+
+    def calculate_results_per_day(self, daily_insights: List[Dict[str, Any]],
+                                  result_action_types: List[str] = None) -> float:
+        """
+        Calculate average results per day
+
+        Args:
+            daily_insights: List of daily insight data
+            result_action_types: Action types to count as results
+
+        Returns:
+            Average results per day
+        """
+        return self._aggregate_daily(daily_insights, result_action_types)["results_per_day"]
+
+    def calculate_cpm_trend(self, daily_insights: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Calculate CPM trend over the period
+
+        Args:
+            daily_insights: List of daily insight data
+
+        Returns:
+            Dictionary with trend direction and percentage change
+        """
+        return self._aggregate_daily(daily_insights)["cpm_trend"]
+
     def extract_primary_result(self, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Extract primary conversion result (Leads, Calls, or WhatsApp)
@@ -466,30 +776,16 @@ class InsightsAgent:
         Returns:
             Dictionary with result type and count
         """
-        # Priority order for primary results
-        result_mappings = {
-            "lead": ("Lead", ["lead", "onsite_conversion.lead_grouped"]),
-            "call": ("Call", ["contact_call_click", "onsite_web_call", "phone_call"]),
-            "whatsapp": ("WhatsApp", [
-                "onsite_conversion.messaging_conversation_started_7d",
-                "onsite_conversion.messaging_first_reply",
-                "onsite_conversion.messaging_welcome_message_view"
-            ])
-        }
-
         results = {"Lead": 0, "Call": 0, "WhatsApp": 0}
 
         for action in actions:
-            action_type = action.get("action_type", "")
-            value = int(action.get("value", 0))
+            result_name = _ACTION_TYPE_TO_RESULT.get(action.get("action_type", ""))
+            if result_name:
+                results[result_name] += int(action.get("value", 0))
 
-            for result_name, action_types in result_mappings.values():
-                if action_type in action_types:
-                    results[result_name] += value
-
-        # Find primary result (highest count)
-        primary_type = max(results, key=results.get)
-        primary_count = results[primary_type]
+        # Find primary result (highest count) - itemgetter keeps the
+        # compare loop in C and avoids a second lookup for the count
+        primary_type, primary_count = max(results.items(), key=itemgetter(1))
 
         if primary_count == 0:
             return {"type": None, "count": 0, "all_results": results}
@@ -501,7 +797,33 @@ class InsightsAgent:
         }
 
     def parse_insight_metrics(self, insight_data: Dict[str, Any]) -> InsightMetrics:
-        """Parse raw insight data into InsightMetrics object"""
+        """Parse raw insight data into InsightMetrics object
+
+        Parsing is a pure function of the input row, so results are
+        memoized per agent on a deep-frozen key - overlapping report
+        windows re-submit many identical rows. Hits hand back a field
+        copy so callers can keep annotating their instance freely;
+        rows that cannot be frozen just parse directly.
+        """
+        try:
+            key = _freeze_deep(insight_data)
+        except TypeError:
+            return self._parse_insight_metrics(insight_data)
+
+        memo = self._parse_memo
+        cached = memo.get(key)
+        if cached is not None:
+            memo.move_to_end(key)
+            return replace(cached)
+
+        metrics = self._parse_insight_metrics(insight_data)
+        memo[key] = metrics
+        if len(memo) > _PARSE_MEMO_MAX_ENTRIES:
+            memo.popitem(last=False)
+        return replace(metrics)
+
+    def _parse_insight_metrics(self, insight_data: Dict[str, Any]) -> InsightMetrics:
+        """Parse one raw insight row, uncached"""
         metrics = InsightMetrics()
 
         metrics.impressions = int(insight_data.get("impressions", 0))
@@ -524,14 +846,21 @@ class InsightsAgent:
             metrics.action_values = insight_data["action_values"]
 
         if metrics.actions:
+            # One pass picks up conversions and primary-result counts
+            # together instead of scanning the action list twice
+            results = {"Lead": 0, "Call": 0, "WhatsApp": 0}
             for action in metrics.actions:
-                if action.get("action_type") == "offsite_conversion.post_click":
+                action_type = action.get("action_type", "")
+                if action_type == "offsite_conversion.post_click":
                     metrics.conversions = int(action.get("value", 0))
+                result_name = _ACTION_TYPE_TO_RESULT.get(action_type)
+                if result_name:
+                    results[result_name] += int(action.get("value", 0))
 
-            # Extract primary result (Lead, Call, or WhatsApp)
-            primary_result = self.extract_primary_result(metrics.actions)
-            metrics.primary_result_type = primary_result["type"]
-            metrics.primary_result_count = primary_result["count"]
+            primary_type, primary_count = max(results.items(), key=itemgetter(1))
+            if primary_count > 0:
+                metrics.primary_result_type = primary_type
+                metrics.primary_result_count = primary_count
 
         # Parse learning phase status if available
         if "learning_phase_info" in insight_data:
@@ -547,8 +876,8 @@ class InsightsAgent:
         # Calculate daily spend if date range is available
         if metrics.date_start and metrics.date_stop:
             try:
-                start = datetime.strptime(metrics.date_start, "%Y-%m-%d")
-                stop = datetime.strptime(metrics.date_stop, "%Y-%m-%d")
+                start = _parse_ymd(metrics.date_start)
+                stop = _parse_ymd(metrics.date_stop)
                 days = (stop - start).days + 1
                 if days > 0:
                     metrics.daily_spend = metrics.spend / days
@@ -611,37 +940,47 @@ class InsightsAgent:
         Returns:
             Enhanced insights dictionary with all metrics
         """
-        log_debug(f"\n[DEBUG] Fetching enhanced insights for {entity_type}: {entity_id}")
+        log_debug("\n[DEBUG] Fetching enhanced insights for %s: %s", entity_type, entity_id)
 
-        # Fetch standard insights
         if entity_type == "campaign":
-            standard_insights = await self.get_campaign_insights(entity_id)
+            standard_coro = self.get_campaign_insights(entity_id)
         elif entity_type == "adset":
-            standard_insights = await self.get_adset_insights(entity_id)
+            standard_coro = self.get_adset_insights(entity_id)
             adset_id = entity_id  # Use the entity ID for learning phase
         elif entity_type == "ad":
-            standard_insights = await self.get_ad_insights(entity_id)
+            standard_coro = self.get_ad_insights(entity_id)
         else:
             raise ValueError(f"Invalid entity type: {entity_type}")
 
-        insights_data = standard_insights.get("data", [{}])[0] if standard_insights.get("data") else {}
+        async def _learning_phase() -> Dict[str, Any]:
+            try:
+                return await self.get_adset_learning_phase(adset_id)
+            except Exception as e:
+                log_debug("Could not fetch learning phase: %s", e)
+                return {"learning_phase_status": "UNKNOWN", "is_in_learning": False}
 
-        # Fetch daily insights for rolling calculations
-        daily_insights = await self.get_daily_insights(entity_id, entity_type, days=7)
+        # Standard, daily and learning-phase fetches are independent HTTP
+        # calls - run them concurrently so latency is the max, not the sum
+        if adset_id:
+            standard_insights, daily_insights, learning_phase = await asyncio.gather(
+                standard_coro,
+                self.get_daily_insights(entity_id, entity_type, days=7),
+                _learning_phase()
+            )
+        else:
+            learning_phase = None
+            standard_insights, daily_insights = await asyncio.gather(
+                standard_coro,
+                self.get_daily_insights(entity_id, entity_type, days=7)
+            )
 
-        # Calculate rolling metrics
-        rolling_cost_per_result = self.calculate_rolling_cost_per_result(daily_insights)
-        results_per_day = self.calculate_results_per_day(daily_insights)
-        cpm_trend = self.calculate_cpm_trend(daily_insights)
+        insights_data = standard_insights.get("data", [{}])[0] if standard_insights.get("data") else {}
 
-        # Fetch learning phase status if adset_id is provided
-        learning_phase = None
-        if adset_id:
-            try:
-                learning_phase = await self.get_adset_learning_phase(adset_id)
-            except Exception as e:
-                log_debug(f"Could not fetch learning phase: {e}")
-                learning_phase = {"learning_phase_status": "UNKNOWN", "is_in_learning": False}
+        # Calculate rolling metrics in one pass over the daily data
+        daily_aggregates = self._aggregate_daily(daily_insights)
+        rolling_cost_per_result = daily_aggregates["rolling_cost_per_result"]
+        results_per_day = daily_aggregates["results_per_day"]
+        cpm_trend = daily_aggregates["cpm_trend"]
 
         # Parse standard metrics
         metrics = self.parse_insight_metrics(insights_data)
@@ -703,16 +1042,16 @@ class InsightsAgent:
             "ctr": metrics.ctr,
             "cpc": metrics.cpc,
             # Raw metrics object for further processing
-            "raw_metrics": asdict(metrics)
+            "raw_metrics": {name: getattr(metrics, name) for name in _INSIGHT_FIELDS}
         }
 
-        log_debug(f"Enhanced insights generated successfully")
+        log_debug("Enhanced insights generated successfully")
         return enhanced_insights
 
     def generate_performance_report(self, insights_list: List[Dict[str, Any]],
                                    metric_name: str = "Campaign") -> Dict[str, Any]:
         """Generate comprehensive performance report"""
-        log_debug(f"\n[DEBUG] Generating {metric_name} performance report...")
+        log_debug("\n[DEBUG] Generating %s performance report...", metric_name)
 
         report = {
             "report_type": f"{metric_name} Performance Report",
@@ -734,89 +1073,189 @@ class InsightsAgent:
         if not insights_list:
             return report
 
-        total_ctr = 0
-        total_cpc = 0
-        total_cpm = 0
-        total_roas = 0
+        # Accumulate into locals and write the summary once at the end -
+        # the nested dict writes per row were the bulk of the loop cost
+        total_spend = 0.0
+        total_impressions = 0
+        total_clicks = 0
+        total_conversions = 0
+        total_ctr = 0.0
+        total_cpc = 0.0
+        total_cpm = 0.0
+        total_roas = 0.0
+        details = report["details"]
+
+        # Breakdown queries (device/placement/...) repeat identical rows
+        # for the same entity and window; parse and derive each distinct
+        # row once and reuse the whole record - parsed metrics, derived
+        # metrics and the built detail dict. The key includes the
+        # headline numbers so distinct breakdown slices of the same
+        # entity never collapse together.
+        parse_cache: Dict[tuple, tuple] = {}
 
         for insight in insights_list:
-            metrics = self.parse_insight_metrics(insight)
-            calc_metrics = self.calculate_performance_metrics(metrics)
-
-            report["summary"]["total_spend"] += metrics.spend
-            report["summary"]["total_impressions"] += metrics.impressions
-            report["summary"]["total_clicks"] += metrics.clicks
-            report["summary"]["total_conversions"] += metrics.conversions
+            cache_key = (
+                insight.get("campaign_id"), insight.get("adset_id"), insight.get("ad_id"),
+                insight.get("date_start"), insight.get("date_stop"),
+                insight.get("impressions"), insight.get("clicks"), insight.get("spend")
+            )
+            record = parse_cache.get(cache_key)
+            if record is None:
+                metrics = self.parse_insight_metrics(insight)
+                calc_metrics = self.calculate_performance_metrics(metrics)
+                detail = {name: getattr(metrics, name) for name in _INSIGHT_FIELDS}
+                detail.update(calc_metrics)
+                record = (metrics, calc_metrics, detail)
+                parse_cache[cache_key] = record
+            metrics, calc_metrics, detail = record
+
+            total_spend += metrics.spend
+            total_impressions += metrics.impressions
+            total_clicks += metrics.clicks
+            total_conversions += metrics.conversions
 
             total_ctr += metrics.ctr
             total_cpc += metrics.cpc
             total_cpm += metrics.cpm
-            if "roi" in calc_metrics:
-                total_roas += calc_metrics["roi"]
+            total_roas += calc_metrics["roi"]
 
-            detail = asdict(metrics)
-            detail.update(calc_metrics)
-            report["details"].append(detail)
+            # Copy so report consumers can mutate rows independently
+            details.append(dict(detail))
 
         count = len(insights_list)
-        report["summary"]["average_ctr"] = total_ctr / count if count > 0 else 0
-        report["summary"]["average_cpc"] = total_cpc / count if count > 0 else 0
-        report["summary"]["average_cpm"] = total_cpm / count if count > 0 else 0
-        report["summary"]["average_roas"] = total_roas / count if count > 0 else 0
-
-        log_debug(f"Report generated successfully")
+        summary = report["summary"]
+        summary["total_spend"] = total_spend
+        summary["total_impressions"] = total_impressions
+        summary["total_clicks"] = total_clicks
+        summary["total_conversions"] = total_conversions
+        summary["average_ctr"] = total_ctr / count
+        summary["average_cpc"] = total_cpc / count
+        summary["average_cpm"] = total_cpm / count
+        summary["average_roas"] = total_roas / count
+
+        log_debug("Report generated successfully")
         return report
 
+    # Below this many rows the thread handoff costs more than the parse
+    _REPORT_OFFLOAD_THRESHOLD = 1000
+
+    async def generate_performance_report_async(self, insights_list: List[Dict[str, Any]],
+                                                metric_name: str = "Campaign") -> Dict[str, Any]:
+        """Generate a performance report without blocking the event loop
+
+        Parsing thousands of insight rows is pure-Python CPU work; for
+        large lists it runs in a worker thread so concurrent API calls
+        keep making progress. Small lists are processed inline.
+        """
+        if len(insights_list) > self._REPORT_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(
+                self.generate_performance_report, insights_list, metric_name
+            )
+        return self.generate_performance_report(insights_list, metric_name)
+
     def export_to_json(self, data: Dict[str, Any], filename: str) -> str:
         """Export data to JSON file"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
-            log_debug(f"Data exported to {filename}")
+            with open(filename, 'wb') as f:
+                f.write(json_dumps_pretty(data))
+            log_debug("Data exported to %s", filename)
             return filename
         except Exception as e:
-            log_debug(f"Error exporting data: {e}")
+            log_debug("Error exporting data: %s", e)
             raise
 
-    def export_to_csv(self, insights_list: List[Dict[str, Any]], filename: str) -> str:
-        """Export insights to CSV file"""
+    def export_to_csv(self, insights_list: Iterable[Dict[str, Any]], filename: str,
+                      fieldnames: Optional[List[str]] = None) -> str:
+        """Export insights to CSV file
+
+        Accepts any iterable of row dicts and writes in a single pass.
+        Column order comes from the fieldnames argument when given,
+        otherwise from the first row, so the data is never walked twice
+        and generators work without being materialized. Rows are emitted
+        through a plain csv.writer with a generator of value lists, which
+        skips DictWriter's per-row dict-to-list conversion; extra keys in
+        later rows are simply not exported.
+        """
         try:
-            if not insights_list:
-                log_debug("No data to export")
-                return None
-
-            fieldnames = set()
-            for insight in insights_list:
-                fieldnames.update(insight.keys())
-            fieldnames = sorted(list(fieldnames))
-
-            with open(filename, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(insights_list)
-
-            log_debug(f"Data exported to {filename}")
+            rows = iter(insights_list)
+            first = None
+            if fieldnames is None:
+                first = next(rows, None)
+                if first is None:
+                    log_debug("No data to export")
+                    return None
+                fieldnames = sorted(first.keys())
+
+            with open(filename, 'w', newline='', buffering=_CSV_BUFFER_SIZE,
+                      encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                if first is not None:
+                    writer.writerow([first.get(fn, '') for fn in fieldnames])
+                writer.writerows([row.get(fn, '') for fn in fieldnames] for row in rows)
+
+            log_debug("Data exported to %s", filename)
             return filename
         except Exception as e:
-            log_debug(f"Error exporting to CSV: {e}")
+            log_debug("Error exporting to CSV: %s", e)
             raise
 
+    async def export_to_csv_stream(self, rows: AsyncIterator[Dict[str, Any]], filename: str,
+                                   fieldnames: Optional[List[str]] = None) -> tuple:
+        """Write an async stream of insight rows to CSV as they arrive
+
+        Each row hits the (buffered) file the moment its batch lands,
+        so peak memory stays at one batch regardless of how many
+        entities the export covers. Column order comes from fieldnames
+        when given, otherwise from the first row. The file is only
+        created once a row exists.
 
-def validate_date_preset(date_preset: str) -> bool:
-    """Validate date preset value"""
-    valid_presets = [
-        "last_7d", "last_14d", "last_28d", "last_30d", "last_90d",
-        "today", "yesterday", "this_week", "last_week", "last_month",
-        "this_quarter", "last_3m", "lifetime"
-    ]
-    return date_preset in valid_presets
-
-
-def validate_breakdown(breakdown: str) -> bool:
-    """Validate breakdown value"""
-    valid_breakdowns = [
-        "age", "gender", "country", "region", "city", "device",
-        "placement", "platform", "audience_id", "conversion_device",
-        "conversion_destination", "frequency_value", "impression_device"
-    ]
-    return breakdown in valid_breakdowns
+        Returns:
+            (filename, row_count) tuple; filename is None when the
+            stream produced no rows
+        """
+        writer = None
+        count = 0
+        out = None
+        try:
+            async for row in rows:
+                if writer is None:
+                    if fieldnames is None:
+                        fieldnames = sorted(row.keys())
+                    out = open(filename, 'w', newline='', buffering=_CSV_BUFFER_SIZE,
+                               encoding='utf-8')
+                    writer = csv.writer(out)
+                    writer.writerow(fieldnames)
+                writer.writerow([row.get(fn, '') for fn in fieldnames])
+                count += 1
+        except Exception as e:
+            log_debug("Error exporting to CSV: %s", e)
+            raise
+        finally:
+            if out is not None:
+                out.close()
+
+        if writer is None:
+            log_debug("No data to export")
+            return None, 0
+        log_debug("Data exported to %s", filename)
+        return filename, count
+
+
+_VALID_DATE_PRESETS = frozenset({
+    "last_7d", "last_14d", "last_28d", "last_30d", "last_90d",
+    "today", "yesterday", "this_week", "last_week", "last_month",
+    "this_quarter", "last_3m", "lifetime"
+})
+
+_VALID_BREAKDOWNS = frozenset({
+    "age", "gender", "country", "region", "city", "device",
+    "placement", "platform", "audience_id", "conversion_device",
+    "conversion_destination", "frequency_value", "impression_device"
+})
+
+
+# Bound __contains__ methods validate in one C-level hash probe with no
+# Python frame per check; handlers call these in per-breakdown loops
+validate_date_preset = _VALID_DATE_PRESETS.__contains__
+validate_breakdown = _VALID_BREAKDOWNS.__contains__
@@ -2,17 +2,21 @@
 Orchestrator Agent - Central coordination agent for META marketing operations
 """
 
+import asyncio
+import time
+
 from typing import Dict, Any, List
 
 from ..core.api_client import MetaAPIClient
 from ..core.models import CampaignParams, AdSetParams, Campaign, LeadFormParams
 from ..core.exceptions import ValidationError
-from ..core.utils import log_debug
+from ..core.utils import log_debug, log_info, log_section
 
 from .campaign_agent import CampaignAgent
 from .asset_agent import AssetAgent
 from .ad_agent import AdCreationAgent
 from .business_agent import BusinessAgent
+from .insights_agent import InsightsAgent
 
 
 class OrchestratorAgent:
@@ -27,6 +31,10 @@ class OrchestratorAgent:
         self.asset_agent = AssetAgent(self.api)
         self.ad_agent = AdCreationAgent(self.api)
         self.business_agent = BusinessAgent(self.api)
+        # Built on first insights action; see the insights_agent property
+        self._insights_agent = None
+        # Successful credential checks per account, (expiry, result)
+        self._credential_cache: Dict[str, tuple] = {}
         log_debug("[Orchestrator] Initialized with Campaign Agent, Asset Agent, Ad Agent, and Business Agent")
 
     @property
@@ -34,29 +42,62 @@ class OrchestratorAgent:
         """Get access token for use by other agents"""
         return self._access_token
 
+    @property
+    def insights_agent(self) -> InsightsAgent:
+        """Shared InsightsAgent, created lazily on first use
+
+        Lazy so workflows that never touch insights skip building it;
+        shared so its memoized responses and parse caches survive
+        across handler calls instead of dying with per-call instances.
+        """
+        if self._insights_agent is None:
+            self._insights_agent = InsightsAgent(self._access_token, api_client=self.api)
+        return self._insights_agent
+
+    def invalidate_insights(self, entity_id: str) -> None:
+        """Drop cached insight responses for an entity after a write
+
+        No-op when the insights agent has never been built - there is
+        nothing cached to go stale.
+        """
+        if self._insights_agent is not None:
+            self._insights_agent.invalidate_entity(entity_id)
+
+    # Re-check credentials against the API at most once a minute per account
+    _CREDENTIAL_TTL = 60  # seconds
+
     async def validate_credentials(self, ad_account_id: str) -> bool:
-        """Validate that credentials are valid by making a test API call"""
+        """Validate that credentials are valid by making a test API call
+
+        Positive results are cached for a minute so workflows that check
+        credentials before every action only pay one probe per account.
+        """
+        entry = self._credential_cache.get(ad_account_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
         try:
             endpoint = f"/act_{ad_account_id}/campaigns"
             params = {"fields": "id", "limit": 1}
             await self.api.get(endpoint, params=params)
+            self._credential_cache[ad_account_id] = (time.monotonic() + self._CREDENTIAL_TTL, True)
             return True
         except Exception as e:
-            log_debug(f"[Orchestrator] Credential validation failed: {e}")
+            log_debug("[Orchestrator] Credential validation failed: %s", e)
             return False
 
     async def list_ad_accounts(self) -> List[Dict[str, Any]]:
         """List all ad accounts accessible with current access token"""
-        log_debug(f"\n[Orchestrator] Listing ad accounts")
+        log_debug("\n[Orchestrator] Listing ad accounts")
         endpoint = "/me/adaccounts"
         params = {"fields": "id,name,account_status,created_time,currency,timezone_name"}
         try:
             response = await self.api.get(endpoint, params=params)
             accounts = response.get("data", [])
-            log_debug(f"[Orchestrator] Found {len(accounts)} ad account(s)")
+            log_debug("[Orchestrator] Found %s ad account(s)", len(accounts))
             return accounts
         except Exception as e:
-            log_debug(f"[Orchestrator] Failed to list ad accounts: {e}")
+            log_debug("[Orchestrator] Failed to list ad accounts: %s", e)
             raise
 
     async def create_campaign(
@@ -74,9 +115,7 @@ class OrchestratorAgent:
         Returns:
             Created campaign
         """
-        print(f"\n{'='*60}")
-        log_debug(f"[Orchestrator] Starting campaign creation workflow")
-        print(f"{'='*60}")
+        log_section("[Orchestrator] Starting campaign creation workflow")
 
         try:
             campaign = await self.campaign_agent.create_campaign(
@@ -84,12 +123,12 @@ class OrchestratorAgent:
                 campaign_params
             )
 
-            log_debug(f"\n[Orchestrator] Workflow completed successfully")
-            log_debug(f"[Orchestrator] Campaign ID: {campaign.id}")
+            log_debug("\n[Orchestrator] Workflow completed successfully")
+            log_debug("[Orchestrator] Campaign ID: %s", campaign.id)
             return campaign
 
         except Exception as e:
-            log_debug(f"\n[Orchestrator] Workflow failed: {str(e)}")
+            log_debug("\n[Orchestrator] Workflow failed: %s", str(e))
             raise
 
     async def create_campaign_from_json(
@@ -107,7 +146,7 @@ class OrchestratorAgent:
         Returns:
             Created campaign
         """
-        log_debug(f"\n[Orchestrator] Creating campaign from JSON")
+        log_debug("\n[Orchestrator] Creating campaign from JSON")
         try:
             campaign_params = create_campaign_params_from_json(campaign_json)
             campaign = await self.campaign_agent.create_campaign(
@@ -116,7 +155,7 @@ class OrchestratorAgent:
             )
             return campaign
         except ValidationError as e:
-            log_debug(f"[Orchestrator] Validation failed: {str(e)}")
+            log_debug("[Orchestrator] Validation failed: %s", str(e))
             raise
 
     async def create_campaign_with_adsets(
@@ -136,10 +175,8 @@ class OrchestratorAgent:
         Returns:
             Dict with campaign and ad sets
         """
-        print(f"\n{'='*60}")
-        log_debug(f"[Orchestrator] Starting full campaign workflow")
-        log_debug(f"[Orchestrator] Ad sets to create: {len(adset_params_list)}")
-        print(f"{'='*60}")
+        log_section("[Orchestrator] Starting full campaign workflow")
+        log_debug("[Orchestrator] Ad sets to create: %s", len(adset_params_list))
 
         created_resources = {
             "campaign": None,
@@ -156,20 +193,31 @@ class OrchestratorAgent:
             for adset_params in adset_params_list:
                 adset_params.campaign_id = campaign.id
 
-                adset = await self.campaign_agent.create_adset(
-                    ad_account_id,
-                    adset_params
-                )
-                created_resources["adsets"].append(adset)
-
-            log_debug(f"\n[Orchestrator] Full workflow completed")
-            log_debug(f"[Orchestrator] Campaign: {campaign.id}")
-            log_debug(f"[Orchestrator] Ad sets: {len(created_resources['adsets'])}")
+            # Ad set creations only depend on the campaign id, so run them
+            # concurrently; successes are recorded before re-raising so the
+            # rollback below can clean them up
+            results = await asyncio.gather(
+                *(self.campaign_agent.create_adset(ad_account_id, p) for p in adset_params_list),
+                return_exceptions=True
+            )
+            first_error = None
+            for result in results:
+                if isinstance(result, BaseException):
+                    if first_error is None:
+                        first_error = result
+                else:
+                    created_resources["adsets"].append(result)
+            if first_error is not None:
+                raise first_error
+
+            log_debug("\n[Orchestrator] Full workflow completed")
+            log_debug("[Orchestrator] Campaign: %s", campaign.id)
+            log_debug("[Orchestrator] Ad sets: %s", len(created_resources['adsets']))
 
             return created_resources
 
         except Exception as e:
-            log_debug(f"\n[Orchestrator] Workflow failed, initiating rollback")
+            log_debug("\n[Orchestrator] Workflow failed, initiating rollback")
             await self._rollback(created_resources)
             raise
 
@@ -190,10 +238,8 @@ class OrchestratorAgent:
         Returns:
             Dict with campaign and ad sets
         """
-        print(f"\n{'='*60}")
-        log_debug(f"[Orchestrator] Starting full campaign workflow from JSON")
-        log_debug(f"[Orchestrator] Ad sets to create: {len(adsets_json_list)}")
-        print(f"{'='*60}")
+        log_section("[Orchestrator] Starting full campaign workflow from JSON")
+        log_debug("[Orchestrator] Ad sets to create: %s", len(adsets_json_list))
 
         try:
             campaign_params = create_campaign_params_from_json(campaign_json)
@@ -208,22 +254,28 @@ class OrchestratorAgent:
             return result
 
         except ValidationError as e:
-            log_debug(f"[Orchestrator] Validation failed: {str(e)}")
+            log_debug("[Orchestrator] Validation failed: %s", str(e))
             raise
 
     async def _rollback(self, created_resources: Dict):
         """Rollback created resources on failure"""
-        print("[Orchestrator] Rolling back created resources...")
+        log_info("[Orchestrator] Rolling back created resources...")
 
-        for adset in created_resources.get("adsets", []):
+        async def _delete_adset(adset):
             try:
                 await self.campaign_agent.update_adset_status(
                     adset.id,
                     "DELETED"
                 )
-                log_debug(f"[Orchestrator] Deleted ad set: {adset.id}")
+                log_debug("[Orchestrator] Deleted ad set: %s", adset.id)
             except Exception as e:
-                log_debug(f"[Orchestrator] Failed to delete ad set {adset.id}: {e}")
+                log_debug("[Orchestrator] Failed to delete ad set %s: %s", adset.id, e)
+
+        # Deletions are independent - issue them all at once so a failed
+        # 20-adset workflow does not pay 20 serial round-trips to unwind
+        adsets = created_resources.get("adsets", [])
+        if adsets:
+            await asyncio.gather(*(_delete_adset(adset) for adset in adsets))
 
         if campaign := created_resources.get("campaign"):
             try:
@@ -231,9 +283,9 @@ class OrchestratorAgent:
                     campaign.id,
                     "DELETED"
                 )
-                log_debug(f"[Orchestrator] Deleted campaign: {campaign.id}")
+                log_debug("[Orchestrator] Deleted campaign: %s", campaign.id)
             except Exception as e:
-                log_debug(f"[Orchestrator] Failed to delete campaign {campaign.id}: {e}")
+                log_debug("[Orchestrator] Failed to delete campaign %s: %s", campaign.id, e)
 
     async def close(self):
         """Cleanup resources"""
@@ -285,11 +337,8 @@ def create_campaign_params_from_json(json_data: Dict) -> CampaignParams:
         CampaignParams object
     """
     try:
-        if "name" not in json_data:
-            raise ValidationError("Campaign 'name' is required")
-        if "objective" not in json_data:
-            raise ValidationError("Campaign 'objective' is required")
-
+        # CampaignParams enforces required fields itself; checking here
+        # too would just walk the payload twice
         campaign_params = CampaignParams(**json_data)
         return campaign_params
 
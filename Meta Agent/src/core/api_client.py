@@ -2,13 +2,22 @@
 Meta API Client for HTTP communication
 """
 
+import asyncio
 import json
 import httpx
-from typing import Dict
+from typing import AsyncIterator, Dict, List, Optional, Union
+from urllib.parse import urlencode
 
 from .config import Config
 from .exceptions import APIError
-from .utils import log_debug
+from .utils import log_debug, json_loads
+
+# HTTP/2 multiplexing needs the optional h2 package; use it when present
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 
 class MetaAPIClient:
@@ -19,34 +28,282 @@ class MetaAPIClient:
     def __init__(self, access_token: str):
         self.access_token = access_token
         self.base_url = Config.META_API_BASE_URL
+        # One pool for the whole system: enough keepalive connections for
+        # fan-out workflows, token sent once as a default header instead of
+        # being re-appended to every params/json payload
         self.session = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=Config.API_TIMEOUT
+            timeout=Config.API_TIMEOUT,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=64,
+                max_connections=128,
+                keepalive_expiry=30.0
+            ),
+            headers={"Authorization": f"Bearer {access_token}"}
         )
         self.request_count = 0
+        # In-flight GETs by (endpoint, params) so concurrent identical
+        # requests share one network call instead of racing duplicates
+        self._inflight: Dict = {}
+        # Parsed responses by (endpoint, params) alongside their ETag;
+        # repeat GETs send If-None-Match and a 304 skips the body
+        # transfer and the JSON parse entirely
+        self._etag_cache: Dict = {}
+        # Pending coalesced GETs collected within one event-loop tick,
+        # flushed together through the /batch endpoint
+        self._batch_queue: List = []
+        self._batch_flush_scheduled = False
+
+    # Bound on stored conditional-GET responses
+    _ETAG_CACHE_MAX_ENTRIES = 256
 
     async def get(self, endpoint: str, params: Dict = None) -> Dict:
-        """Execute GET request"""
+        """Execute GET request, coalescing identical concurrent requests"""
         params = params or {}
-        params["access_token"] = self.access_token
 
-        log_debug(f"[API] GET {endpoint}")
+        try:
+            key = (endpoint, tuple(sorted(params.items())))
+        except TypeError:
+            # Unhashable param value - skip coalescing for this request
+            key = None
+
+        if key is None:
+            return await self._get(endpoint, params)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            log_debug("[API] GET %s (coalesced with in-flight request)", endpoint)
+            return await inflight
 
+        task = asyncio.ensure_future(self._get(endpoint, params, cache_key=key))
+        self._inflight[key] = task
         try:
-            response = await self.session.get(endpoint, params=params)
-            return self._handle_response(response)
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _get(self, endpoint: str, params: Dict, cache_key=None) -> Dict:
+        """Execute GET request on the wire, using conditional requests
+
+        When a previous response for the same endpoint/params carried an
+        ETag, it is replayed as If-None-Match; a 304 answer reuses the
+        stored parsed body instead of re-downloading and re-parsing it.
+        """
+        log_debug("[API] GET %s", endpoint)
+
+        cached = self._etag_cache.get(cache_key) if cache_key is not None else None
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+
+        try:
+            response = await self.session.get(endpoint, params=params, headers=headers)
+            if cached is not None and response.status_code == 304:
+                log_debug("[API] GET %s (not modified, served from ETag cache)", endpoint)
+                return cached[1]
+
+            result = self._handle_response(response)
+
+            if cache_key is not None:
+                etag = response.headers.get("etag")
+                if etag:
+                    if cache_key not in self._etag_cache and \
+                            len(self._etag_cache) >= self._ETAG_CACHE_MAX_ENTRIES:
+                        self._etag_cache.pop(next(iter(self._etag_cache)))
+                    self._etag_cache[cache_key] = (etag, result)
+
+            return result
         except httpx.TimeoutException:
             raise APIError("Request timeout", status_code=408)
         except httpx.RequestError as e:
             raise APIError(f"Request failed: {str(e)}")
 
+    async def get_paginated(self, endpoint: str, params: Dict = None,
+                            max_items: Optional[int] = None) -> AsyncIterator[Dict]:
+        """Iterate a cursor-paginated endpoint, yielding individual rows
+
+        Follows paging.cursors.after until the endpoint is exhausted or
+        max_items rows have been yielded. The next page is requested
+        *before* the current page's rows are yielded, so network latency
+        overlaps with the caller's processing of the current page. The
+        first page goes through get_coalesced so concurrent list
+        operations (batch actions, gather fan-outs) share one /batch
+        round trip.
+        """
+        params = dict(params or {})
+        page = await self.get_coalesced(endpoint, params=dict(params))
+        yielded = 0
+
+        while True:
+            data = page.get("data", [])
+            paging = page.get("paging", {})
+            after = paging.get("cursors", {}).get("after")
+
+            next_task = None
+            if after and "next" in paging and (max_items is None or yielded + len(data) < max_items):
+                next_params = dict(params)
+                next_params["after"] = after
+                next_task = asyncio.create_task(self.get(endpoint, params=next_params))
+
+            for item in data:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    if next_task is not None:
+                        next_task.cancel()
+                    return
+
+            if next_task is None:
+                return
+            page = await next_task
+
+    async def get_coalesced(self, endpoint: str, params: Dict = None) -> Dict:
+        """GET that packs concurrent callers into one /batch round trip
+
+        Requests issued within the same event-loop tick - typically an
+        asyncio.gather fan-out of list/read operations - are queued and
+        flushed together as a single Graph /batch POST, so N concurrent
+        GETs cost one round trip. A lone request falls back to the plain
+        get() path (keeping its ETag handling); no timer is involved, so
+        solo callers pay only one loop iteration of extra latency.
+        """
+        params = dict(params or {})
+        relative_url = endpoint.lstrip("/")
+        if params:
+            relative_url = f"{relative_url}?{urlencode(params)}"
+
+        future = asyncio.get_running_loop().create_future()
+        self._batch_queue.append((endpoint, params, relative_url, future))
+        if not self._batch_flush_scheduled:
+            self._batch_flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_batch_queue)
+        return await future
+
+    def _flush_batch_queue(self):
+        """Dispatch everything queued since the last flush"""
+        self._batch_flush_scheduled = False
+        queue, self._batch_queue = self._batch_queue, []
+        if not queue:
+            return
+
+        if len(queue) == 1:
+            endpoint, params, _, future = queue[0]
+            task = asyncio.ensure_future(self.get(endpoint, params))
+            task.add_done_callback(lambda t, f=future: self._copy_task_result(t, f))
+            return
+
+        asyncio.ensure_future(self._run_batch_queue(queue))
+
+    @staticmethod
+    def _copy_task_result(task: "asyncio.Task", future: "asyncio.Future"):
+        """Propagate a finished task's outcome onto a waiter future"""
+        if future.done():
+            return
+        exc = task.exception()
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(task.result())
+
+    async def _run_batch_queue(self, queue: List) -> None:
+        """Resolve a flushed queue through one (or few) /batch POSTs"""
+        # Identical concurrent requests share one sub-request
+        unique_urls = []
+        waiters: Dict[str, List] = {}
+        for _, _, relative_url, future in queue:
+            if relative_url not in waiters:
+                waiters[relative_url] = []
+                unique_urls.append(relative_url)
+            waiters[relative_url].append(future)
+
+        log_debug("[API] Coalescing %s GETs into /batch (%s unique)", len(queue), len(unique_urls))
+        try:
+            results = await self.batch(
+                [{"method": "GET", "relative_url": url} for url in unique_urls]
+            )
+        except Exception as e:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for url, result in zip(unique_urls, results):
+            for future in waiters[url]:
+                if not future.done():
+                    # Failed sub-requests raise at the awaiting caller,
+                    # exactly as the un-coalesced get() path would
+                    if isinstance(result, APIError):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+    # Graph API /batch accepts at most 50 sub-requests per call
+    BATCH_LIMIT = 50
+
+    async def batch(self, requests: List[Dict]) -> List[Union[Dict, APIError, None]]:
+        """Execute multiple Graph API calls in batched round trips
+
+        Each entry needs "method" and "relative_url"; an optional "body"
+        dict is form-encoded for sub-request POSTs. Sub-requests are
+        packed 50 per HTTP call and the parsed response bodies come back
+        in request order: APIError instances where a sub-request failed
+        (so batched failures carry the same type a solo request would
+        raise), None where a successful one returned nothing.
+        """
+        entries = []
+        for request in requests:
+            entry = {"method": request["method"], "relative_url": request["relative_url"]}
+            body = request.get("body")
+            if body:
+                entry["body"] = urlencode(body)
+            entries.append(entry)
+
+        results: List[Union[Dict, APIError, None]] = []
+        for start in range(0, len(entries), self.BATCH_LIMIT):
+            chunk = entries[start:start + self.BATCH_LIMIT]
+            log_debug("[API] POST /batch (%s sub-requests)", len(chunk))
+
+            try:
+                response = await self.session.post(
+                    "/", data={"batch": json.dumps(chunk), "include_headers": "false"}
+                )
+                parsed = self._handle_response(response)
+            except httpx.TimeoutException:
+                raise APIError("Request timeout", status_code=408)
+            except httpx.RequestError as e:
+                raise APIError(f"Request failed: {str(e)}")
+
+            for item in parsed:
+                # Graph returns null for sub-requests it never completed
+                code = item.get("code") if item else None
+                body = item.get("body") if item else None
+                payload = json_loads(body) if body else None
+                if code is None or code >= 400:
+                    error = (payload or {}).get("error", {})
+                    results.append(APIError(
+                        message=f"{error.get('message', 'Unknown error')} | payload={payload}",
+                        code=error.get("code"),
+                        status_code=code
+                    ))
+                else:
+                    results.append(payload)
+
+        return results
+
     async def post(self, endpoint: str, json_data: Dict = None) -> Dict:
         """Execute POST request"""
         json_data = json_data or {}
-        json_data["access_token"] = self.access_token
 
-        log_debug(f"[API] POST {endpoint}")
-        log_debug(f"[API] Data: {json.dumps({k: v for k, v in json_data.items() if k != 'access_token'}, indent=2)}")
+        # Writing to a resource makes any stored conditional GET for an
+        # endpoint mentioning it stale; drop those entries
+        resource = endpoint.strip("/").split("/", 1)[0]
+        if resource and self._etag_cache:
+            for key in [k for k in self._etag_cache if resource in k[0]]:
+                del self._etag_cache[key]
+
+        log_debug("[API] POST %s", endpoint)
+        # Lazy so quiet mode never serializes the whole payload
+        log_debug(lambda: f"[API] Data: {json.dumps({k: v for k, v in json_data.items() if k != 'access_token'}, indent=2)}")
 
         try:
             response = await self.session.post(endpoint, json=json_data)
@@ -58,33 +315,35 @@ class MetaAPIClient:
 
     def _handle_response(self, response: httpx.Response) -> Dict:
         """Handle API response and errors"""
-        log_debug(f"[API] Response Status: {response.status_code}")
+        log_debug("[API] Response Status: %s", response.status_code)
 
         if response.status_code >= 400:
             try:
-                error_data = response.json()
+                error_data = json_loads(response.content)
                 try:
-                    log_debug(f"[API] Error Payload: {json.dumps(error_data, indent=2)}")
+                    log_debug(lambda: f"[API] Error Payload: {json.dumps(error_data, indent=2)}")
                 except Exception:
-                    log_debug(f"[API] Error Payload (raw): {error_data}")
+                    log_debug("[API] Error Payload (raw): %s", error_data)
 
                 error_msg = error_data.get("error", {}).get("message", "Unknown error")
                 error_code = error_data.get("error", {}).get("code")
                 error_subcode = error_data.get("error", {}).get("error_subcode")
-                log_debug(f"[API] Error: {error_msg} (Code: {error_code}, Subcode: {error_subcode})")
+                log_debug("[API] Error: %s (Code: %s, Subcode: %s)", error_msg, error_code, error_subcode)
                 raise APIError(
                     message=f"{error_msg} | payload={error_data}",
                     code=error_code,
                     status_code=response.status_code
                 )
-            except json.JSONDecodeError:
+            except ValueError:
+                # Covers stdlib and orjson decode errors alike
                 raise APIError(
                     message=response.text,
                     status_code=response.status_code
                 )
 
-        result = response.json()
-        log_debug(f"[API] Success: {json.dumps(result, indent=2)}")
+        result = json_loads(response.content)
+        # Lazy so quiet mode never serializes the whole response
+        log_debug(lambda: f"[API] Success: {json.dumps(result, indent=2)}")
         return result
 
     async def close(self):
@@ -2,11 +2,25 @@
 Configuration settings for META Marketing Agent System
 """
 
+from typing import NamedTuple
 
-class Config:
-    """System configuration"""
-    META_API_BASE_URL = "https://graph.facebook.com/v24.0"
-    API_TIMEOUT = 30
-    MAX_RETRIES = 3
-    RATE_LIMIT_WINDOW = 3600  # 1 hour
-    RATE_LIMIT_MAX_CALLS = 200
+
+class _Config(NamedTuple):
+    """System configuration
+
+    Frozen as a NamedTuple instance so every attribute read is a C-level
+    tuple slot access instead of a class-dict lookup, and the values are
+    immutable by construction.
+    """
+    META_API_BASE_URL: str = "https://graph.facebook.com/v24.0"
+    API_TIMEOUT: int = 30
+    MAX_RETRIES: int = 3
+    RATE_LIMIT_WINDOW: int = 3600  # 1 hour
+    RATE_LIMIT_MAX_CALLS: int = 200
+
+
+CONFIG = _Config()
+
+# Existing call sites read Config.<FIELD>; keep the old name bound to the
+# frozen instance so they pick up the cheaper access path unchanged
+Config = CONFIG
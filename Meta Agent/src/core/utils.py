@@ -2,6 +2,37 @@
 Utility functions for META Marketing Agent System
 """
 
+import json as _json
+
+# Optional orjson acceleration - roughly 3-5x faster than stdlib json on
+# large insight payloads. Falls back to the standard library when absent.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def json_dumps(obj) -> str:
+    """Serialize to a JSON string using orjson when available"""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return _json.dumps(obj)
+
+
+def json_loads(data):
+    """Parse JSON from str/bytes using orjson when available"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _json.loads(data)
+
+
+def json_dumps_pretty(obj) -> bytes:
+    """Serialize to indented JSON bytes using orjson when available"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+    return _json.dumps(obj, indent=2).encode()
+
+
 # Global quiet mode flag
 QUIET_MODE = False
 
@@ -17,20 +48,40 @@ def is_quiet_mode() -> bool:
     return QUIET_MODE
 
 
-def log_debug(msg: str):
-    """Print debug message only if not in quiet mode"""
+def log_debug(msg, *args):
+    """Print debug message only if not in quiet mode
+
+    Extra arguments are %-formatted into msg lazily, stdlib-logging
+    style, so quiet mode never pays for building the final string.
+    msg may also be a zero-argument callable (typically a lambda around
+    an expensive json.dumps) that is only invoked when printing.
+    """
+    if not QUIET_MODE:
+        if callable(msg):
+            msg = msg()
+        print(msg % args if args else msg)
+
+
+def log_info(msg, *args):
+    """Print info message only if not in quiet mode
+
+    Supports the same lazy forms as log_debug: %-style args and
+    zero-argument callables are only evaluated when actually printing,
+    so quiet mode never pays for message construction.
+    """
     if not QUIET_MODE:
-        print(msg)
+        if callable(msg):
+            msg = msg()
+        print(msg % args if args else msg)
 
 
-def log_info(msg: str):
-    """Print info message (always shown)"""
-    print(msg)
+# Built once - the bars and newlines fold into a single constant, so a
+# banner costs one %-substitution and one write instead of three prints
+_SECTION_BAR = "=" * 70
+_SECTION_TEMPLATE = f"\n{_SECTION_BAR}\n %s\n{_SECTION_BAR}"
 
 
 def log_section(title: str):
     """Print section header"""
     if not QUIET_MODE:
-        print(f"\n{'='*60}")
-        print(f" {title}")
-        print(f"{'='*60}")
+        print(_SECTION_TEMPLATE % title)
@@ -3,1554 +3,1486 @@ JSON-based Campaign and Ad Set Operations
 Handles all operations via JSON action parameter
 """
 
-import json
 import os
+import sys
 import asyncio
+import time
+
+from functools import wraps
 
 from ..agents.orchestrator import OrchestratorAgent, create_adset_params_from_json, create_lead_form_params_from_json
 from ..core.models import CampaignParams
-from ..core.exceptions import ValidationError
+from ..core.exceptions import APIError, ValidationError
+from ..core.utils import json_dumps, log_info, log_section, set_quiet_mode
 from ..agents.asset_agent import AssetValidationError, AssetUploadError
-from ..agents.insights_agent import InsightsAgent, validate_date_preset, validate_breakdown
-
-# Global quiet flag for JSON-only output
-QUIET_MODE = False
-
+from ..agents.insights_agent import validate_date_preset, validate_breakdown
 
 def set_operations_quiet_mode(quiet: bool):
-    """Set quiet mode globally for operations"""
-    global QUIET_MODE
-    QUIET_MODE = quiet
-
-
-def log_info(msg: str):
-    """Print info message only if not in quiet mode"""
-    if not QUIET_MODE:
-        print(msg)
-
-
-def log_section(title: str):
-    """Print section header only if not in quiet mode"""
-    if not QUIET_MODE:
-        print("\n" + "="*70)
-        print(title)
-        print("="*70)
+    """Set quiet mode globally for operations (delegates to core.utils)"""
+    set_quiet_mode(quiet)
+
+
+# Validation messages shared by several handlers, built once
+_ERR_MISSING_CAMPAIGN_ID = "Missing 'campaign_id' in payload"
+_ERR_MISSING_ADSET_ID = "Missing 'adset_id' in payload"
+_ERR_MISSING_UPDATE_TYPE = "Missing 'update_type' in payload (pause/active/delete)"
+
+# update_type -> (Graph status value, past-tense label for the log line)
+_UPDATE_DISPATCH = {
+    "pause": ("PAUSED", "paused"),
+    "active": ("ACTIVE", "activated"),
+    "delete": ("DELETED", "deleted"),
+}
+
+# Campaign/adset/ad/creative metadata rarely changes between consecutive
+# reads; the get handlers cache their results briefly and the matching
+# update handlers invalidate, so repeated dashboard reads skip the
+# network round trip entirely
+_ENTITY_CACHE_TTL = 30  # seconds
+_ENTITY_CACHE_MAX_ENTRIES = 4096
+_entity_cache: dict = {}
+
+
+def _entity_cache_get(kind: str, entity_id: str):
+    """Return a cached entity dict if present and fresh"""
+    entry = _entity_cache.get((kind, entity_id))
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _entity_cache_set(kind: str, entity_id: str, value: dict):
+    """Cache an entity dict with the standard TTL"""
+    if len(_entity_cache) >= _ENTITY_CACHE_MAX_ENTRIES:
+        # Entries are cheap to refetch; a wholesale reset keeps this simple
+        _entity_cache.clear()
+    _entity_cache[(kind, entity_id)] = (time.monotonic() + _ENTITY_CACHE_TTL, value)
+
+
+def _entity_cache_pop(kind: str, entity_id: str):
+    """Drop a cached entity after a write to it"""
+    _entity_cache.pop((kind, entity_id), None)
+
+
+def handler_errors(section: str, require: tuple = ()):
+    """Print the handler's section banner and standardize its failures
+
+    Every handler shared the same try/except scaffolding; wrapping it
+    once keeps the error responses uniform and the handler bodies flat.
+    Required payload keys, given as (key, message) pairs, are checked
+    before the banner prints - malformed requests return at dict-lookup
+    cost without paying any log I/O. Asset errors keep their distinct
+    response type fields.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(orchestrator, ad_account_id, payload):
+            for key, message in require:
+                if not payload.get(key):
+                    return {"status": "error", "message": message}
+            log_section(section)
+            try:
+                return await fn(orchestrator, ad_account_id, payload)
+            except AssetValidationError as e:
+                log_info("\n✗ Validation Error: %s", e)
+                return {"status": "error", "type": "validation", "message": str(e)}
+            except AssetUploadError as e:
+                log_info("\n✗ Upload Error: %s", e)
+                return {"status": "error", "type": "upload", "message": str(e)}
+            except Exception as e:
+                log_info("\n✗ Error: %s", e)
+                return {"status": "error", "message": str(e)}
+        return wrapper
+    return decorator
 
 
+@handler_errors("CREATE CAMPAIGN", require=(("campaign", "Missing 'campaign' object in payload"),))
 async def handle_create_campaign(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Create a campaign"""
-    log_section("CREATE CAMPAIGN")
+    campaign_json = payload.get("campaign")
+    log_info("\n[INFO] Campaign name: %s", campaign_json.get('name'))
+    log_info("[INFO] Campaign objective: %s", campaign_json.get('objective'))
     
-    try:
-        campaign_json = payload.get("campaign")
-        if not campaign_json:
-            raise ValidationError("Missing 'campaign' object in payload")
-        
-        log_info(f"\n[INFO] Campaign name: {campaign_json.get('name')}")
-        log_info(f"[INFO] Campaign objective: {campaign_json.get('objective')}")
-        
-        campaign = await orchestrator.create_campaign_from_json(ad_account_id, campaign_json)
-        
-        log_info(f"\n✓ Campaign created successfully")
-        log_info(f"✓ Campaign ID: {campaign.id}")
-        log_info(f"✓ Campaign Name: {campaign.name}")
-        
-        return {"status": "success", "campaign_id": campaign.id, "name": campaign.name}
+    campaign = await orchestrator.create_campaign_from_json(ad_account_id, campaign_json)
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    log_info("\n✓ Campaign created successfully")
+    log_info("✓ Campaign ID: %s", campaign.id)
+    log_info("✓ Campaign Name: %s", campaign.name)
+    
+    return {"status": "success", "campaign_id": campaign.id, "name": campaign.name}
+
+
+@handler_errors("CREATE CAMPAIGNS (BATCH)", require=(("campaigns", "Missing 'campaigns' array in payload"),))
+async def handle_create_campaigns_batch(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """Create multiple campaigns in batched Graph API round-trips"""
+    campaigns_json = payload.get("campaigns")
+
+    # Validate every campaign locally before any network traffic
+    params_list = [CampaignParams(**campaign_json) for campaign_json in campaigns_json]
+
+    log_info("\n[INFO] Campaigns to create: %s", len(params_list))
+
+    requests = []
+    for params in params_list:
+        # Graph batch sub-request bodies are form-encoded; non-string
+        # values (lists like special_ad_categories) go as JSON
+        body = {k: v if isinstance(v, str) else json_dumps(v)
+                for k, v in params.to_api_dict_view().items()}
+        requests.append({
+            "method": "POST",
+            "relative_url": f"act_{ad_account_id}/campaigns",
+            "body": body
+        })
+
+    responses = await orchestrator.api.batch(requests)
+
+    results = []
+    created = 0
+    for params, response in zip(params_list, responses):
+        if isinstance(response, APIError):
+            results.append({"status": "error", "name": params.name, "message": response.message})
+        elif response and response.get("id"):
+            created += 1
+            results.append({"status": "success", "campaign_id": response["id"], "name": params.name})
+        else:
+            results.append({"status": "error", "name": params.name, "message": "No response from batch"})
+
+    log_info("\n✓ Created %s/%s campaigns via batch", created, len(params_list))
+    return {"status": "success", "created": created, "total": len(params_list), "results": results}
 
 
+@handler_errors("UPDATE CAMPAIGN", require=(("campaign_id", _ERR_MISSING_CAMPAIGN_ID),
+                                            ("update_type", _ERR_MISSING_UPDATE_TYPE)))
 async def handle_update_campaign(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Update a campaign status (pause/active/delete)"""
-    log_section("UPDATE CAMPAIGN")
-    
-    try:
-        campaign_id = payload.get("campaign_id")
-        update_type = payload.get("update_type", "").lower()
-        
-        if not campaign_id:
-            raise ValidationError("Missing 'campaign_id' in payload")
-        if not update_type:
-            raise ValidationError("Missing 'update_type' in payload (pause/active/delete)")
-        
-        log_info(f"\n[INFO] Campaign ID: {campaign_id}")
-        log_info(f"[INFO] Update type: {update_type}")
-        
-        if update_type == "pause":
-            await orchestrator.campaign_agent.pause_campaign(campaign_id)
-            log_info(f"\n✓ Campaign paused successfully")
-            return {"status": "success", "action": "pause"}
-        elif update_type == "active":
-            await orchestrator.campaign_agent.activate_campaign(campaign_id)
-            log_info(f"\n✓ Campaign activated successfully")
-            return {"status": "success", "action": "active"}
-        elif update_type == "delete":
-            await orchestrator.campaign_agent.delete_campaign(campaign_id)
-            log_info(f"\n✓ Campaign deleted successfully")
-            return {"status": "success", "action": "delete"}
-        else:
-            raise ValidationError(f"Invalid update_type: {update_type}. Use pause/active/delete")
-    
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    campaign_id = payload.get("campaign_id")
+    update_type = payload.get("update_type", "").lower()
+
+    log_info("\n[INFO] Campaign ID: %s", campaign_id)
+    log_info("[INFO] Update type: %s", update_type)
+
+    dispatch = _UPDATE_DISPATCH.get(update_type)
+    if dispatch is None:
+        raise ValidationError(f"Invalid update_type: {update_type}. Use pause/active/delete")
+    status, label = dispatch
 
+    _entity_cache_pop("campaign", campaign_id)
+    orchestrator.invalidate_insights(campaign_id)
 
+    result = await orchestrator.campaign_agent.update_campaign_status(campaign_id, status)
+    log_info("\n✓ Campaign %s successfully", label)
+    # The write already carries the post-update state; returning it
+    # saves callers the confirm-read round trip
+    return {"status": "success", "action": update_type, "campaign": result}
+
+
+@handler_errors("LIST AD ACCOUNTS")
 async def handle_list_ad_accounts(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """List all ad accounts accessible with current access token"""
-    log_section("LIST AD ACCOUNTS")
+    accounts = await orchestrator.list_ad_accounts()
     
-    try:
-        accounts = await orchestrator.list_ad_accounts()
-        
-        if not accounts:
-            log_info(f"\n✗ No ad accounts found")
-            return {"status": "success", "accounts": [], "count": 0}
-        
-        log_info(f"\n✓ Found {len(accounts)} ad account(s):")
-        account_list = []
-        for idx, account in enumerate(accounts, 1):
-            acc_id = account.get("id")
-            acc_name = account.get("name")
-            acc_status = account.get("account_status")
-            acc_currency = account.get("currency")
-            acc_timezone = account.get("timezone_name")
-            
-            log_info(f"\n  [{idx}] {acc_name}")
-            log_info(f"      ID: {acc_id}")
-            log_info(f"      Status: {acc_status}")
-            log_info(f"      Currency: {acc_currency}")
-            log_info(f"      Timezone: {acc_timezone}")
-            log_info(f"      Created: {account.get('created_time')}")
-            
-            account_list.append({
-                "id": acc_id,
-                "name": acc_name,
-                "status": acc_status,
-                "currency": acc_currency,
-                "timezone": acc_timezone,
-                "created_time": account.get("created_time")
-            })
-        
-        return {"status": "success", "accounts": account_list, "count": len(accounts)}
+    if not accounts:
+        log_info("\n✗ No ad accounts found")
+        return {"status": "success", "accounts": [], "count": 0}
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
-
-
+    log_info("\n✓ Found %s ad account(s):", len(accounts))
+    account_list = [{
+        "id": account.get("id"),
+        "name": account.get("name"),
+        "status": account.get("account_status"),
+        "currency": account.get("currency"),
+        "timezone": account.get("timezone_name"),
+        "created_time": account.get("created_time")
+    } for account in accounts]
+
+    # One lazily-built write instead of six formatted calls per account
+    log_info(lambda: "\n".join(
+        f"\n  [{idx}] {acc['name']}"
+        f"\n      ID: {acc['id']}"
+        f"\n      Status: {acc['status']}"
+        f"\n      Currency: {acc['currency']}"
+        f"\n      Timezone: {acc['timezone']}"
+        f"\n      Created: {acc['created_time']}"
+        for idx, acc in enumerate(account_list, 1)
+    ))
+
+    return {"status": "success", "accounts": account_list, "count": len(accounts)}
+
+
+@handler_errors("GET CAMPAIGN", require=(("campaign_id", _ERR_MISSING_CAMPAIGN_ID),))
 async def handle_get_campaign(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get campaign details"""
-    log_section("GET CAMPAIGN")
-    
-    try:
-        campaign_id = payload.get("campaign_id")
-        
-        if not campaign_id:
-            raise ValidationError("Missing 'campaign_id' in payload")
-        
-        log_info(f"\n[INFO] Fetching campaign: {campaign_id}")
-        
+    campaign_id = payload.get("campaign_id")
+    log_info("\n[INFO] Fetching campaign: %s", campaign_id)
+
+    campaign_info = _entity_cache_get("campaign", campaign_id)
+    if campaign_info is None:
         campaign_info = await orchestrator.campaign_agent.get_campaign(campaign_id)
-        
-        log_info(f"\n✓ Campaign details:")
-        log_info(f"  ID: {campaign_info.get('id')}")
-        log_info(f"  Name: {campaign_info.get('name')}")
-        log_info(f"  Objective: {campaign_info.get('objective')}")
-        log_info(f"  Status: {campaign_info.get('status')}")
-        log_info(f"  Created: {campaign_info.get('created_time')}")
-        
-        return {"status": "success", "campaign": campaign_info}
+        _entity_cache_set("campaign", campaign_id, campaign_info)
+
+    log_info("\n✓ Campaign details:")
+    log_info("  ID: %s", campaign_info.get('id'))
+    log_info("  Name: %s", campaign_info.get('name'))
+    log_info("  Objective: %s", campaign_info.get('objective'))
+    log_info("  Status: %s", campaign_info.get('status'))
+    log_info("  Created: %s", campaign_info.get('created_time'))
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "campaign": campaign_info}
 
 
+@handler_errors("CREATE AD SET", require=(("adset", "Missing 'adset' object in payload"),))
 async def handle_create_adset(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Create an ad set"""
-    log_section("CREATE AD SET")
+    adset_json = payload.get("adset")
+    log_info("\n[INFO] Ad set name: %s", adset_json.get('name'))
+    log_info("[INFO] Campaign ID: %s", adset_json.get('campaign_id'))
+    log_info("[INFO] Optimization goal: %s", adset_json.get('optimization_goal'))
     
-    try:
-        adset_json = payload.get("adset")
-        if not adset_json:
-            raise ValidationError("Missing 'adset' object in payload")
-        
-        log_info(f"\n[INFO] Ad set name: {adset_json.get('name')}")
-        log_info(f"[INFO] Campaign ID: {adset_json.get('campaign_id')}")
-        log_info(f"[INFO] Optimization goal: {adset_json.get('optimization_goal')}")
-        
-        # Fetch campaign to validate compatibility and budget rules
-        campaign_id = adset_json.get("campaign_id")
-        if campaign_id:
-            try:
+    # Fetch campaign to validate compatibility and budget rules;
+    # shares the entity cache so bulk creates against one campaign
+    # pay a single fetch
+    campaign_id = adset_json.get("campaign_id")
+    if campaign_id:
+        try:
+            campaign_info = _entity_cache_get("campaign", campaign_id)
+            if campaign_info is None:
                 campaign_info = await orchestrator.campaign_agent.get_campaign(campaign_id)
-                campaign_objective = campaign_info.get('objective')
-                log_info(f"[INFO] Campaign objective: {campaign_objective}")
-                
-                # CBO check: if campaign has budget, remove ad set budget
-                campaign_has_budget = bool(campaign_info.get('daily_budget') or campaign_info.get('lifetime_budget'))
-                if campaign_has_budget:
-                    log_info(f"[INFO] Campaign has budget set (CBO). Removing ad set budget fields.")
-                    adset_json.pop('daily_budget', None)
-                    adset_json.pop('lifetime_budget', None)
-            except Exception as e:
-                log_info(f"[WARN] Could not fetch campaign info: {e}")
-        
-        adset_params = create_adset_params_from_json(adset_json)
-        adset = await orchestrator.campaign_agent.create_adset(ad_account_id, adset_params)
-        
-        log_info(f"\n✓ Ad set created successfully")
-        log_info(f"✓ Ad Set ID: {adset.id}")
-        log_info(f"✓ Ad Set Name: {adset.name}")
-        
-        return {"status": "success", "adset_id": adset.id, "name": adset.name}
+                _entity_cache_set("campaign", campaign_id, campaign_info)
+            campaign_objective = campaign_info.get('objective')
+            log_info("[INFO] Campaign objective: %s", campaign_objective)
+            
+            # CBO check: if campaign has budget, remove ad set budget
+            campaign_has_budget = bool(campaign_info.get('daily_budget') or campaign_info.get('lifetime_budget'))
+            if campaign_has_budget:
+                log_info("[INFO] Campaign has budget set (CBO). Removing ad set budget fields.")
+                adset_json.pop('daily_budget', None)
+                adset_json.pop('lifetime_budget', None)
+        except Exception as e:
+            log_info("[WARN] Could not fetch campaign info: %s", e)
+    
+    adset_params = create_adset_params_from_json(adset_json)
+    adset = await orchestrator.campaign_agent.create_adset(ad_account_id, adset_params)
+    
+    log_info("\n✓ Ad set created successfully")
+    log_info("✓ Ad Set ID: %s", adset.id)
+    log_info("✓ Ad Set Name: %s", adset.name)
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "adset_id": adset.id, "name": adset.name}
+
+
+@handler_errors("CREATE AD SETS (BULK)", require=(("adsets", "Missing 'adsets' array in payload"),))
+async def handle_create_adsets_bulk(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """Create multiple ad sets concurrently
+
+    Runs handle_create_adset for every entry at once; the shared entity
+    cache plus in-flight GET coalescing mean the campaign pre-check is
+    fetched once per distinct campaign, not once per ad set.
+    """
+    adsets_json = payload.get("adsets")
+    log_info("\n[INFO] Ad sets to create: %s", len(adsets_json))
 
+    results = await asyncio.gather(
+        *(handle_create_adset(orchestrator, ad_account_id, {"adset": adset_json})
+          for adset_json in adsets_json)
+    )
 
+    created = sum(1 for result in results if result.get("status") == "success")
+    log_info("\n✓ Created %s/%s ad sets", created, len(adsets_json))
+    return {"status": "success", "created": created, "total": len(adsets_json), "results": results}
+
+
+@handler_errors("UPDATE AD SET", require=(("adset_id", _ERR_MISSING_ADSET_ID),
+                                          ("update_type", _ERR_MISSING_UPDATE_TYPE)))
 async def handle_update_adset(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Update an ad set status (pause/active/delete)"""
-    log_section("UPDATE AD SET")
-    
-    try:
-        adset_id = payload.get("adset_id")
-        update_type = payload.get("update_type", "").lower()
-        
-        if not adset_id:
-            raise ValidationError("Missing 'adset_id' in payload")
-        if not update_type:
-            raise ValidationError("Missing 'update_type' in payload (pause/active/delete)")
-        
-        log_info(f"\n[INFO] Ad Set ID: {adset_id}")
-        log_info(f"[INFO] Update type: {update_type}")
-        
-        if update_type == "pause":
-            await orchestrator.campaign_agent.update_adset_status(adset_id, "PAUSED")
-            log_info(f"\n✓ Ad set paused successfully")
-            return {"status": "success", "action": "pause"}
-        elif update_type == "active":
-            await orchestrator.campaign_agent.update_adset_status(adset_id, "ACTIVE")
-            log_info(f"\n✓ Ad set activated successfully")
-            return {"status": "success", "action": "active"}
-        elif update_type == "delete":
-            await orchestrator.campaign_agent.update_adset_status(adset_id, "DELETED")
-            log_info(f"\n✓ Ad set deleted successfully")
-            return {"status": "success", "action": "delete"}
-        else:
-            raise ValidationError(f"Invalid update_type: {update_type}. Use pause/active/delete")
-    
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    adset_id = payload.get("adset_id")
+    update_type = payload.get("update_type", "").lower()
 
+    log_info("\n[INFO] Ad Set ID: %s", adset_id)
+    log_info("[INFO] Update type: %s", update_type)
 
+    dispatch = _UPDATE_DISPATCH.get(update_type)
+    if dispatch is None:
+        raise ValidationError(f"Invalid update_type: {update_type}. Use pause/active/delete")
+    status, label = dispatch
+
+    _entity_cache_pop("adset", adset_id)
+    orchestrator.invalidate_insights(adset_id)
+
+    result = await orchestrator.campaign_agent.update_adset_status(adset_id, status)
+    log_info("\n✓ Ad set %s successfully", label)
+    return {"status": "success", "action": update_type, "adset": result}
+
+
+@handler_errors("GET AD SET", require=(("adset_id", _ERR_MISSING_ADSET_ID),))
 async def handle_get_adset(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get ad set details"""
-    log_section("GET AD SET")
+    adset_id = payload.get("adset_id")
+    log_info("\n[INFO] Fetching ad set: %s", adset_id)
 
-    try:
-        adset_id = payload.get("adset_id")
+    adset_info = _entity_cache_get("adset", adset_id)
+    if adset_info is None:
+        adset_info = await orchestrator.campaign_agent.get_adset(adset_id)
+        _entity_cache_set("adset", adset_id, adset_info)
 
-        if not adset_id:
-            raise ValidationError("Missing 'adset_id' in payload")
+    log_info("\n✓ Ad set details:")
+    log_info("  ID: %s", adset_info.get('id'))
+    log_info("  Name: %s", adset_info.get('name'))
+    log_info("  Campaign ID: %s", adset_info.get('campaign_id'))
+    log_info("  Status: %s", adset_info.get('status'))
+    log_info("  Optimization Goal: %s", adset_info.get('optimization_goal'))
+    log_info("  Created: %s", adset_info.get('created_time'))
 
-        log_info(f"\n[INFO] Fetching ad set: {adset_id}")
+    return {"status": "success", "adset": adset_info}
 
-        adset_info = await orchestrator.campaign_agent.get_adset(adset_id)
 
-        log_info(f"\n✓ Ad set details:")
-        log_info(f"  ID: {adset_info.get('id')}")
-        log_info(f"  Name: {adset_info.get('name')}")
-        log_info(f"  Campaign ID: {adset_info.get('campaign_id')}")
-        log_info(f"  Status: {adset_info.get('status')}")
-        log_info(f"  Optimization Goal: {adset_info.get('optimization_goal')}")
-        log_info(f"  Created: {adset_info.get('created_time')}")
+# Fields projected into list-handler response rows
+_CAMPAIGN_ROW_FIELDS = ("id", "name", "status", "objective")
+_ADSET_ROW_FIELDS = ("id", "name", "status", "campaign_id", "optimization_goal")
+_AD_ROW_FIELDS = ("id", "name", "status", "adset_id", "effective_status")
+_PIXEL_ROW_FIELDS = ("id", "name", "creation_time", "last_fired_time")
+_LEAD_FORM_ROW_FIELDS = ("id", "name", "status", "locale", "leads_count", "created_time")
+
 
-        return {"status": "success", "adset": adset_info}
+def _project_rows(items: list, fields: tuple) -> list:
+    """Project API items (dicts or objects) onto uniform response rows
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    One dict/object check per item instead of one per field, and a
+    single zip-driven dict build per row.
+    """
+    rows = []
+    for item in items:
+        if type(item) is dict:
+            get = item.get
+        else:
+            get = lambda field, item=item: getattr(item, field, None)
+        rows.append(dict(zip(fields, map(get, fields))))
+    return rows
 
 
+@handler_errors("LIST CAMPAIGNS")
 async def handle_list_campaigns(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """List all campaigns in the ad account"""
-    log_section("LIST CAMPAIGNS")
+    campaigns = await orchestrator.campaign_agent.list_campaigns(ad_account_id)
     
-    try:
-        campaigns = await orchestrator.campaign_agent.list_campaigns(ad_account_id)
-        
-        if not campaigns:
-            return {"status": "success", "campaigns": [], "count": 0}
-        
-        campaign_list = []
-        for idx, campaign in enumerate(campaigns, 1):
-            # Handle both dict and object formats
-            campaign_id = campaign.get("id") if isinstance(campaign, dict) else campaign.id
-            campaign_name = campaign.get("name") if isinstance(campaign, dict) else campaign.name
-            campaign_status = campaign.get("status") if isinstance(campaign, dict) else campaign.status
-            campaign_objective = campaign.get("objective") if isinstance(campaign, dict) else campaign.objective
-            
-            campaign_list.append({
-                "id": campaign_id,
-                "name": campaign_name,
-                "status": campaign_status,
-                "objective": campaign_objective
-            })
-        
-        return {"status": "success", "campaigns": campaign_list, "count": len(campaigns)}
+    if not campaigns:
+        return {"status": "success", "campaigns": [], "count": 0}
+    
+    campaign_list = _project_rows(campaigns, _CAMPAIGN_ROW_FIELDS)
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "campaigns": campaign_list, "count": len(campaigns)}
 
 
+@handler_errors("LIST AD SETS")
 async def handle_list_adsets(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """List all ad sets in the ad account or under a specific campaign"""
-    log_section("LIST AD SETS")
+    campaign_id = payload.get("campaign_id")
+    limit = payload.get("limit", 50)
 
-    try:
-        campaign_id = payload.get("campaign_id")
-        limit = payload.get("limit", 50)
+    adsets = await orchestrator.campaign_agent.list_adsets(ad_account_id, campaign_id, limit)
 
-        adsets = await orchestrator.campaign_agent.list_adsets(ad_account_id, campaign_id, limit)
+    if not adsets:
+        return {"status": "success", "adsets": [], "count": 0}
 
-        if not adsets:
-            return {"status": "success", "adsets": [], "count": 0}
+    adset_list = _project_rows(adsets, _ADSET_ROW_FIELDS)
 
-        adset_list = []
-        for adset in adsets:
-            # Handle both dict and object formats
-            adset_id = adset.get("id") if isinstance(adset, dict) else adset.id
-            adset_name = adset.get("name") if isinstance(adset, dict) else adset.name
-            adset_status = adset.get("status") if isinstance(adset, dict) else adset.status
-            adset_campaign_id = adset.get("campaign_id") if isinstance(adset, dict) else getattr(adset, 'campaign_id', None)
-            optimization_goal = adset.get("optimization_goal") if isinstance(adset, dict) else getattr(adset, 'optimization_goal', None)
-
-            adset_list.append({
-                "id": adset_id,
-                "name": adset_name,
-                "status": adset_status,
-                "campaign_id": adset_campaign_id,
-                "optimization_goal": optimization_goal
-            })
-
-        return {"status": "success", "adsets": adset_list, "count": len(adsets)}
-
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "adsets": adset_list, "count": len(adsets)}
 
 
+@handler_errors("LIST ADS")
 async def handle_list_ads(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """List all ads in the ad account or under a specific ad set"""
-    log_section("LIST ADS")
-
-    try:
-        adset_id = payload.get("adset_id")
-        limit = payload.get("limit", 50)
-
-        ads = await orchestrator.ad_agent.list_ads(ad_account_id, adset_id, limit)
+    adset_id = payload.get("adset_id")
+    limit = payload.get("limit", 50)
 
-        if not ads:
-            return {"status": "success", "ads": [], "count": 0}
+    ads = await orchestrator.ad_agent.list_ads(ad_account_id, adset_id, limit)
 
-        ad_list = []
-        for ad in ads:
-            # Handle both dict and object formats
-            ad_id = ad.get("id") if isinstance(ad, dict) else ad.id
-            ad_name = ad.get("name") if isinstance(ad, dict) else ad.name
-            ad_status = ad.get("status") if isinstance(ad, dict) else ad.status
-            ad_adset_id = ad.get("adset_id") if isinstance(ad, dict) else getattr(ad, 'adset_id', None)
-            effective_status = ad.get("effective_status") if isinstance(ad, dict) else getattr(ad, 'effective_status', None)
+    if not ads:
+        return {"status": "success", "ads": [], "count": 0}
 
-            ad_list.append({
-                "id": ad_id,
-                "name": ad_name,
-                "status": ad_status,
-                "adset_id": ad_adset_id,
-                "effective_status": effective_status
-            })
+    ad_list = _project_rows(ads, _AD_ROW_FIELDS)
 
-        return {"status": "success", "ads": ad_list, "count": len(ads)}
-
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "ads": ad_list, "count": len(ads)}
 
 
+@handler_errors("CREATE CREATIVE", require=(("creative", "Missing 'creative' object in payload"),))
 async def handle_create_creative(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Create an ad creative"""
-    log_section("CREATE CREATIVE")
-    try:
-        creative = payload.get("creative")
-        if not creative:
-            raise ValidationError("Missing 'creative' object in payload")
-
-        result = await orchestrator.ad_agent.create_creative(ad_account_id, creative)
+    creative = payload.get("creative")
+    result = await orchestrator.ad_agent.create_creative(ad_account_id, creative)
 
-        log_info(f"\n✓ Creative created: {result.id}")
-        return {"status": "success", "creative_id": result.id, "data": result.data}
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    log_info("\n✓ Creative created: %s", result.id)
+    return {"status": "success", "creative_id": result.id, "data": result.data}
 
 
+@handler_errors("GET CREATIVE", require=(("creative_id", "Missing 'creative_id' in payload"),))
 async def handle_get_creative(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get creative details"""
-    log_section("GET CREATIVE")
-    try:
-        creative_id = payload.get("creative_id")
-        if not creative_id:
-            raise ValidationError("Missing 'creative_id' in payload")
-
+    creative_id = payload.get("creative_id")
+    result = _entity_cache_get("creative", creative_id)
+    if result is None:
         result = await orchestrator.ad_agent.get_creative(creative_id)
-        log_info(f"\n✓ Creative retrieved: {creative_id}")
-        return {"status": "success", "creative_id": creative_id, "data": result}
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+        _entity_cache_set("creative", creative_id, result)
+    log_info("\n✓ Creative retrieved: %s", creative_id)
+    return {"status": "success", "creative_id": creative_id, "data": result}
 
 
+@handler_errors("CREATE AD", require=(("ad", "Missing 'ad' object in payload"),))
 async def handle_create_ad(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Create an ad"""
-    log_section("CREATE AD")
-    try:
-        ad = payload.get("ad")
-        if not ad:
-            raise ValidationError("Missing 'ad' object in payload")
+    ad = payload.get("ad")
+    result = await orchestrator.ad_agent.create_ad(ad_account_id, ad)
 
-        result = await orchestrator.ad_agent.create_ad(ad_account_id, ad)
-
-        log_info(f"\n✓ Ad created: {result.id}")
-        return {"status": "success", "ad_id": result.id, "data": result.data}
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    log_info("\n✓ Ad created: %s", result.id)
+    return {"status": "success", "ad_id": result.id, "data": result.data}
 
 
+@handler_errors("UPDATE AD", require=(("ad_id", "Missing 'ad_id' in payload"),
+                                      ("update", "Missing 'update' object in payload")))
 async def handle_update_ad(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Update an ad"""
-    log_section("UPDATE AD")
-    try:
-        ad_id = payload.get("ad_id")
-        update_fields = payload.get("update")
-        if not ad_id:
-            raise ValidationError("Missing 'ad_id' in payload")
-        if not update_fields:
-            raise ValidationError("Missing 'update' object in payload")
+    ad_id = payload.get("ad_id")
+    update_fields = payload.get("update")
 
-        result = await orchestrator.ad_agent.update_ad(ad_id, update_fields)
+    _entity_cache_pop("ad", ad_id)
+    orchestrator.invalidate_insights(ad_id)
+    result = await orchestrator.ad_agent.update_ad(ad_id, update_fields)
 
-        log_info(f"\n✓ Ad updated: {ad_id}")
-        return {"status": "success", "ad_id": ad_id, "data": result}
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    log_info("\n✓ Ad updated: %s", ad_id)
+    return {"status": "success", "ad_id": ad_id, "data": result}
 
 
+@handler_errors("GET AD", require=(("ad_id", "Missing 'ad_id' in payload"),))
 async def handle_get_ad(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get ad details"""
-    log_section("GET AD")
-    try:
-        ad_id = payload.get("ad_id")
-        if not ad_id:
-            raise ValidationError("Missing 'ad_id' in payload")
-
+    ad_id = payload.get("ad_id")
+    result = _entity_cache_get("ad", ad_id)
+    if result is None:
         result = await orchestrator.ad_agent.get_ad(ad_id)
-        log_info(f"\n✓ Ad retrieved: {ad_id}")
-        return {"status": "success", "ad_id": ad_id, "data": result}
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+        _entity_cache_set("ad", ad_id, result)
+    log_info("\n✓ Ad retrieved: %s", ad_id)
+    return {"status": "success", "ad_id": ad_id, "data": result}
 
 
 # ============================================================================
 # ASSET OPERATIONS
 # ============================================================================
 
+@handler_errors("UPLOAD IMAGE", require=(("filepath", "Missing 'filepath' in payload"),))
 async def handle_upload_image(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Upload image to ad account"""
-    log_section("UPLOAD IMAGE")
+    filepath = payload.get("filepath")
+    width = payload.get("width")
+    height = payload.get("height")
     
-    try:
-        filepath = payload.get("filepath")
-        if not filepath:
-            raise ValidationError("Missing 'filepath' in payload")
-        
-        width = payload.get("width")
-        height = payload.get("height")
-        
-        log_info(f"\n[INFO] Image file: {filepath}")
-        if width and height:
-            log_info(f"[INFO] Image dimensions: {width}x{height}")
-        
-        image_asset = await orchestrator.asset_agent.upload_image(ad_account_id, filepath, width, height)
-        
-        log_info(f"\n✓ Image uploaded successfully")
-        log_info(f"✓ Image Hash: {image_asset.image_hash}")
-        log_info(f"✓ Filename: {image_asset.filename}")
-        log_info(f"✓ Size: {image_asset.size_bytes / 1024:.2f}KB")
-        
-        return {
-            "status": "success",
-            "asset_type": "image",
-            "image_hash": image_asset.image_hash,
-            "filename": image_asset.filename,
-            "size_bytes": image_asset.size_bytes,
-            "width": width,
-            "height": height
-        }
+    log_info("\n[INFO] Image file: %s", filepath)
+    if width and height:
+        log_info("[INFO] Image dimensions: %sx%s", width, height)
     
-    except AssetValidationError as e:
-        log_info(f"\n✗ Validation Error: {e}")
-        return {"status": "error", "type": "validation", "message": str(e)}
-    except AssetUploadError as e:
-        log_info(f"\n✗ Upload Error: {e}")
-        return {"status": "error", "type": "upload", "message": str(e)}
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
-
-
+    image_asset = await orchestrator.asset_agent.upload_image(ad_account_id, filepath, width, height)
+    
+    log_info("\n✓ Image uploaded successfully")
+    log_info("✓ Image Hash: %s", image_asset.image_hash)
+    log_info("✓ Filename: %s", image_asset.filename)
+    log_info(f"✓ Size: {image_asset.size_bytes / 1024:.2f}KB")
+    
+    return {
+        "status": "success",
+        "asset_type": "image",
+        "image_hash": image_asset.image_hash,
+        "filename": image_asset.filename,
+        "size_bytes": image_asset.size_bytes,
+        "width": width,
+        "height": height
+    }
+
+
+@handler_errors("UPLOAD VIDEO", require=(("filepath", "Missing 'filepath' in payload"),))
 async def handle_upload_video(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Upload video to ad account"""
-    log_section("UPLOAD VIDEO")
+    filepath = payload.get("filepath")
+    duration = payload.get("duration")
+    width = payload.get("width")
+    height = payload.get("height")
+    upload_phase = payload.get("upload_phase", "init")
+    chunk_concurrency = payload.get("chunk_concurrency", 4)
+
+    log_info("\n[INFO] Video file: %s", filepath)
+    if duration:
+        log_info("[INFO] Duration: %ss", duration)
+    if width and height:
+        log_info("[INFO] Dimensions: %sx%s", width, height)
+
+    video_asset = await orchestrator.asset_agent.upload_video(
+        ad_account_id, filepath, duration, width, height, upload_phase,
+        chunk_concurrency=chunk_concurrency
+    )
     
-    try:
-        filepath = payload.get("filepath")
-        if not filepath:
-            raise ValidationError("Missing 'filepath' in payload")
-        
-        duration = payload.get("duration")
-        width = payload.get("width")
-        height = payload.get("height")
-        upload_phase = payload.get("upload_phase", "init")
-        
-        log_info(f"\n[INFO] Video file: {filepath}")
-        if duration:
-            log_info(f"[INFO] Duration: {duration}s")
-        if width and height:
-            log_info(f"[INFO] Dimensions: {width}x{height}")
-        
-        video_asset = await orchestrator.asset_agent.upload_video(
-            ad_account_id, filepath, duration, width, height, upload_phase
-        )
-        
-        log_info(f"\n✓ Video uploaded successfully")
-        log_info(f"✓ Video ID: {video_asset.video_id}")
-        log_info(f"✓ Filename: {video_asset.filename}")
-        log_info(f"✓ Size: {video_asset.size_bytes / 1024 / 1024:.2f}MB")
-        log_info(f"✓ Status: {video_asset.status}")
-        
-        return {
-            "status": "success",
-            "asset_type": "video",
-            "video_id": video_asset.video_id,
-            "filename": video_asset.filename,
-            "size_bytes": video_asset.size_bytes,
-            "duration": duration,
-            "width": width,
-            "height": height,
-            "upload_status": video_asset.status
-        }
+    log_info("\n✓ Video uploaded successfully")
+    log_info("✓ Video ID: %s", video_asset.video_id)
+    log_info("✓ Filename: %s", video_asset.filename)
+    log_info(f"✓ Size: {video_asset.size_bytes / 1024 / 1024:.2f}MB")
+    log_info("✓ Status: %s", video_asset.status)
     
-    except AssetValidationError as e:
-        log_info(f"\n✗ Validation Error: {e}")
-        return {"status": "error", "type": "validation", "message": str(e)}
-    except AssetUploadError as e:
-        log_info(f"\n✗ Upload Error: {e}")
-        return {"status": "error", "type": "upload", "message": str(e)}
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
-
-
+    return {
+        "status": "success",
+        "asset_type": "video",
+        "video_id": video_asset.video_id,
+        "filename": video_asset.filename,
+        "size_bytes": video_asset.size_bytes,
+        "duration": duration,
+        "width": width,
+        "height": height,
+        "upload_status": video_asset.status
+    }
+
+
+@handler_errors("GET IMAGE", require=(("image_hash", "Missing 'image_hash' in payload"),))
 async def handle_get_image(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get image details by hash"""
-    log_section("GET IMAGE")
+    image_hash = payload.get("image_hash")
+    log_info("\n[INFO] Image hash: %s", image_hash)
     
-    try:
-        image_hash = payload.get("image_hash")
-        if not image_hash:
-            raise ValidationError("Missing 'image_hash' in payload")
-        
-        log_info(f"\n[INFO] Image hash: {image_hash}")
-        
-        image_data = await orchestrator.asset_agent.get_image(ad_account_id, image_hash)
-        
-        log_info(f"\n✓ Image retrieved successfully")
-        
-        return {
-            "status": "success",
-            "asset_type": "image",
-            "image_hash": image_hash,
-            "data": image_data
-        }
+    image_data = await orchestrator.asset_agent.get_image(ad_account_id, image_hash)
+    
+    log_info("\n✓ Image retrieved successfully")
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "asset_type": "image",
+        "image_hash": image_hash,
+        "data": image_data
+    }
 
 
+@handler_errors("GET VIDEO", require=(("video_id", "Missing 'video_id' in payload"),))
 async def handle_get_video(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get video details by ID"""
-    log_section("GET VIDEO")
+    video_id = payload.get("video_id")
+    log_info("\n[INFO] Video ID: %s", video_id)
     
-    try:
-        video_id = payload.get("video_id")
-        if not video_id:
-            raise ValidationError("Missing 'video_id' in payload")
-        
-        log_info(f"\n[INFO] Video ID: {video_id}")
-        
-        video_data = await orchestrator.asset_agent.get_video(ad_account_id, video_id)
-        
-        log_info(f"\n✓ Video retrieved successfully")
-        
-        return {
-            "status": "success",
-            "asset_type": "video",
-            "video_id": video_id,
-            "data": video_data
-        }
+    video_data = await orchestrator.asset_agent.get_video(ad_account_id, video_id)
+    
+    log_info("\n✓ Video retrieved successfully")
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "asset_type": "video",
+        "video_id": video_id,
+        "data": video_data
+    }
 
 
+@handler_errors("CLEAR ASSET CACHE")
 async def handle_clear_asset_cache(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Clear the asset cache"""
-    log_section("CLEAR ASSET CACHE")
-    
-    try:
-        orchestrator.asset_agent.clear_cache()
-        log_info(f"\n✓ Asset cache cleared successfully")
-        return {"status": "success", "message": "Asset cache cleared"}
-    
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    orchestrator.asset_agent.clear_cache()
+    log_info("\n✓ Asset cache cleared successfully")
+    return {"status": "success", "message": "Asset cache cleared"}
 
 
 # ============================================================================
 # INSIGHTS OPERATIONS
 # ============================================================================
 
+@handler_errors("GET ACCOUNT INSIGHTS")
 async def handle_get_account_insights(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get account level insights"""
-    log_section("GET ACCOUNT INSIGHTS")
+    insights_agent = orchestrator.insights_agent
     
-    try:
-        insights_agent = InsightsAgent(orchestrator.access_token)
-        
-        date_preset = payload.get("date_preset", "last_7d")
-        fields = payload.get("fields")
-        
-        # Validate date preset
-        if not validate_date_preset(date_preset):
-            raise ValidationError(f"Invalid date_preset: {date_preset}")
-        
-        log_info(f"\n[INFO] Account ID: {ad_account_id}")
-        log_info(f"[INFO] Date preset: {date_preset}")
-        
-        response = await insights_agent.get_account_insights(ad_account_id, date_preset, fields)
-        
-        log_info(f"\n✓ Account insights retrieved successfully")
-        
-        return {
-            "status": "success",
-            "insights_type": "account",
-            "account_id": ad_account_id,
-            "data": response
-        }
+    date_preset = payload.get("date_preset", "last_7d")
+    fields = payload.get("fields")
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
-
-
-async def handle_get_campaign_insights(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
-    """Get campaign level insights with enhanced metrics"""
-    log_section("GET CAMPAIGN INSIGHTS")
+    # Validate date preset
+    if not validate_date_preset(date_preset):
+        raise ValidationError(f"Invalid date_preset: {date_preset}")
+    
+    log_info("\n[INFO] Account ID: %s", ad_account_id)
+    log_info("[INFO] Date preset: %s", date_preset)
+    
+    response = await insights_agent.get_account_insights(ad_account_id, date_preset, fields)
+    
+    log_info("\n✓ Account insights retrieved successfully")
+    
+    return {
+        "status": "success",
+        "insights_type": "account",
+        "account_id": ad_account_id,
+        "data": response
+    }
+
+
+# Days covered by each date preset, for spend daily averages. Open
+# presets (this_week, lifetime, ...) have no fixed width and fall back
+# to 7.
+_PRESET_DAYS = {
+    "today": 1, "yesterday": 1, "last_3d": 3, "last_7d": 7,
+    "last_14d": 14, "last_28d": 28, "last_30d": 30, "last_90d": 90,
+}
+
+
+# Enhanced-metrics shape for entities with no activity in the window;
+# _empty_enhanced_metrics hands out copies so handlers can extend them
+_EMPTY_ENHANCED_METRICS = {
+    "spend": {"total": 0.0, "daily_average": 0},
+    "primary_conversion": {"type": None, "count": 0},
+    "cost_per_result": {"current": 0, "rolling_7d": 0.0},
+    "results_per_day": 0.0,
+    "frequency": 0.0,
+    "link_ctr": 0.0,
+    "cpm": {"current": 0.0, "trend": "insufficient_data", "change_percent": 0.0},
+}
+
+
+def _empty_enhanced_metrics() -> dict:
+    """Fresh copy of the no-data enhanced-metrics template
+
+    Empty entities are the common case on new or inactive accounts;
+    cloning a constant skips the float conversions, the primary-result
+    scan and - because the callers short-circuit - the daily-insights
+    round trip that would also come back empty.
+    """
+    return {key: dict(value) if type(value) is dict else value
+            for key, value in _EMPTY_ENHANCED_METRICS.items()}
+
+
+def _build_enhanced_metrics(insights_agent, response: dict, date_preset: str = "last_7d") -> dict:
+    """Build the enhanced-metrics skeleton from a base insights response
+
+    The campaign, ad set and ad insight handlers all assemble the same
+    nested structure from the first data row; building it in one place
+    keeps the three handlers from drifting apart and constructs each
+    dict literal once per call.
+    """
+    insights_data = response.get("data", [{}])[0] if response.get("data") else {}
+    actions = insights_data.get("actions", [])
+    primary_result = insights_agent.extract_primary_result(actions)
+    spend = float(insights_data.get("spend", 0))
+    current_cpr = spend / primary_result["count"] if primary_result["count"] > 0 else 0
+
+    return {
+        "spend": {
+            "total": spend,
+            # Average over the preset's actual window, not a hardcoded 7
+            "daily_average": spend / _PRESET_DAYS.get(date_preset, 7) if spend > 0 else 0
+        },
+        "primary_conversion": {
+            "type": primary_result["type"],
+            "count": primary_result["count"]
+        },
+        "cost_per_result": {
+            "current": round(current_cpr, 2),
+            "rolling_7d": 0.0
+        },
+        "results_per_day": 0.0,
+        "frequency": float(insights_data.get("frequency", 0)),
+        "link_ctr": float(insights_data.get("inline_link_click_ctr", 0)),
+        "cpm": {
+            "current": float(insights_data.get("cpm", 0)),
+            "trend": "insufficient_data",
+            "change_percent": 0.0
+        }
+    }
 
-    try:
-        insights_agent = InsightsAgent(orchestrator.access_token)
 
-        campaign_id = payload.get("campaign_id")
-        if not campaign_id:
-            raise ValidationError("Missing 'campaign_id' in payload")
+def _apply_rolling_metrics(insights_agent, enhanced: dict, daily_insights: list) -> None:
+    """Fill the rolling fields of an enhanced-metrics dict in place
 
-        date_preset = payload.get("date_preset", "last_7d")
-        fields = payload.get("fields")
-        breakdowns = payload.get("breakdowns")
-        include_enhanced = payload.get("include_enhanced", True)  # Default to True
+    Uses the fused single-pass aggregation directly so the daily rows
+    are walked once rather than once per derived metric.
+    """
+    aggregates = insights_agent._aggregate_daily(daily_insights)
+    cpm_trend = aggregates["cpm_trend"]
 
-        # Validate date preset
-        if not validate_date_preset(date_preset):
-            raise ValidationError(f"Invalid date_preset: {date_preset}")
+    enhanced["cost_per_result"]["rolling_7d"] = round(aggregates["rolling_cost_per_result"], 2)
+    enhanced["results_per_day"] = round(aggregates["results_per_day"], 2)
+    enhanced["cpm"]["trend"] = cpm_trend.get("trend")
+    enhanced["cpm"]["change_percent"] = cpm_trend.get("change_percent", 0)
 
-        # Validate breakdowns if provided
-        if breakdowns:
-            for breakdown in breakdowns:
-                if not validate_breakdown(breakdown):
-                    log_info(f"\n[WARNING] Unknown breakdown: {breakdown} (will attempt anyway)")
 
-        log_info(f"\n[INFO] Campaign ID: {campaign_id}")
-        log_info(f"[INFO] Date preset: {date_preset}")
-        if breakdowns:
-            log_info(f"[INFO] Breakdowns: {', '.join(breakdowns)}")
+@handler_errors("GET CAMPAIGN INSIGHTS", require=(("campaign_id", _ERR_MISSING_CAMPAIGN_ID),))
+async def handle_get_campaign_insights(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """Get campaign level insights with enhanced metrics"""
+    insights_agent = orchestrator.insights_agent
+
+    campaign_id = payload.get("campaign_id")
+    date_preset = payload.get("date_preset", "last_7d")
+    fields = payload.get("fields")
+    breakdowns = payload.get("breakdowns")
+    include_enhanced = payload.get("include_enhanced", True)  # Default to True
+
+    # Validate date preset
+    if not validate_date_preset(date_preset):
+        raise ValidationError(f"Invalid date_preset: {date_preset}")
+
+    # Validate breakdowns if provided
+    if breakdowns:
+        for breakdown in breakdowns:
+            if not validate_breakdown(breakdown):
+                log_info("\n[WARNING] Unknown breakdown: %s (will attempt anyway)", breakdown)
+
+    log_info("\n[INFO] Campaign ID: %s", campaign_id)
+    log_info("[INFO] Date preset: %s", date_preset)
+    if breakdowns:
+        log_info("[INFO] Breakdowns: %s", ', '.join(breakdowns))
+
+    # The rolling fetch only needs the id, so start it now and let it
+    # overlap the base insights round trip; enhanced mode awaits it below
+    daily_task = None
+    if include_enhanced:
+        daily_task = asyncio.create_task(
+            insights_agent.get_daily_insights(campaign_id, "campaign", days=7)
+        )
 
+    try:
         response = await insights_agent.get_campaign_insights(campaign_id, date_preset, fields, breakdowns)
+    except BaseException:
+        if daily_task is not None:
+            daily_task.cancel()
+        raise
+
+    result = {
+        "status": "success",
+        "insights_type": "campaign",
+        "campaign_id": campaign_id,
+        "data": response
+    }
+
+    # Add enhanced metrics if requested
+    if include_enhanced:
+        if not response.get("data"):
+            # No activity in the window; the daily fetch would also
+            # come back empty, so drop it and serve the zero template
+            daily_task.cancel()
+            result["enhanced_metrics"] = _empty_enhanced_metrics()
+        else:
+            result["enhanced_metrics"] = _build_enhanced_metrics(insights_agent, response, date_preset)
 
-        result = {
-            "status": "success",
-            "insights_type": "campaign",
-            "campaign_id": campaign_id,
-            "data": response
-        }
-
-        # Add enhanced metrics if requested
-        if include_enhanced:
-            # Parse base insights data
-            insights_data = response.get("data", [{}])[0] if response.get("data") else {}
-            actions = insights_data.get("actions", [])
-            primary_result = insights_agent.extract_primary_result(actions)
-            spend = float(insights_data.get("spend", 0))
-            current_cpr = spend / primary_result["count"] if primary_result["count"] > 0 else 0
-
-            # Initialize enhanced metrics with base data
-            result["enhanced_metrics"] = {
-                "spend": {
-                    "total": spend,
-                    "daily_average": spend / 7 if spend > 0 else 0
-                },
-                "primary_conversion": {
-                    "type": primary_result["type"],
-                    "count": primary_result["count"]
-                },
-                "cost_per_result": {
-                    "current": round(current_cpr, 2),
-                    "rolling_7d": 0.0
-                },
-                "results_per_day": 0.0,
-                "frequency": float(insights_data.get("frequency", 0)),
-                "link_ctr": float(insights_data.get("inline_link_click_ctr", 0)),
-                "cpm": {
-                    "current": float(insights_data.get("cpm", 0)),
-                    "trend": "insufficient_data",
-                    "change_percent": 0.0
-                }
-            }
-
-            # Try to get daily insights for rolling calculations
+            # Rolling calculations ride the task prefetched above
             try:
-                daily_insights = await insights_agent.get_daily_insights(campaign_id, "campaign", days=7)
-                rolling_cpr = insights_agent.calculate_rolling_cost_per_result(daily_insights)
-                results_per_day = insights_agent.calculate_results_per_day(daily_insights)
-                cpm_trend = insights_agent.calculate_cpm_trend(daily_insights)
-
-                result["enhanced_metrics"]["cost_per_result"]["rolling_7d"] = round(rolling_cpr, 2)
-                result["enhanced_metrics"]["results_per_day"] = round(results_per_day, 2)
-                result["enhanced_metrics"]["cpm"]["trend"] = cpm_trend.get("trend")
-                result["enhanced_metrics"]["cpm"]["change_percent"] = cpm_trend.get("change_percent", 0)
+                daily_insights = await daily_task
+                _apply_rolling_metrics(insights_agent, result["enhanced_metrics"], daily_insights)
             except Exception as e:
-                log_info(f"[WARNING] Could not fetch daily insights: {e}")
+                log_info("[WARNING] Could not fetch daily insights: %s", e)
 
-            log_info(f"✓ Enhanced metrics included")
+        log_info("✓ Enhanced metrics included")
 
-        log_info(f"\n✓ Campaign insights retrieved successfully")
+    log_info("\n✓ Campaign insights retrieved successfully")
 
-        return result
-
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return result
 
 
+@handler_errors("GET AD SET INSIGHTS", require=(("adset_id", _ERR_MISSING_ADSET_ID),))
 async def handle_get_adset_insights(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get ad set level insights with enhanced metrics including learning phase"""
-    log_section("GET AD SET INSIGHTS")
-
-    try:
-        insights_agent = InsightsAgent(orchestrator.access_token)
-
-        adset_id = payload.get("adset_id")
-        if not adset_id:
-            raise ValidationError("Missing 'adset_id' in payload")
-
-        date_preset = payload.get("date_preset", "last_7d")
-        fields = payload.get("fields")
-        breakdowns = payload.get("breakdowns")
-        include_enhanced = payload.get("include_enhanced", True)  # Default to True
-
-        # Validate date preset
-        if not validate_date_preset(date_preset):
-            raise ValidationError(f"Invalid date_preset: {date_preset}")
-
-        # Validate breakdowns if provided
-        if breakdowns:
-            for breakdown in breakdowns:
-                if not validate_breakdown(breakdown):
-                    log_info(f"\n[WARNING] Unknown breakdown: {breakdown} (will attempt anyway)")
-
-        log_info(f"\n[INFO] Ad Set ID: {adset_id}")
-        log_info(f"[INFO] Date preset: {date_preset}")
-        if breakdowns:
-            log_info(f"[INFO] Breakdowns: {', '.join(breakdowns)}")
-
-        response = await insights_agent.get_adset_insights(adset_id, date_preset, fields, breakdowns)
-
-        result = {
-            "status": "success",
-            "insights_type": "adset",
-            "adset_id": adset_id,
-            "data": response
-        }
-
-        # Add enhanced metrics if requested
-        if include_enhanced:
-            # Parse base insights data
-            insights_data = response.get("data", [{}])[0] if response.get("data") else {}
-            actions = insights_data.get("actions", [])
-            primary_result = insights_agent.extract_primary_result(actions)
-            spend = float(insights_data.get("spend", 0))
-            current_cpr = spend / primary_result["count"] if primary_result["count"] > 0 else 0
-
-            # Initialize enhanced metrics with base data
-            result["enhanced_metrics"] = {
-                "spend": {
-                    "total": spend,
-                    "daily_average": spend / 7 if spend > 0 else 0
-                },
-                "primary_conversion": {
-                    "type": primary_result["type"],
-                    "count": primary_result["count"]
-                },
-                "cost_per_result": {
-                    "current": round(current_cpr, 2),
-                    "rolling_7d": 0.0
-                },
-                "results_per_day": 0.0,
-                "learning_phase": {
-                    "status": "UNKNOWN",
-                    "is_in_learning": False,
-                    "actions_remaining": 0
-                },
-                "frequency": float(insights_data.get("frequency", 0)),
-                "link_ctr": float(insights_data.get("inline_link_click_ctr", 0)),
-                "cpm": {
-                    "current": float(insights_data.get("cpm", 0)),
-                    "trend": "insufficient_data",
-                    "change_percent": 0.0
-                }
+    insights_agent = orchestrator.insights_agent
+
+    adset_id = payload.get("adset_id")
+    date_preset = payload.get("date_preset", "last_7d")
+    fields = payload.get("fields")
+    breakdowns = payload.get("breakdowns")
+    include_enhanced = payload.get("include_enhanced", True)  # Default to True
+
+    # Validate date preset
+    if not validate_date_preset(date_preset):
+        raise ValidationError(f"Invalid date_preset: {date_preset}")
+
+    # Validate breakdowns if provided
+    if breakdowns:
+        for breakdown in breakdowns:
+            if not validate_breakdown(breakdown):
+                log_info("\n[WARNING] Unknown breakdown: %s (will attempt anyway)", breakdown)
+
+    log_info("\n[INFO] Ad Set ID: %s", adset_id)
+    log_info("[INFO] Date preset: %s", date_preset)
+    if breakdowns:
+        log_info("[INFO] Breakdowns: %s", ', '.join(breakdowns))
+
+    response = await insights_agent.get_adset_insights(adset_id, date_preset, fields, breakdowns)
+
+    result = {
+        "status": "success",
+        "insights_type": "adset",
+        "adset_id": adset_id,
+        "data": response
+    }
+
+    # Add enhanced metrics if requested
+    if include_enhanced:
+        if not response.get("data"):
+            # No activity in the window; skip the learning-phase and
+            # daily round trips and serve the zero template
+            enhanced = _empty_enhanced_metrics()
+            enhanced["learning_phase"] = {
+                "status": "UNKNOWN",
+                "is_in_learning": False,
+                "actions_remaining": 0
             }
-
-            # Try to get learning phase status (separate try/except)
-            try:
-                learning_phase = await insights_agent.get_adset_learning_phase(adset_id)
-                result["enhanced_metrics"]["learning_phase"] = {
+            result["enhanced_metrics"] = enhanced
+        else:
+            enhanced = _build_enhanced_metrics(insights_agent, response, date_preset)
+            enhanced["learning_phase"] = {
+                "status": "UNKNOWN",
+                "is_in_learning": False,
+                "actions_remaining": 0
+            }
+            result["enhanced_metrics"] = enhanced
+
+            # Learning phase and daily insights are independent network
+            # calls - run them together so the block costs the slower of the
+            # two round trips instead of their sum, keeping separate
+            # error handling per result
+            learning_phase, daily_insights = await asyncio.gather(
+                insights_agent.get_adset_learning_phase(adset_id),
+                insights_agent.get_daily_insights(adset_id, "adset", days=7),
+                return_exceptions=True
+            )
+
+            if isinstance(learning_phase, BaseException):
+                log_info("[WARNING] Could not fetch learning phase: %s", learning_phase)
+            else:
+                enhanced["learning_phase"] = {
                     "status": learning_phase.get("learning_phase_status", "UNKNOWN"),
                     "is_in_learning": learning_phase.get("is_in_learning", False),
                     "actions_remaining": learning_phase.get("actions_remaining", 0)
                 }
-                log_info(f"✓ Learning phase: {learning_phase.get('learning_phase_status')}")
-            except Exception as e:
-                log_info(f"[WARNING] Could not fetch learning phase: {e}")
+                log_info("✓ Learning phase: %s", learning_phase.get('learning_phase_status'))
 
-            # Try to get daily insights for rolling calculations (separate try/except)
             try:
-                daily_insights = await insights_agent.get_daily_insights(adset_id, "adset", days=7)
-                rolling_cpr = insights_agent.calculate_rolling_cost_per_result(daily_insights)
-                results_per_day = insights_agent.calculate_results_per_day(daily_insights)
-                cpm_trend = insights_agent.calculate_cpm_trend(daily_insights)
-
-                result["enhanced_metrics"]["cost_per_result"]["rolling_7d"] = round(rolling_cpr, 2)
-                result["enhanced_metrics"]["results_per_day"] = round(results_per_day, 2)
-                result["enhanced_metrics"]["cpm"]["trend"] = cpm_trend.get("trend")
-                result["enhanced_metrics"]["cpm"]["change_percent"] = cpm_trend.get("change_percent", 0)
-                log_info(f"✓ Rolling metrics calculated")
+                if isinstance(daily_insights, BaseException):
+                    raise daily_insights
+                _apply_rolling_metrics(insights_agent, enhanced, daily_insights)
+                log_info("✓ Rolling metrics calculated")
             except Exception as e:
-                log_info(f"[WARNING] Could not fetch daily insights: {e}")
+                log_info("[WARNING] Could not fetch daily insights: %s", e)
 
-            log_info(f"✓ Enhanced metrics included")
+        log_info("✓ Enhanced metrics included")
 
-        log_info(f"\n✓ Ad set insights retrieved successfully")
+    log_info("\n✓ Ad set insights retrieved successfully")
 
-        return result
-
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return result
 
 
+@handler_errors("GET AD INSIGHTS", require=(("ad_id", "Missing 'ad_id' in payload"),))
 async def handle_get_ad_insights(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get ad level insights with enhanced metrics"""
-    log_section("GET AD INSIGHTS")
+    insights_agent = orchestrator.insights_agent
+
+    ad_id = payload.get("ad_id")
+    date_preset = payload.get("date_preset", "last_7d")
+    fields = payload.get("fields")
+    breakdowns = payload.get("breakdowns")
+    include_enhanced = payload.get("include_enhanced", True)  # Default to True
+
+    # Validate date preset
+    if not validate_date_preset(date_preset):
+        raise ValidationError(f"Invalid date_preset: {date_preset}")
+
+    # Validate breakdowns if provided
+    if breakdowns:
+        for breakdown in breakdowns:
+            if not validate_breakdown(breakdown):
+                log_info("\n[WARNING] Unknown breakdown: %s (will attempt anyway)", breakdown)
+
+    log_info("\n[INFO] Ad ID: %s", ad_id)
+    log_info("[INFO] Date preset: %s", date_preset)
+    if breakdowns:
+        log_info("[INFO] Breakdowns: %s", ', '.join(breakdowns))
+
+    # Start the rolling fetch before the base insights await so the two
+    # round trips overlap; enhanced mode awaits it below
+    daily_task = None
+    if include_enhanced:
+        daily_task = asyncio.create_task(
+            insights_agent.get_daily_insights(ad_id, "ad", days=7)
+        )
 
     try:
-        insights_agent = InsightsAgent(orchestrator.access_token)
-
-        ad_id = payload.get("ad_id")
-        if not ad_id:
-            raise ValidationError("Missing 'ad_id' in payload")
-
-        date_preset = payload.get("date_preset", "last_7d")
-        fields = payload.get("fields")
-        breakdowns = payload.get("breakdowns")
-        include_enhanced = payload.get("include_enhanced", True)  # Default to True
-
-        # Validate date preset
-        if not validate_date_preset(date_preset):
-            raise ValidationError(f"Invalid date_preset: {date_preset}")
-
-        # Validate breakdowns if provided
-        if breakdowns:
-            for breakdown in breakdowns:
-                if not validate_breakdown(breakdown):
-                    log_info(f"\n[WARNING] Unknown breakdown: {breakdown} (will attempt anyway)")
-
-        log_info(f"\n[INFO] Ad ID: {ad_id}")
-        log_info(f"[INFO] Date preset: {date_preset}")
-        if breakdowns:
-            log_info(f"[INFO] Breakdowns: {', '.join(breakdowns)}")
-
         response = await insights_agent.get_ad_insights(ad_id, date_preset, fields, breakdowns)
+    except BaseException:
+        if daily_task is not None:
+            daily_task.cancel()
+        raise
+
+    result = {
+        "status": "success",
+        "insights_type": "ad",
+        "ad_id": ad_id,
+        "data": response
+    }
+
+    # Add enhanced metrics if requested
+    if include_enhanced:
+        if not response.get("data"):
+            # No activity in the window; the daily fetch would also
+            # come back empty, so drop it and serve the zero template
+            daily_task.cancel()
+            result["enhanced_metrics"] = _empty_enhanced_metrics()
+        else:
+            result["enhanced_metrics"] = _build_enhanced_metrics(insights_agent, response, date_preset)
 
-        result = {
-            "status": "success",
-            "insights_type": "ad",
-            "ad_id": ad_id,
-            "data": response
-        }
-
-        # Add enhanced metrics if requested
-        if include_enhanced:
-            # Parse base insights data
-            insights_data = response.get("data", [{}])[0] if response.get("data") else {}
-            actions = insights_data.get("actions", [])
-            primary_result = insights_agent.extract_primary_result(actions)
-            spend = float(insights_data.get("spend", 0))
-            current_cpr = spend / primary_result["count"] if primary_result["count"] > 0 else 0
-
-            # Initialize enhanced metrics with base data
-            result["enhanced_metrics"] = {
-                "spend": {
-                    "total": spend,
-                    "daily_average": spend / 7 if spend > 0 else 0
-                },
-                "primary_conversion": {
-                    "type": primary_result["type"],
-                    "count": primary_result["count"]
-                },
-                "cost_per_result": {
-                    "current": round(current_cpr, 2),
-                    "rolling_7d": 0.0
-                },
-                "results_per_day": 0.0,
-                "frequency": float(insights_data.get("frequency", 0)),
-                "link_ctr": float(insights_data.get("inline_link_click_ctr", 0)),
-                "cpm": {
-                    "current": float(insights_data.get("cpm", 0)),
-                    "trend": "insufficient_data",
-                    "change_percent": 0.0
-                }
-            }
-
-            # Try to get daily insights for rolling calculations
+            # Rolling calculations ride the task prefetched above
             try:
-                daily_insights = await insights_agent.get_daily_insights(ad_id, "ad", days=7)
-                rolling_cpr = insights_agent.calculate_rolling_cost_per_result(daily_insights)
-                results_per_day = insights_agent.calculate_results_per_day(daily_insights)
-                cpm_trend = insights_agent.calculate_cpm_trend(daily_insights)
-
-                result["enhanced_metrics"]["cost_per_result"]["rolling_7d"] = round(rolling_cpr, 2)
-                result["enhanced_metrics"]["results_per_day"] = round(results_per_day, 2)
-                result["enhanced_metrics"]["cpm"]["trend"] = cpm_trend.get("trend")
-                result["enhanced_metrics"]["cpm"]["change_percent"] = cpm_trend.get("change_percent", 0)
+                daily_insights = await daily_task
+                _apply_rolling_metrics(insights_agent, result["enhanced_metrics"], daily_insights)
             except Exception as e:
-                log_info(f"[WARNING] Could not fetch daily insights: {e}")
-
-            log_info(f"✓ Enhanced metrics included")
+                log_info("[WARNING] Could not fetch daily insights: %s", e)
+
+        log_info("✓ Enhanced metrics included")
+
+    log_info("\n✓ Ad insights retrieved successfully")
+
+    return result
+
+
+def _merge_insight_responses(ids: list, responses: list, kind: str) -> list:
+    """Flatten batched insight responses, logging per-entity failures
+
+    Sub-requests that failed come back as error payloads rather than
+    raising; their entities are logged and skipped, matching the old
+    per-entity loops, and successful rows merge in input order.
+    """
+    insights_data = []
+    # Bound method alias keeps the per-response lookup out of the loop
+    extend = insights_data.extend
+    for entity_id, response in zip(ids, responses):
+        data = response.get("data")
+        if data:
+            extend(data)
+        elif "error" in response:
+            log_info("[WARN] Failed to get insights for %s %s: %s",
+                     kind, entity_id, response["error"].get("message", response["error"]))
+    return insights_data
+
+
+# Entity kind -> (orchestrator agent attr, streaming lister, batched
+# insights fetcher). One table drives both the performance report and
+# the export handler instead of parallel if/elif chains.
+_INSIGHT_SOURCES = {
+    "campaign": ("campaign_agent", "list_campaigns_stream", "get_many_campaign_insights"),
+    "adset": ("campaign_agent", "list_adsets_stream", "get_many_adset_insights"),
+    "ad": ("ad_agent", "list_ads_stream", "get_many_ad_insights"),
+}
+
+
+async def _windowed_insight_responses(orchestrator, insights_agent, source: tuple,
+                                      ad_account_id: str, date_preset: str,
+                                      breakdowns: list = None) -> tuple:
+    """List entities and fetch their insights in overlapping windows
+
+    Entities stream through the paginated listing, and every time a
+    window fills to the /batch limit its insights call departs
+    immediately - so the insights for page one are on the wire while
+    page two is still downloading, and total time approaches
+    max(listing, insights) instead of their sum.
+
+    Returns:
+        (ids, responses) aligned by position, ready for
+        _merge_insight_responses
+    """
+    agent_attr, streamer, fetcher = source
+    fetch = getattr(insights_agent, fetcher)
+    stream = getattr(getattr(orchestrator, agent_attr), streamer)(ad_account_id)
+    window_size = orchestrator.api.BATCH_LIMIT
+
+    ids = []
+    window = []
+    tasks = []
+    try:
+        async for entity in stream:
+            entity_id = entity.get("id")
+            ids.append(entity_id)
+            window.append(entity_id)
+            if len(window) >= window_size:
+                tasks.append(asyncio.create_task(
+                    fetch(window, date_preset, breakdowns=breakdowns)))
+                window = []
+        if window:
+            tasks.append(asyncio.create_task(
+                fetch(window, date_preset, breakdowns=breakdowns)))
+
+        responses = []
+        for chunk in await asyncio.gather(*tasks):
+            responses.extend(chunk)
+        return ids, responses
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+@handler_errors("GET PERFORMANCE REPORT")
+async def handle_get_performance_report(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """Generate performance report from insights"""
+    insights_agent = orchestrator.insights_agent
 
-        log_info(f"\n✓ Ad insights retrieved successfully")
+    report_type = payload.get("report_type", "campaign").lower()  # campaign, adset, or ad
+    date_preset = payload.get("date_preset", "last_7d")
+    breakdowns = payload.get("breakdowns")
 
-        return result
+    source = _INSIGHT_SOURCES.get(report_type)
+    if source is None:
+        raise ValidationError(f"Invalid report_type: {report_type}. Must be 'campaign', 'adset', or 'ad'")
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    log_info("\n[INFO] Report type: %s", report_type)
+    log_info("[INFO] Date preset: %s", date_preset)
 
+    # Stream the listing and batch insights as windows fill
+    log_info("\n[INFO] Fetching %s insights...", report_type)
+    ids, responses = await _windowed_insight_responses(
+        orchestrator, insights_agent, source, ad_account_id, date_preset, breakdowns)
+    insights_data = _merge_insight_responses(ids, responses, report_type)
 
-async def handle_get_performance_report(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
-    """Generate performance report from insights"""
-    log_section("GET PERFORMANCE REPORT")
+    # Generate report; large row counts parse in a worker thread so
+    # concurrent actions keep making progress on the event loop
+    report = await insights_agent.generate_performance_report_async(insights_data, report_type.capitalize())
     
-    try:
-        insights_agent = InsightsAgent(orchestrator.access_token)
-        
-        report_type = payload.get("report_type", "campaign").lower()  # campaign, adset, or ad
-        date_preset = payload.get("date_preset", "last_7d")
-        breakdowns = payload.get("breakdowns")
-        
-        if report_type not in ["campaign", "adset", "ad"]:
-            raise ValidationError(f"Invalid report_type: {report_type}. Must be 'campaign', 'adset', or 'ad'")
-        
-        log_info(f"\n[INFO] Report type: {report_type}")
-        log_info(f"[INFO] Date preset: {date_preset}")
-        
-        insights_data = None
-        
-        if report_type == "campaign":
-            # Get all campaigns for the account and get their insights
-            log_info(f"\n[INFO] Fetching campaigns insights...")
-            campaigns = await orchestrator.campaign_agent.list_campaigns(ad_account_id)
-            insights_data = []
-            for campaign in campaigns:
-                try:
-                    response = await insights_agent.get_campaign_insights(
-                        campaign.get("id"), date_preset, breakdowns=breakdowns
-                    )
-                    if "data" in response:
-                        insights_data.extend(response["data"])
-                except Exception as e:
-                    log_info(f"[WARN] Failed to get insights for campaign {campaign.get('id')}: {e}")
-
-        elif report_type == "adset":
-            # Get all ad sets and their insights
-            log_info(f"\n[INFO] Fetching ad sets insights...")
-            adsets = await orchestrator.campaign_agent.list_adsets(ad_account_id)
-            insights_data = []
-            for adset in adsets:
-                try:
-                    response = await insights_agent.get_adset_insights(
-                        adset.get("id"), date_preset, breakdowns=breakdowns
-                    )
-                    if "data" in response:
-                        insights_data.extend(response["data"])
-                except Exception as e:
-                    log_info(f"[WARN] Failed to get insights for adset {adset.get('id')}: {e}")
-
-        elif report_type == "ad":
-            # Get all ads and their insights
-            log_info(f"\n[INFO] Fetching ads insights...")
-            ads = await orchestrator.ad_agent.list_ads(ad_account_id)
-            insights_data = []
-            for ad in ads:
-                try:
-                    response = await insights_agent.get_ad_insights(
-                        ad.get("id"), date_preset, breakdowns=breakdowns
-                    )
-                    if "data" in response:
-                        insights_data.extend(response["data"])
-                except Exception as e:
-                    log_info(f"[WARN] Failed to get insights for ad {ad.get('id')}: {e}")
-        
-        # Generate report
-        report = insights_agent.generate_performance_report(insights_data, report_type.capitalize())
-        
-        log_info(f"\n✓ Performance report generated successfully")
-        log_info(f"✓ Total records analyzed: {len(insights_data)}")
-        
-        return {
-            "status": "success",
-            "report_type": report_type,
-            "report": report
-        }
+    log_info("\n✓ Performance report generated successfully")
+    log_info("✓ Total records analyzed: %s", len(insights_data))
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "report_type": report_type,
+        "report": report
+    }
 
 
+@handler_errors("EXPORT INSIGHTS")
 async def handle_export_insights(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Export insights to file"""
-    log_section("EXPORT INSIGHTS")
+    insights_agent = orchestrator.insights_agent
     
-    try:
-        insights_agent = InsightsAgent(orchestrator.access_token)
-        
-        export_format = payload.get("format", "json").lower()  # json or csv
-        insights_type = payload.get("insights_type", "campaign").lower()
-        date_preset = payload.get("date_preset", "last_7d")
-        filename = payload.get("filename", f"insights_{insights_type}_{date_preset}.{export_format}")
-        
-        if export_format not in ["json", "csv"]:
-            raise ValidationError(f"Invalid format: {export_format}. Must be 'json' or 'csv'")
-        
-        log_info(f"\n[INFO] Export format: {export_format}")
-        log_info(f"\n[INFO] Insights type: {insights_type}")
-        log_info(f"\n[INFO] Output file: {filename}")
-        
-        # Collect insights data based on type
-        if insights_type == "campaign":
-            campaigns = await orchestrator.campaign_agent.list_campaigns(ad_account_id)
-            insights_data = []
-            for campaign in campaigns:
-                try:
-                    response = await insights_agent.get_campaign_insights(campaign.get("id"), date_preset)
-                    if "data" in response:
-                        insights_data.extend(response["data"])
-                except Exception as e:
-                    log_info(f"[WARN] Failed to get insights for campaign {campaign.get('id')}: {e}")
-
-        elif insights_type == "adset":
-            adsets = await orchestrator.campaign_agent.list_adsets(ad_account_id)
-            insights_data = []
-            for adset in adsets:
-                try:
-                    response = await insights_agent.get_adset_insights(adset.get("id"), date_preset)
-                    if "data" in response:
-                        insights_data.extend(response["data"])
-                except Exception as e:
-                    log_info(f"[WARN] Failed to get insights for adset {adset.get('id')}: {e}")
-
-        elif insights_type == "ad":
-            ads = await orchestrator.ad_agent.list_ads(ad_account_id)
-            insights_data = []
-            for ad in ads:
-                try:
-                    response = await insights_agent.get_ad_insights(ad.get("id"), date_preset)
-                    if "data" in response:
-                        insights_data.extend(response["data"])
-                except Exception as e:
-                    log_info(f"[WARN] Failed to get insights for ad {ad.get('id')}: {e}")
-        
-        else:
-            raise ValidationError(f"Invalid insights_type: {insights_type}")
-        
-        # Export data
-        if export_format == "json":
-            export_path = insights_agent.export_to_json({"insights": insights_data}, filename)
-        else:  # csv
-            export_path = insights_agent.export_to_csv(insights_data, filename)
-        
-        log_info(f"\n✓ Insights exported successfully")
-        
-        return {
-            "status": "success",
-            "export_format": export_format,
-            "filepath": export_path,
-            "records_count": len(insights_data)
-        }
+    export_format = payload.get("format", "json").lower()  # json or csv
+    insights_type = payload.get("insights_type", "campaign").lower()
+    date_preset = payload.get("date_preset", "last_7d")
+    filename = payload.get("filename", f"insights_{insights_type}_{date_preset}.{export_format}")
+    
+    if export_format not in ["json", "csv"]:
+        raise ValidationError(f"Invalid format: {export_format}. Must be 'json' or 'csv'")
+    
+    log_info("\n[INFO] Export format: %s", export_format)
+    log_info("\n[INFO] Insights type: %s", insights_type)
+    log_info("\n[INFO] Output file: %s", filename)
     
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    source = _INSIGHT_SOURCES.get(insights_type)
+    if source is None:
+        raise ValidationError(f"Invalid insights_type: {insights_type}")
+
+    if export_format == "json":
+        # JSON serializes the whole document, so the rows have to be
+        # materialized anyway - but the fetches still overlap the listing
+        ids, responses = await _windowed_insight_responses(
+            orchestrator, insights_agent, source, ad_account_id, date_preset)
+        insights_data = _merge_insight_responses(ids, responses, insights_type)
+        export_path = insights_agent.export_to_json({"insights": insights_data}, filename)
+        records_count = len(insights_data)
+    else:  # csv - rows stream to disk batch by batch, never all in memory
+        agent_attr, streamer, _ = source
+        stream = getattr(getattr(orchestrator, agent_attr), streamer)(ad_account_id)
+        ids = [entity.get("id") async for entity in stream]
+        rows = insights_agent.iter_insight_rows(insights_type, ids, date_preset)
+        export_path, records_count = await insights_agent.export_to_csv_stream(rows, filename)
+
+    log_info("\n✓ Insights exported successfully")
+
+    return {
+        "status": "success",
+        "export_format": export_format,
+        "filepath": export_path,
+        "records_count": records_count
+    }
 
 
 # ============================================================================
 # LEAD FORM OPERATIONS
 # ============================================================================
 
+@handler_errors("CREATE LEAD FORM",
+                require=(("page_id", "Missing 'page_id' in payload. Lead forms are created on Pages, not Ad Accounts."),
+                         ("lead_form", "Missing 'lead_form' object in payload")))
 async def handle_create_lead_form(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Create a lead form on a Facebook Page"""
-    log_section("CREATE LEAD FORM")
+    # IMPORTANT: Lead forms require page_id, not ad_account_id
+    page_id = payload.get("page_id")
+    lead_form_json = payload.get("lead_form")
 
-    try:
-        # IMPORTANT: Lead forms require page_id, not ad_account_id
-        page_id = payload.get("page_id")
-        if not page_id:
-            raise ValidationError("Missing 'page_id' in payload. Lead forms are created on Pages, not Ad Accounts.")
-
-        lead_form_json = payload.get("lead_form")
-        if not lead_form_json:
-            raise ValidationError("Missing 'lead_form' object in payload")
-
-        log_info(f"\n[INFO] Page ID: {page_id}")
-        log_info(f"[INFO] Form name: {lead_form_json.get('name')}")
-        log_info(f"[INFO] Questions count: {len(lead_form_json.get('questions', []))}")
-
-        lead_form_params = create_lead_form_params_from_json(lead_form_json)
-        lead_form = await orchestrator.business_agent.create_lead_form(page_id, lead_form_params)
-
-        log_info(f"\n✓ Lead form created successfully")
-        log_info(f"✓ Form ID: {lead_form.id}")
-        log_info(f"✓ Form Name: {lead_form.name}")
-
-        return {
-            "status": "success",
-            "form_id": lead_form.id,
-            "name": lead_form.name,
-            "page_id": page_id
-        }
+    log_info("\n[INFO] Page ID: %s", page_id)
+    log_info("[INFO] Form name: %s", lead_form_json.get('name'))
+    log_info("[INFO] Questions count: %s", len(lead_form_json.get('questions', [])))
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    lead_form_params = create_lead_form_params_from_json(lead_form_json)
+    lead_form = await orchestrator.business_agent.create_lead_form(page_id, lead_form_params)
 
+    log_info("\n✓ Lead form created successfully")
+    log_info("✓ Form ID: %s", lead_form.id)
+    log_info("✓ Form Name: %s", lead_form.name)
 
-async def handle_get_lead_form(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
-    """Get lead form details"""
-    log_section("GET LEAD FORM")
+    return {
+        "status": "success",
+        "form_id": lead_form.id,
+        "name": lead_form.name,
+        "page_id": page_id
+    }
 
-    try:
-        form_id = payload.get("form_id")
-        if not form_id:
-            raise ValidationError("Missing 'form_id' in payload")
 
-        log_info(f"\n[INFO] Fetching lead form: {form_id}")
+@handler_errors("GET LEAD FORM", require=(("form_id", "Missing 'form_id' in payload"),))
+async def handle_get_lead_form(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """Get lead form details"""
+    form_id = payload.get("form_id")
+    log_info("\n[INFO] Fetching lead form: %s", form_id)
 
+    # Sync cache probe first - a hit never touches the event loop
+    form_data = orchestrator.business_agent.get_lead_form_cached(form_id)
+    if form_data is None:
         form_data = await orchestrator.business_agent.get_lead_form(form_id)
 
-        log_info(f"\n✓ Lead form retrieved:")
-        log_info(f"  ID: {form_data.get('id')}")
-        log_info(f"  Name: {form_data.get('name')}")
-        log_info(f"  Status: {form_data.get('status')}")
-
-        return {"status": "success", "lead_form": form_data}
+    log_info("\n✓ Lead form retrieved:")
+    log_info("  ID: %s", form_data.get('id'))
+    log_info("  Name: %s", form_data.get('name'))
+    log_info("  Status: %s", form_data.get('status'))
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "lead_form": form_data}
 
 
+@handler_errors("LIST LEAD FORMS",
+                require=(("page_id", "Missing 'page_id' in payload. Lead forms are listed by Page ID."),))
 async def handle_list_lead_forms(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """List all lead forms for a page"""
-    log_section("LIST LEAD FORMS")
-
-    try:
-        # Lead forms are listed by page_id
-        page_id = payload.get("page_id")
-        if not page_id:
-            raise ValidationError("Missing 'page_id' in payload. Lead forms are listed by Page ID.")
-
-        limit = payload.get("limit", 50)
-
-        log_info(f"\n[INFO] Page ID: {page_id}")
+    # Lead forms are listed by page_id
+    page_id = payload.get("page_id")
+    limit = payload.get("limit", 50)
 
-        forms = await orchestrator.business_agent.list_lead_forms(page_id, limit)
+    log_info("\n[INFO] Page ID: %s", page_id)
 
-        if not forms:
-            log_info(f"\n[INFO] No lead forms found for page {page_id}")
-            return {"status": "success", "lead_forms": [], "count": 0}
+    forms = await orchestrator.business_agent.list_lead_forms(page_id, limit)
 
-        form_list = []
-        for form in forms:
-            form_list.append({
-                "id": form.get("id"),
-                "name": form.get("name"),
-                "status": form.get("status"),
-                "locale": form.get("locale"),
-                "leads_count": form.get("leads_count"),
-                "created_time": form.get("created_time")
-            })
+    if not forms:
+        log_info("\n[INFO] No lead forms found for page %s", page_id)
+        return {"status": "success", "lead_forms": [], "count": 0}
 
-        log_info(f"\n✓ Found {len(forms)} lead form(s)")
+    form_list = _project_rows(forms, _LEAD_FORM_ROW_FIELDS)
 
-        return {"status": "success", "lead_forms": form_list, "count": len(forms)}
+    log_info("\n✓ Found %s lead form(s)", len(forms))
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "lead_forms": form_list, "count": len(forms)}
 
 
+@handler_errors("GET LEADS", require=(("form_id", "Missing 'form_id' in payload"),))
 async def handle_get_leads(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get leads from a lead form"""
-    log_section("GET LEADS")
+    form_id = payload.get("form_id")
+    limit = payload.get("limit", 100)
 
-    try:
-        form_id = payload.get("form_id")
-        if not form_id:
-            raise ValidationError("Missing 'form_id' in payload")
-
-        limit = payload.get("limit", 100)
-
-        log_info(f"\n[INFO] Form ID: {form_id}")
-        log_info(f"[INFO] Limit: {limit}")
+    log_info("\n[INFO] Form ID: %s", form_id)
+    log_info("[INFO] Limit: %s", limit)
 
-        leads = await orchestrator.business_agent.get_leads(form_id, limit)
+    leads = await orchestrator.business_agent.get_leads(form_id, limit)
 
-        if not leads:
-            log_info(f"\n[INFO] No leads found for form {form_id}")
-            return {"status": "success", "leads": [], "count": 0}
+    if not leads:
+        log_info("\n[INFO] No leads found for form %s", form_id)
+        return {"status": "success", "leads": [], "count": 0}
 
-        lead_list = []
-        for lead in leads:
-            # Parse field_data into a more usable format
-            field_data = {}
-            for field in lead.get("field_data", []):
-                field_data[field.get("name")] = field.get("values", [])
+    # Parse field_data into name -> values maps; comprehensions keep the
+    # per-field work to one subscript and one .get instead of the append
+    # loop's repeated lookups
+    lead_list = [{
+        "id": lead.get("id"),
+        "created_time": lead.get("created_time"),
+        "field_data": {field["name"]: field.get("values", [])
+                       for field in lead.get("field_data") or ()},
+        "ad_id": lead.get("ad_id"),
+        "ad_name": lead.get("ad_name"),
+        "adset_id": lead.get("adset_id"),
+        "campaign_id": lead.get("campaign_id")
+    } for lead in leads]
 
-            lead_list.append({
-                "id": lead.get("id"),
-                "created_time": lead.get("created_time"),
-                "field_data": field_data,
-                "ad_id": lead.get("ad_id"),
-                "ad_name": lead.get("ad_name"),
-                "adset_id": lead.get("adset_id"),
-                "campaign_id": lead.get("campaign_id")
-            })
+    log_info("\n✓ Found %s lead(s)", len(leads))
 
-        log_info(f"\n✓ Found {len(leads)} lead(s)")
-
-        return {"status": "success", "leads": lead_list, "count": len(leads)}
-
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "leads": lead_list, "count": len(leads)}
 
 
+@handler_errors("GET LEAD", require=(("lead_id", "Missing 'lead_id' in payload"),))
 async def handle_get_lead(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get single lead details"""
-    log_section("GET LEAD")
+    lead_id = payload.get("lead_id")
+    log_info("\n[INFO] Fetching lead: %s", lead_id)
 
-    try:
-        lead_id = payload.get("lead_id")
-        if not lead_id:
-            raise ValidationError("Missing 'lead_id' in payload")
-
-        log_info(f"\n[INFO] Fetching lead: {lead_id}")
-
-        lead_data = await orchestrator.business_agent.get_lead(lead_id)
-
-        # Parse field_data into a more usable format
-        field_data = {}
-        for field in lead_data.get("field_data", []):
-            field_data[field.get("name")] = field.get("values", [])
-
-        result = {
-            "id": lead_data.get("id"),
-            "created_time": lead_data.get("created_time"),
-            "field_data": field_data,
-            "form_id": lead_data.get("form_id"),
-            "ad_id": lead_data.get("ad_id"),
-            "ad_name": lead_data.get("ad_name"),
-            "adset_id": lead_data.get("adset_id"),
-            "adset_name": lead_data.get("adset_name"),
-            "campaign_id": lead_data.get("campaign_id"),
-            "campaign_name": lead_data.get("campaign_name"),
-            "is_organic": lead_data.get("is_organic")
-        }
+    lead_data = await orchestrator.business_agent.get_lead(lead_id)
+
+    # Parse field_data into a name -> values map in one comprehension
+    field_data = {field["name"]: field.get("values", [])
+                  for field in lead_data.get("field_data") or ()}
 
-        log_info(f"\n✓ Lead retrieved: {lead_id}")
+    result = {
+        "id": lead_data.get("id"),
+        "created_time": lead_data.get("created_time"),
+        "field_data": field_data,
+        "form_id": lead_data.get("form_id"),
+        "ad_id": lead_data.get("ad_id"),
+        "ad_name": lead_data.get("ad_name"),
+        "adset_id": lead_data.get("adset_id"),
+        "adset_name": lead_data.get("adset_name"),
+        "campaign_id": lead_data.get("campaign_id"),
+        "campaign_name": lead_data.get("campaign_name"),
+        "is_organic": lead_data.get("is_organic")
+    }
 
-        return {"status": "success", "lead": result}
+    log_info("\n✓ Lead retrieved: %s", lead_id)
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {"status": "success", "lead": result}
 
 
 # ============================================================================
 # PIXEL OPERATIONS
 # ============================================================================
 
+@handler_errors("CREATE PIXEL", require=(("name", "Missing 'name' in payload"),))
 async def handle_create_pixel(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Create a Meta Pixel for an ad account"""
-    log_section("CREATE PIXEL")
-
-    try:
-        name = payload.get("name")
-        if not name:
-            raise ValidationError("Missing 'name' in payload")
-
-        log_info(f"\n[INFO] Ad Account ID: {ad_account_id}")
-        log_info(f"[INFO] Pixel name: {name}")
-
-        pixel = await orchestrator.business_agent.create_pixel(ad_account_id, name)
+    name = payload.get("name")
+    log_info("\n[INFO] Ad Account ID: %s", ad_account_id)
+    log_info("[INFO] Pixel name: %s", name)
 
-        log_info(f"\n✓ Pixel created successfully")
-        log_info(f"✓ Pixel ID: {pixel.id}")
-        log_info(f"✓ Pixel Name: {pixel.name}")
+    pixel = await orchestrator.business_agent.create_pixel(ad_account_id, name)
 
-        return {
-            "status": "success",
-            "pixel_id": pixel.id,
-            "name": pixel.name,
-            "ad_account_id": ad_account_id
-        }
+    log_info("\n✓ Pixel created successfully")
+    log_info("✓ Pixel ID: %s", pixel.id)
+    log_info("✓ Pixel Name: %s", pixel.name)
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "pixel_id": pixel.id,
+        "name": pixel.name,
+        "ad_account_id": ad_account_id
+    }
 
 
+@handler_errors("GET PIXEL", require=(("pixel_id", "Missing 'pixel_id' in payload"),))
 async def handle_get_pixel(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
     """Get pixel details"""
-    log_section("GET PIXEL")
+    pixel_id = payload.get("pixel_id")
+    log_info("\n[INFO] Fetching pixel: %s", pixel_id)
 
-    try:
-        pixel_id = payload.get("pixel_id")
-        if not pixel_id:
-            raise ValidationError("Missing 'pixel_id' in payload")
+    pixel_data = await orchestrator.business_agent.get_pixel(pixel_id)
 
-        log_info(f"\n[INFO] Fetching pixel: {pixel_id}")
+    log_info("\n✓ Pixel retrieved:")
+    log_info("  ID: %s", pixel_data.get('id'))
+    log_info("  Name: %s", pixel_data.get('name'))
 
-        pixel_data = await orchestrator.business_agent.get_pixel(pixel_id)
+    return {"status": "success", "pixel": pixel_data}
 
-        log_info(f"\n✓ Pixel retrieved:")
-        log_info(f"  ID: {pixel_data.get('id')}")
-        log_info(f"  Name: {pixel_data.get('name')}")
 
-        return {"status": "success", "pixel": pixel_data}
+@handler_errors("LIST PIXELS")
+async def handle_list_pixels(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """List all pixels for an ad account"""
+    limit = payload.get("limit", 50)
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    log_info("\n[INFO] Ad Account ID: %s", ad_account_id)
 
+    pixels = await orchestrator.business_agent.list_pixels(ad_account_id, limit)
 
-async def handle_list_pixels(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
-    """List all pixels for an ad account"""
-    log_section("LIST PIXELS")
+    if not pixels:
+        log_info("\n[INFO] No pixels found for ad account %s", ad_account_id)
+        return {"status": "success", "pixels": [], "count": 0}
 
-    try:
-        limit = payload.get("limit", 50)
+    pixel_list = _project_rows(pixels, _PIXEL_ROW_FIELDS)
 
-        log_info(f"\n[INFO] Ad Account ID: {ad_account_id}")
+    log_info("\n✓ Found %s pixel(s)", len(pixels))
 
-        pixels = await orchestrator.business_agent.list_pixels(ad_account_id, limit)
+    return {"status": "success", "pixels": pixel_list, "count": len(pixels)}
 
-        if not pixels:
-            log_info(f"\n[INFO] No pixels found for ad account {ad_account_id}")
-            return {"status": "success", "pixels": [], "count": 0}
 
-        pixel_list = []
-        for pixel in pixels:
-            pixel_list.append({
-                "id": pixel.get("id"),
-                "name": pixel.get("name"),
-                "creation_time": pixel.get("creation_time"),
-                "last_fired_time": pixel.get("last_fired_time")
-            })
+@handler_errors("UPDATE PIXEL", require=(("pixel_id", "Missing 'pixel_id' in payload"),
+                                         ("name", "Missing 'name' in payload")))
+async def handle_update_pixel(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """Update/rename a Meta Pixel"""
+    pixel_id = payload.get("pixel_id")
+    name = payload.get("name")
 
-        log_info(f"\n✓ Found {len(pixels)} pixel(s)")
+    log_info("\n[INFO] Pixel ID: %s", pixel_id)
+    log_info("[INFO] New name: %s", name)
 
-        return {"status": "success", "pixels": pixel_list, "count": len(pixels)}
+    updated_pixel = await orchestrator.business_agent.update_pixel(pixel_id, name)
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    log_info("\n✓ Pixel updated successfully")
+    log_info("✓ Pixel ID: %s", updated_pixel.get('id'))
+    log_info("✓ New Name: %s", updated_pixel.get('name'))
 
+    return {
+        "status": "success",
+        "pixel_id": updated_pixel.get("id"),
+        "name": updated_pixel.get("name"),
+        "message": "Pixel renamed successfully"
+    }
 
-async def handle_update_pixel(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
-    """Update/rename a Meta Pixel"""
-    log_section("UPDATE PIXEL")
 
-    try:
-        pixel_id = payload.get("pixel_id")
-        name = payload.get("name")
+# Concurrent sub-actions per batch, kept under the API rate-limit budget
+_BATCH_CONCURRENCY = 20
 
-        if not pixel_id:
-            raise ValidationError("Missing 'pixel_id' in payload")
-        if not name:
-            raise ValidationError("Missing 'name' in payload")
 
-        log_info(f"\n[INFO] Pixel ID: {pixel_id}")
-        log_info(f"[INFO] New name: {name}")
+@handler_errors("BATCH ACTIONS", require=(("actions", "Missing 'actions' array in payload"),))
+async def handle_batch(orchestrator: OrchestratorAgent, ad_account_id: str, payload: dict) -> dict:
+    """Run multiple independent actions concurrently
 
-        updated_pixel = await orchestrator.business_agent.update_pixel(pixel_id, name)
+    payload["actions"] is a list of ordinary action payloads; each is
+    dispatched through process_action with bounded concurrency so N
+    network-bound operations overlap instead of paying N serial
+    round-trips. Results come back in input order.
+    """
+    payloads = payload.get("actions")
+    concurrency = payload.get("concurrency", _BATCH_CONCURRENCY)
+    semaphore = asyncio.Semaphore(max(1, min(concurrency, _BATCH_CONCURRENCY)))
 
-        log_info(f"\n✓ Pixel updated successfully")
-        log_info(f"✓ Pixel ID: {updated_pixel.get('id')}")
-        log_info(f"✓ New Name: {updated_pixel.get('name')}")
+    async def _run(sub_payload):
+        if sub_payload.get("action", "").lower() == "batch":
+            # Nested batches would deadlock on the shared semaphore
+            return {"status": "error", "message": "Nested 'batch' actions are not supported"}
+        async with semaphore:
+            return await process_action(orchestrator, ad_account_id, sub_payload)
 
-        return {
-            "status": "success",
-            "pixel_id": updated_pixel.get("id"),
-            "name": updated_pixel.get("name"),
-            "message": "Pixel renamed successfully"
-        }
+    results = await asyncio.gather(*(_run(p) for p in payloads), return_exceptions=True)
 
-    except Exception as e:
-        log_info(f"\n✗ Error: {e}")
-        return {"status": "error", "message": str(e)}
+    normalized = []
+    succeeded = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            normalized.append({"status": "error", "message": str(result)})
+        else:
+            if result.get("status") == "success":
+                succeeded += 1
+            normalized.append(result)
+
+    log_info("\n✓ Batch finished: %s/%s actions succeeded", succeeded, len(normalized))
+    return {"status": "success", "count": len(normalized), "succeeded": succeeded, "results": normalized}
+
+
+# Action name -> handler coroutine. One hash lookup replaces the old
+# ~38-branch if/elif chain, and the unknown-action message derives from
+# the same table so the two can never drift apart.
+_ACTION_HANDLERS = {
+    "batch": handle_batch,
+    "list_ad_accounts": handle_list_ad_accounts,
+    # Campaign operations
+    "create_campaign": handle_create_campaign,
+    "create_campaigns_batch": handle_create_campaigns_batch,
+    "update_campaign": handle_update_campaign,
+    "get_campaign": handle_get_campaign,
+    "list_campaigns": handle_list_campaigns,
+    # Ad set operations
+    "create_adset": handle_create_adset,
+    "create_adsets_bulk": handle_create_adsets_bulk,
+    "update_adset": handle_update_adset,
+    "get_adset": handle_get_adset,
+    "list_adsets": handle_list_adsets,
+    # Asset operations
+    "upload_image": handle_upload_image,
+    "upload_video": handle_upload_video,
+    "get_image": handle_get_image,
+    "get_video": handle_get_video,
+    "clear_asset_cache": handle_clear_asset_cache,
+    # Creative and ad operations
+    "create_creative": handle_create_creative,
+    "get_creative": handle_get_creative,
+    "create_ad": handle_create_ad,
+    "update_ad": handle_update_ad,
+    "get_ad": handle_get_ad,
+    "list_ads": handle_list_ads,
+    # Insights operations
+    "get_account_insights": handle_get_account_insights,
+    "get_campaign_insights": handle_get_campaign_insights,
+    "get_adset_insights": handle_get_adset_insights,
+    "get_ad_insights": handle_get_ad_insights,
+    "get_performance_report": handle_get_performance_report,
+    "export_insights": handle_export_insights,
+    # Lead form operations
+    "create_lead_form": handle_create_lead_form,
+    "get_lead_form": handle_get_lead_form,
+    "list_lead_forms": handle_list_lead_forms,
+    "get_leads": handle_get_leads,
+    "get_lead": handle_get_lead,
+    # Pixel operations
+    "create_pixel": handle_create_pixel,
+    "get_pixel": handle_get_pixel,
+    "list_pixels": handle_list_pixels,
+    "update_pixel": handle_update_pixel,
+}
+
+# Interned keys make the dispatch lookup a pointer compare for interned
+# probes; incoming action names are interned at the dispatcher ingress
+_ACTION_HANDLERS = {sys.intern(action): handler
+                    for action, handler in _ACTION_HANDLERS.items()}
+
+# Joined once at import; the error path allocates nothing per request
+_SUPPORTED_ACTIONS_STR = ", ".join(_ACTION_HANDLERS)
+
+# Read-only actions whose whole responses can be reused for a short
+# window - polling and retry traffic repeats these with identical
+# payloads. Campaign/adset/ad/creative gets stay out: they are already
+# served by the entity cache above.
+_READONLY_ACTIONS = frozenset({
+    "get_pixel", "list_pixels",
+    "get_lead", "get_leads", "get_lead_form", "list_lead_forms",
+    "get_image", "get_video",
+})
+_RESPONSE_CACHE_TTL = 30  # seconds
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+_response_cache: dict = {}
+# In-flight read-only calls, so concurrent identical requests share one
+# handler invocation instead of racing to the API
+_response_inflight: dict = {}
+
+
+def _freeze_payload(value):
+    """Recursively convert a payload into a hashable cache key part"""
+    if type(value) is dict:
+        return tuple(sorted((k, _freeze_payload(v)) for k, v in value.items()))
+    if type(value) is list:
+        return tuple(_freeze_payload(v) for v in value)
+    return value
 
 
 async def process_action(orchestrator: OrchestratorAgent, ad_account_id: str, action_payload: dict) -> dict:
     """Main action dispatcher - routes to appropriate handler"""
-    action = action_payload.get("action", "").lower()
-    
-    if action == "list_ad_accounts":
-        return await handle_list_ad_accounts(orchestrator, ad_account_id, action_payload)
-    elif action == "create_campaign":
-        return await handle_create_campaign(orchestrator, ad_account_id, action_payload)
-    elif action == "update_campaign":
-        return await handle_update_campaign(orchestrator, ad_account_id, action_payload)
-    elif action == "get_campaign":
-        return await handle_get_campaign(orchestrator, ad_account_id, action_payload)
-    elif action == "list_campaigns":
-        return await handle_list_campaigns(orchestrator, ad_account_id, action_payload)
-    elif action == "create_adset":
-        return await handle_create_adset(orchestrator, ad_account_id, action_payload)
-    elif action == "update_adset":
-        return await handle_update_adset(orchestrator, ad_account_id, action_payload)
-    elif action == "get_adset":
-        return await handle_get_adset(orchestrator, ad_account_id, action_payload)
-    elif action == "list_adsets":
-        return await handle_list_adsets(orchestrator, ad_account_id, action_payload)
-    elif action == "upload_image":
-        return await handle_upload_image(orchestrator, ad_account_id, action_payload)
-    elif action == "upload_video":
-        return await handle_upload_video(orchestrator, ad_account_id, action_payload)
-    elif action == "get_image":
-        return await handle_get_image(orchestrator, ad_account_id, action_payload)
-    elif action == "get_video":
-        return await handle_get_video(orchestrator, ad_account_id, action_payload)
-    elif action == "clear_asset_cache":
-        return await handle_clear_asset_cache(orchestrator, ad_account_id, action_payload)
-    elif action == "create_creative":
-        return await handle_create_creative(orchestrator, ad_account_id, action_payload)
-    elif action == "get_creative":
-        return await handle_get_creative(orchestrator, ad_account_id, action_payload)
-    elif action == "create_ad":
-        return await handle_create_ad(orchestrator, ad_account_id, action_payload)
-    elif action == "update_ad":
-        return await handle_update_ad(orchestrator, ad_account_id, action_payload)
-    elif action == "get_ad":
-        return await handle_get_ad(orchestrator, ad_account_id, action_payload)
-    elif action == "list_ads":
-        return await handle_list_ads(orchestrator, ad_account_id, action_payload)
-    elif action == "get_account_insights":
-        return await handle_get_account_insights(orchestrator, ad_account_id, action_payload)
-    elif action == "get_campaign_insights":
-        return await handle_get_campaign_insights(orchestrator, ad_account_id, action_payload)
-    elif action == "get_adset_insights":
-        return await handle_get_adset_insights(orchestrator, ad_account_id, action_payload)
-    elif action == "get_ad_insights":
-        return await handle_get_ad_insights(orchestrator, ad_account_id, action_payload)
-    elif action == "get_performance_report":
-        return await handle_get_performance_report(orchestrator, ad_account_id, action_payload)
-    elif action == "export_insights":
-        return await handle_export_insights(orchestrator, ad_account_id, action_payload)
-    # Lead Form Operations
-    elif action == "create_lead_form":
-        return await handle_create_lead_form(orchestrator, ad_account_id, action_payload)
-    elif action == "get_lead_form":
-        return await handle_get_lead_form(orchestrator, ad_account_id, action_payload)
-    elif action == "list_lead_forms":
-        return await handle_list_lead_forms(orchestrator, ad_account_id, action_payload)
-    elif action == "get_leads":
-        return await handle_get_leads(orchestrator, ad_account_id, action_payload)
-    elif action == "get_lead":
-        return await handle_get_lead(orchestrator, ad_account_id, action_payload)
-    # Pixel Operations
-    elif action == "create_pixel":
-        return await handle_create_pixel(orchestrator, ad_account_id, action_payload)
-    elif action == "get_pixel":
-        return await handle_get_pixel(orchestrator, ad_account_id, action_payload)
-    elif action == "list_pixels":
-        return await handle_list_pixels(orchestrator, ad_account_id, action_payload)
-    elif action == "update_pixel":
-        return await handle_update_pixel(orchestrator, ad_account_id, action_payload)
-    else:
-        supported_actions = [
-            "list_ad_accounts",
-            "create_campaign", "update_campaign", "get_campaign", "list_campaigns",
-            "create_adset", "update_adset", "get_adset", "list_adsets",
-            "upload_image", "upload_video", "get_image", "get_video", "clear_asset_cache",
-            "create_creative", "get_creative", "create_ad", "update_ad", "get_ad", "list_ads",
-            "get_account_insights", "get_campaign_insights", "get_adset_insights",
-            "get_ad_insights", "get_performance_report", "export_insights",
-            "create_lead_form", "get_lead_form", "list_lead_forms", "get_leads", "get_lead",
-            "create_pixel", "get_pixel", "list_pixels", "update_pixel"
-        ]
-        error_msg = f"Unknown action: {action}. Supported: {', '.join(supported_actions)}"
-        log_info(f"\n✗ {error_msg}")
-        return {"status": "error", "message": error_msg}
+    # Well-behaved callers already send lowercase names; probe the table
+    # with the raw string first and only pay the .lower() allocation when
+    # that misses. Interning folds each distinct action name to one
+    # shared string, so the table lookup and the _READONLY_ACTIONS probe
+    # below hit the identity fast path instead of comparing characters.
+    action = action_payload.get("action", "")
+    handler = _ACTION_HANDLERS.get(action)
+    if handler is None:
+        action = sys.intern(action.lower())
+        handler = _ACTION_HANDLERS.get(action)
+        if handler is None:
+            error_msg = f"Unknown action: {action}. Supported: {_SUPPORTED_ACTIONS_STR}"
+            log_info("\n✗ %s", error_msg)
+            return {"status": "error", "message": error_msg}
+
+    if action in _READONLY_ACTIONS:
+        key = (action, ad_account_id, _freeze_payload(action_payload))
+        entry = _response_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = _response_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(handler(orchestrator, ad_account_id, action_payload))
+            _response_inflight[key] = task
+            task.add_done_callback(lambda _t, _k=key: _response_inflight.pop(_k, None))
+        result = await task
+
+        # Error responses are not worth repeating back to callers
+        if type(result) is dict and result.get("status") == "success":
+            if len(_response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+                _response_cache.clear()
+            _response_cache[key] = (time.monotonic() + _RESPONSE_CACHE_TTL, result)
+        return result
+
+    result = await handler(orchestrator, ad_account_id, action_payload)
+
+    # Any mutating action may change what the account's read-only
+    # responses would show; drop that account's cached entries
+    if _response_cache:
+        for key in [k for k in _response_cache if k[1] == ad_account_id]:
+            del _response_cache[key]
+    return result